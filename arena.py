@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# arena.py - Partidas IA contra IA sem janela, em todos os núcleos
+#
+# Exemplo:
+#   python arena.py FACIL DIFICIL -n 2000 --seed 42 --output resultados.jsonl
+
+import argparse
+import os
+import sys
+import time
+
+# Sem janela: o pygame é importado por alguns módulos de IA
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+from config import AI_DIFFICULTIES
+from src.arena import run_arena, summarize, format_summary
+
+def main():
+    parser = argparse.ArgumentParser(description="Arena de IAs do Caçador dos Mares")
+    parser.add_argument('configs', nargs='+', choices=sorted(AI_DIFFICULTIES),
+                        help="Dificuldade de cada assento (2 a 4)")
+    parser.add_argument('-n', '--matches', type=int, default=1000, help="Número de partidas")
+    parser.add_argument('--seed', type=int, default=0, help="Semente base (uma por partida)")
+    parser.add_argument('--iterations', type=int, default=32,
+                        help="Iterações da busca de cartas (0 = orçamento de tempo da dificuldade)")
+    parser.add_argument('--max-turns', type=int, default=200, help="Limite de turnos")
+    parser.add_argument('-j', '--processes', type=int, default=None,
+                        help="Processos (padrão: todos os núcleos)")
+    parser.add_argument('-o', '--output', default=None, help="Arquivo JSONL de resultados")
+    args = parser.parse_args()
+    
+    if not 2 <= len(args.configs) <= 4:
+        parser.error("use de 2 a 4 assentos")
+    
+    output = open(args.output, 'w') if args.output else None
+    done = [0]
+    
+    def progress(record):
+        done[0] += 1
+        if done[0] % 100 == 0 or done[0] == args.matches:
+            print(f"\r{done[0]}/{args.matches} partidas", end='', file=sys.stderr, flush=True)
+    
+    start = time.time()
+    try:
+        records = run_arena(args.configs, args.matches, args.seed, args.max_turns,
+                            args.iterations or None, args.processes, output, progress)
+    finally:
+        if output:
+            output.close()
+    elapsed = time.time() - start
+    
+    print(file=sys.stderr)
+    print(format_summary(summarize(records)))
+    print(f"\n{len(records)} partidas em {elapsed:.1f}s "
+          f"({len(records) / elapsed * 60:.0f} partidas/minuto)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# balance.py - Varredura de regras e baralho por simulação
+#
+# Exemplos:
+#   python balance.py --set board_size=15,20,25 --set movement_limit=5,7,9 -n 1000
+#   python balance.py --set deck_copies=4/6/4/2,2/6/6/2 --players 4
+#   python balance.py --set current_multiplier=1,2
+#
+# Resultados ficam em .balance_cache (um arquivo por ponto); rodar de
+# novo com os mesmos parâmetros não joga nenhuma partida.
+
+import argparse
+import os
+import sys
+import time
+
+# Sem janela: o pygame é importado por alguns módulos de IA
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+from config import AI_DIFFICULTIES, MIN_PLAYERS, MAX_PLAYERS
+from src.balance import RULE_PARAMETERS, sweep_points, run_balance, format_report
+
+def parse_value(name, text):
+    """Valor de uma regra na linha de comando (deck_copies usa 4/6/4/2)"""
+    if name == 'deck_copies':
+        return tuple(int(part) for part in text.split('/'))
+    return int(text)
+
+def parse_sweep(items):
+    """Lista de "REGRA=v1,v2" -> {regra: [valores]}"""
+    sweep = {}
+    for item in items:
+        name, _, values = item.partition('=')
+        name = name.strip().lower()
+        if name not in RULE_PARAMETERS or not values:
+            raise ValueError(f"Regra inválida: {item} (use {', '.join(RULE_PARAMETERS)})")
+        sweep[name] = [parse_value(name, value) for value in values.split(',')]
+    return sweep
+
+def main():
+    parser = argparse.ArgumentParser(description="Análise de balanceamento do Caçador dos Mares")
+    parser.add_argument('--set', action='append', default=[], metavar='REGRA=V1,V2',
+                        help="Valores de uma regra na varredura (pode repetir)")
+    parser.add_argument('-n', '--games', type=int, default=500, help="Partidas por ponto")
+    parser.add_argument('--players', type=int, default=2, choices=range(MIN_PLAYERS, MAX_PLAYERS + 1))
+    parser.add_argument('--difficulty', default='MEDIO', choices=sorted(AI_DIFFICULTIES),
+                        help="Dificuldade de todos os assentos")
+    parser.add_argument('--seed', type=int, default=0, help="Semente base")
+    parser.add_argument('--iterations', type=int, default=8,
+                        help="Iterações da busca de cartas")
+    parser.add_argument('--max-turns', type=int, default=200, help="Limite de turnos")
+    parser.add_argument('-j', '--processes', type=int, default=None,
+                        help="Processos (padrão: todos os núcleos)")
+    parser.add_argument('--cache', default='.balance_cache',
+                        help="Diretório do cache (vazio desliga)")
+    args = parser.parse_args()
+    
+    try:
+        sweep = parse_sweep(args.set)
+    except ValueError as e:
+        parser.error(str(e))
+    points = sweep_points(sweep)
+    
+    total = [0]
+    
+    def progress(index, record):
+        total[0] += 1
+        if total[0] % 100 == 0:
+            print(f"\r{total[0]} partidas", end='', file=sys.stderr, flush=True)
+    
+    start = time.time()
+    results = run_balance(points, args.games, args.players, args.difficulty, args.max_turns,
+                          args.iterations, args.seed, args.processes, args.cache or None,
+                          progress)
+    elapsed = time.time() - start
+    
+    print(file=sys.stderr)
+    print(format_report(results, list(sweep)))
+    print(f"\n{len(points)} pontos, {total[0]} partidas jogadas em {elapsed:.1f}s")
+
+if __name__ == "__main__":
+    main()
@@ -53,6 +53,9 @@ MOVEMENT_LIMIT = 7
 COLLECTION_DISTANCE = 2
 WINNING_FISH_COUNT = 3
 
+# Cópias de cada carta no baralho por magnitude do vetor (0, 1, 2, 3 ou mais)
+DECK_COPIES = (4, 6, 4, 2)
+
 # Configurações de rede
 DEFAULT_PORT = 5555
 TIMEOUT = 30
@@ -68,28 +71,56 @@ FONTS_PATH = os.path.join(ASSETS_PATH, 'fonts')
 DATA_PATH = os.path.join(BASE_PATH, 'data')
 SAVES_PATH = os.path.join(DATA_PATH, 'saves')
 
+# Atlas de sprites (TextureAtlas XML em IMAGES_PATH): (normal, alta resolução).
+# Folhas "@2"/"-double" têm escala 2 e são reduzidas uma vez em telas normais.
+SPRITE_ATLASES = {
+    'ships': ('shipsMiscellaneous_sheet.xml', 'shipsMiscellaneous_sheet@2.xml'),
+    'fish': ('spritesheet-double.xml', 'spritesheet-double.xml')
+}
+HIGH_DPI_MIN_WIDTH = 2560  # Largura do monitor a partir da qual usa as folhas @2
+
 # Configurações de IA
 AI_DIFFICULTIES = {
     'FACIL': {
         'name': 'Fácil',
         'think_time': 0.5,
         'random_factor': 0.7,
-        'strategy_weight': 0.3
+        'strategy_weight': 0.3,
+        'search_time': 0.05,
+        'plan_horizon': 0
     },
     'MEDIO': {
         'name': 'Médio',
         'think_time': 1.0,
         'random_factor': 0.4,
-        'strategy_weight': 0.6
+        'strategy_weight': 0.6,
+        'search_time': 0.15,
+        'plan_horizon': 2
     },
     'DIFICIL': {
         'name': 'Difícil',
         'think_time': 1.5,
         'random_factor': 0.1,
-        'strategy_weight': 0.9
+        'strategy_weight': 0.9,
+        'search_time': 0.4,
+        'plan_horizon': 4
     }
 }
 
+# Pesos das heurísticas da IA (uma dificuldade pode sobrescrever em 'weights')
+AI_WEIGHTS = {
+    'fish_catch': 100,       # Movimento: peixe no alcance de coleta
+    'fish_near': 50,         # Movimento: peixe a até 3 casas (cai 1/5 por casa)
+    'fish_far': 20,          # Movimento: peixe a até 5 casas (cai 1/10 por casa)
+    'approach': 10,          # Carta: por casa que aproxima o peixe mais próximo
+    'collect_bonus': 50,     # Carta: peixe termina no alcance de coleta
+    'off_board': 30,         # Carta: empurra o peixe para fora do tabuleiro
+    'opponent_penalty': 20,  # Carta: aproxima peixe de um oponente próximo
+    'center': 0.5,           # Movimento: por casa de distância do centro
+    'boat_avoid': 10,        # Movimento: por casa de proximidade de outro barco
+    'low_moves': 10          # Movimento: bônus de segurança com poucos movimentos
+}
+
 # Cartas de movimento (vetores)
 MOVEMENT_CARDS = [
     (0, 0),    # Sem movimento
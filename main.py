@@ -3,6 +3,7 @@
 import pygame
 import sys
 import os
+import multiprocessing
 
 # Adiciona o diretório src ao path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
@@ -219,16 +220,26 @@ def main():
             
             # Debug info (F12)
             if pygame.key.get_pressed()[pygame.K_F12]:
-                from src.utils import draw_text
+                from src.utils import draw_text, text_cache
+                from src.sprite_cache import sprite_cache
                 from src.layout_manager import layout_manager
                 
-                debug_info = layout_manager.get_debug_info()
+                # Layout da partida em andamento, não o global
+                layout = main_menu.get_layout() if main_menu else layout_manager
+                debug_info = layout.get_debug_info()
+                text_stats = text_cache.get_stats()
+                sprite_stats = sprite_cache.get_stats()
                 debug_texts = [
                     f"FPS: {int(clock.get_fps())}",
                     f"Tela: {debug_info['screen_size']}",
                     f"Margens: {debug_info['margins']}",
                     f"Escala: {debug_info['scale_factor']:.2f}",
-                    f"Cache: {debug_info['cache_size']}"
+                    f"Cache: {debug_info['cache_size']}",
+                    f"Textos: {text_stats['hits']} acertos / {text_stats['misses']} falhas "
+                    f"({text_stats['hit_rate']:.0%}, {text_stats['surfaces']} em cache, "
+                    f"{text_stats['fonts']} fontes)",
+                    f"Sprites: {sprite_stats['hits']} acertos / {sprite_stats['misses']} falhas "
+                    f"({sprite_stats['variants']} variantes, {sprite_stats['bytes'] // 1024} KB)"
                 ]
                 
                 for i, text in enumerate(debug_texts):
@@ -248,6 +259,10 @@ def main():
         except Exception as e:
             print(f"Erro ao atualizar display: {e}")
     
+    # Cancela a IA de uma partida em andamento
+    if main_menu:
+        main_menu.close_game()
+    
     # Salva configurações e encerra
     try:
         settings_manager.save_settings()
@@ -259,4 +274,6 @@ def main():
     sys.exit()
 
 if __name__ == "__main__":
+    # Executável empacotado: os processos auxiliares da IA não rodam main()
+    multiprocessing.freeze_support()
     main()
@@ -2,28 +2,59 @@
 
 import random
 import math
+from concurrent.futures import FIRST_COMPLETED, wait
+import numpy as np
 from config import *
 from src.utils import manhattan_distance, euclidean_distance
+from src.zobrist import derive_key
+from src.search_ai import CardSearch
+from src.card_eval import score_card_vectors
+from src.route_planner import RoutePlanner
+from src.heatmap import proximity_score
+from src.rules import DEFAULT_RULES
+
+def resolve_difficulty(difficulty):
+    """Nome de AI_DIFFICULTIES ou um dicionário de configuração
+    
+    Um dicionário pode trazer 'base' (nome da dificuldade de partida) e
+    sobrescrever qualquer chave, inclusive 'weights'.
+    """
+    if isinstance(difficulty, dict):
+        base = AI_DIFFICULTIES[difficulty.get('base', 'MEDIO')]
+        return {**base, **difficulty}
+    return AI_DIFFICULTIES[difficulty]
+
 
 class AIPlayer:
     """Classe que controla o comportamento da IA"""
     
-    def __init__(self, player, difficulty='MEDIO'):
+    def __init__(self, player, difficulty='MEDIO', transposition_table=None, rng=None):
         self.player = player
-        self.difficulty = AI_DIFFICULTIES[difficulty]
+        self.difficulty = resolve_difficulty(difficulty)
+        self.weights = {**AI_WEIGHTS, **self.difficulty.get('weights', {})}
         self.think_timer = 0
         self.decision_made = False
         
+        # Avaliações reaproveitadas entre ramos e turnos (opcional)
+        self.transposition_table = transposition_table
+        
+        # Gerador próprio do assento (padrão: o módulo random)
+        self.rng = rng if rng is not None else random
+    
     def update(self, dt, game_state):
         """Atualiza a IA"""
         if not self.decision_made:
             self.think_timer += dt
             
-            if self.think_timer >= self.difficulty['think_time']:
+            if self.think_timer >= self.decision_delay():
                 self.make_decision(game_state)
                 self.decision_made = True
                 self.think_timer = 0
     
+    def decision_delay(self):
+        """Espera antes de decidir (ritmo da interface)"""
+        return self.difficulty['think_time']
+    
     def reset_decision(self):
         """Reseta o estado de decisão"""
         self.decision_made = False
@@ -33,6 +64,21 @@ class AIPlayer:
         """Toma uma decisão baseada no estado do jogo"""
         pass  # Será implementado nas subclasses
     
+    def cached_score(self, game_state, kind, item, evaluate):
+        """Consulta a tabela de transposição antes de chamar evaluate()"""
+        position_hash = game_state.get('position_hash')
+        if self.transposition_table is None or position_hash is None:
+            return evaluate()
+        
+        key = derive_key(position_hash, kind, self.player.id,
+                         self.player.boat.moves_remaining,
+                         game_state.get('prediction_key'), item)
+        score = self.transposition_table.probe(key)
+        if score is None:
+            score = evaluate()
+            self.transposition_table.store(key, score)
+        return score
+    
     def evaluate_board_state(self, game_state):
         """Avalia o estado atual do tabuleiro"""
         boat_pos = self.player.boat.get_position()
@@ -65,94 +111,87 @@ class AIPlayer:
 class CardPlayAI(AIPlayer):
     """IA para escolher qual carta jogar"""
     
+    def __init__(self, player, difficulty='MEDIO', transposition_table=None,
+                 search_iterations=None, rng=None):
+        super().__init__(player, difficulty, transposition_table, rng)
+        
+        # Limite opcional de iterações da busca (partidas reproduzíveis)
+        self.search_iterations = search_iterations
+        self.last_search = None
+    
+    def decision_delay(self):
+        """O tempo de busca sai do tempo de espera"""
+        return max(0, self.difficulty['think_time'] - self.difficulty.get('search_time', 0))
+    
     def make_decision(self, game_state):
         """Escolhe uma carta para jogar"""
-        evaluation = self.evaluate_board_state(game_state)
-        
         # Fator de aleatoriedade baseado na dificuldade
-        if random.random() < self.difficulty['random_factor']:
+        if self.rng.random() < self.difficulty['random_factor']:
             # Escolha aleatória
-            card = random.choice(self.player.hand.cards)
-        else:
-            # Escolha estratégica
-            card = self.choose_best_card(evaluation, game_state)
+            return self.rng.choice(self.player.hand.cards)
+        
+        # Busca com orçamento de tempo, quando há acesso às regras
+        state = game_state.get('engine_state')
+        if state is not None and self.difficulty.get('search_time', 0) > 0:
+            search = CardSearch(state, self.player.id, self.difficulty['search_time'],
+                                self.search_iterations, self.rng,
+                                should_stop=game_state.get('should_stop'),
+                                table=self.transposition_table)
+            card = search.run()
+            self.last_search = search
+            if card is not None:
+                return card
         
-        return card
+        # Escolha estratégica gulosa
+        evaluation = self.evaluate_board_state(game_state)
+        return self.choose_best_card(evaluation, game_state)
     
     def choose_best_card(self, evaluation, game_state):
         """Escolhe a melhor carta baseada na estratégia"""
-        boat_pos = evaluation['boat_pos']
-        
         # Se não há peixes, joga qualquer carta
         if not evaluation['fish_distances']:
-            return random.choice(self.player.hand.cards)
-        
-        # Analisa as cartas disponíveis
-        card_scores = []
-        
-        for card in self.player.hand.cards:
-            vector = card.get_vector()
-            score = self.evaluate_card(vector, evaluation, game_state)
-            card_scores.append((score, card))
+            return self.rng.choice(self.player.hand.cards)
         
-        # Ordena por pontuação
-        card_scores.sort(key=lambda x: x[0], reverse=True)
+        # Analisa todas as cartas da mão de uma vez
+        cards = self.player.hand.cards
+        vectors = tuple(card.get_vector() for card in cards)
+        scores = self.cached_score(
+            game_state, 0, vectors,
+            lambda: self.score_vectors(vectors, evaluation, game_state)
+        )
         
-        # Retorna a melhor carta
-        return card_scores[0][1]
+        # Melhor pontuação (empate: a primeira carta da mão)
+        return cards[int(scores.argmax())]
+    
+    def score_vectors(self, vectors, evaluation, game_state):
+        """Pontua vários vetores contra todos os peixes e barcos"""
+        rules = game_state.get('rules', DEFAULT_RULES)
+        return score_card_vectors(
+            np.asarray(vectors, dtype=np.int32).reshape(-1, 2) * rules.current_multiplier,
+            evaluation['boat_pos'],
+            game_state['fish_positions'],
+            [boat.get_position() for _, boat in evaluation['boat_distances']],
+            rules.board_size,
+            self.weights,
+            rules.collection_distance
+        )
     
     def evaluate_card(self, vector, evaluation, game_state):
         """Avalia uma carta específica"""
-        score = 0
-        
-        # Considera o peixe mais próximo
-        if evaluation['closest_fish']:
-            closest_dist, closest_pos = evaluation['closest_fish']
-            
-            # Verifica se o vetor ajuda a mover peixes na direção do barco
-            fish_new_pos = (
-                closest_pos[0] + vector[0],
-                closest_pos[1] + vector[1]
-            )
-            
-            # Calcula nova distância
-            new_dist = manhattan_distance(evaluation['boat_pos'], fish_new_pos)
-            
-            # Pontuação baseada na redução de distância
-            if new_dist < closest_dist:
-                score += (closest_dist - new_dist) * 10
-            
-            # Bonus se coloca o peixe dentro da distância de coleta
-            if new_dist <= COLLECTION_DISTANCE:
-                score += 50
-            
-            # Penalidade se joga o peixe para fora do tabuleiro
-            if not (0 <= fish_new_pos[0] < BOARD_SIZE and 0 <= fish_new_pos[1] < BOARD_SIZE):
-                score -= 30
-        
-        # Considera outros barcos (evita ajudá-los)
-        for dist, other_boat in evaluation['boat_distances']:
-            if dist < 5:  # Barco próximo
-                other_pos = other_boat.get_position()
-                
-                # Verifica peixes próximos ao outro barco
-                for fish_dist, fish_pos in evaluation['fish_distances']:
-                    if manhattan_distance(other_pos, fish_pos) < 3:
-                        # Penaliza se move peixe para perto do oponente
-                        fish_new_pos = (
-                            fish_pos[0] + vector[0],
-                            fish_pos[1] + vector[1]
-                        )
-                        new_dist_to_opponent = manhattan_distance(other_pos, fish_new_pos)
-                        if new_dist_to_opponent < manhattan_distance(other_pos, fish_pos):
-                            score -= 20
-        
-        return score
+        return float(self.score_vectors([vector], evaluation, game_state)[0])
 
 
 class MovementAI(AIPlayer):
     """IA para decidir movimento do barco"""
     
+    def __init__(self, player, difficulty='MEDIO', transposition_table=None, rng=None):
+        super().__init__(player, difficulty, transposition_table, rng)
+        
+        # Rota de vários turnos (dificuldades com plan_horizon > 1)
+        horizon = self.difficulty.get('plan_horizon', 0)
+        self.route_planner = RoutePlanner(horizon, weights=self.weights) if horizon > 1 else None
+        self.route_plan = None
+    
     def make_decision(self, game_state):
         """Decide para onde mover o barco"""
         evaluation = self.evaluate_board_state(game_state)
@@ -162,19 +201,39 @@ class MovementAI(AIPlayer):
             return None
         
         # Fator de aleatoriedade
-        if random.random() < self.difficulty['random_factor']:
+        if self.rng.random() < self.difficulty['random_factor']:
             # Movimento aleatório
-            return random.choice(valid_moves)
-        else:
-            # Movimento estratégico
-            return self.choose_best_move(evaluation, valid_moves, game_state)
+            return self.rng.choice(valid_moves)
+        
+        state = game_state.get('engine_state')
+        heatmap = game_state.get('fish_heatmap')
+        if self.route_planner and state is not None and heatmap is not None:
+            return self.follow_route(state, heatmap)
+        
+        # Movimento estratégico
+        return self.choose_best_move(evaluation, valid_moves, game_state)
+    
+    def follow_route(self, state, heatmap):
+        """Segue a rota planejada, refazendo o plano só quando ele deixa de valer"""
+        valid = False
+        if self.route_plan is not None:
+            valid, target = self.route_plan.next_move(state, self.player.id, heatmap)
+        if not valid:
+            self.route_plan = self.route_planner.plan(state, self.player.id, heatmap)
+            target = self.route_plan.cells[0]
+        
+        # Destino igual à posição atual: fica parado
+        return None if target == self.player.boat.get_position() else target
     
     def choose_best_move(self, evaluation, valid_moves, game_state):
         """Escolhe o melhor movimento"""
         move_scores = []
         
         for move in valid_moves:
-            score = self.evaluate_move(move, evaluation, game_state)
+            score = self.cached_score(
+                game_state, 1, move,
+                lambda: self.evaluate_move(move, evaluation, game_state)
+            )
             move_scores.append((score, move))
         
         # Ordena por pontuação
@@ -184,7 +243,7 @@ class MovementAI(AIPlayer):
         top_moves = [m for s, m in move_scores[:3] if s > 0]
         
         if top_moves:
-            return random.choice(top_moves)
+            return self.rng.choice(top_moves)
         
         return move_scores[0][1] if move_scores else None
     
@@ -192,26 +251,27 @@ class MovementAI(AIPlayer):
         """Avalia um movimento específico"""
         score = 0
         
-        # Posição após o movimento dos peixes
-        predicted_fish = game_state.get('predicted_fish_positions', [])
-        
-        # Avalia proximidade com peixes
-        for fish_pos in predicted_fish:
-            dist = manhattan_distance(move, fish_pos)
+        rules = game_state.get('rules', DEFAULT_RULES)
+        heatmap = game_state.get('fish_heatmap')
+        if heatmap is not None:
+            # Proximidade esperada sobre todos os vetores de deriva possíveis
+            score += heatmap.score(*move, self.weights)
+        else:
+            # Posição após o movimento dos peixes
+            predicted_fish = game_state.get('predicted_fish_positions', [])
             
-            # Pontuação alta para peixes muito próximos
-            if dist <= COLLECTION_DISTANCE:
-                score += 100
-            elif dist <= 3:
-                score += 50 - dist * 10
-            elif dist <= 5:
-                score += 20 - dist * 2
+            # Avalia proximidade com peixes
+            for fish_pos in predicted_fish:
+                dist = manhattan_distance(move, fish_pos)
+                
+                # Pontuação alta para peixes muito próximos
+                score += proximity_score(dist, self.weights, rules.collection_distance)
         
         # Evita cantos e bordas (menos mobilidade)
         x, y = move
-        center_x, center_y = BOARD_SIZE // 2, BOARD_SIZE // 2
+        center_x = center_y = rules.board_size // 2
         distance_from_center = abs(x - center_x) + abs(y - center_y)
-        score -= distance_from_center * 0.5
+        score -= distance_from_center * self.weights['center']
         
         # Evita outros barcos
         for dist, other_boat in evaluation['boat_distances']:
@@ -219,13 +279,13 @@ class MovementAI(AIPlayer):
             dist_to_other = manhattan_distance(move, other_pos)
             
             if dist_to_other < 3:
-                score -= (3 - dist_to_other) * 10
+                score -= (3 - dist_to_other) * self.weights['boat_avoid']
         
         # Considera movimentos restantes
         moves_after = self.player.boat.moves_remaining - 1
         if moves_after < 2 and score < 50:
             # Se tem poucos movimentos, prefere posições mais seguras
-            score += 10
+            score += self.weights['low_moves']
         
         return score
 
@@ -233,11 +293,34 @@ class MovementAI(AIPlayer):
 class AIController:
     """Controlador principal da IA"""
     
-    def __init__(self, player, difficulty='MEDIO'):
+    def __init__(self, player, difficulty='MEDIO', transposition_table=None,
+                 search_iterations=None, rng=None):
         self.player = player
-        self.card_ai = CardPlayAI(player, difficulty)
-        self.movement_ai = MovementAI(player, difficulty)
+        self.difficulty = difficulty
+        self.transposition_table = transposition_table
+        self.card_ai = CardPlayAI(player, difficulty, transposition_table, search_iterations, rng)
+        self.movement_ai = MovementAI(player, difficulty, transposition_table, rng)
+    
+    def clone(self, player, rng):
+        """Controlador igual a este para outro objeto do jogador (ex.: cópia do estado)
+        
+        A cópia tem o próprio gerador, então quem decide em outra thread não
+        altera este controlador nem consome números do seu fluxo.
+        """
+        return AIController(player, self.difficulty, self.transposition_table,
+                            self.card_ai.search_iterations, rng)
+    
+    def attach(self, player):
+        """Aponta o controlador para outro objeto do mesmo jogador
         
+        Só para controladores de um único dono (ex.: o da thread da IA, que
+        recebe uma cópia nova do estado a cada pedido); a rota planejada e
+        o resto do estado das IAs continuam valendo.
+        """
+        self.player = player
+        self.card_ai.player = player
+        self.movement_ai.player = player
+    
     def choose_card(self, game_state):
         """Escolhe uma carta para jogar"""
         return self.card_ai.make_decision(game_state)
@@ -246,6 +329,51 @@ class AIController:
         """Escolhe um movimento para o barco"""
         return self.movement_ai.make_decision(game_state)
     
+    # Intervalo entre verificações de should_stop enquanto o executor trabalha
+    BATCH_POLL_INTERVAL = 0.05
+    
+    @staticmethod
+    def choose_cards_batch(controllers, state, executor=None, seed=0, should_stop=None):
+        """Escolhe as cartas de vários assentos de IA de uma vez
+        
+        controllers: {id do jogador: AIController}. Cada assento decide numa
+        cópia do estado com o próprio gerador (semente derivada de seed, do
+        turno e do assento), então o resultado não depende da ordem nem do
+        executor. Com executor (ex.: o pool de processos do AIWorker) os
+        assentos rodam em paralelo; sem ele, um depois do outro.
+        
+        should_stop interrompe a busca: sem executor, cada CardSearch para
+        na próxima iteração; com executor, as tarefas que ainda não
+        começaram são canceladas e o lote devolve {} sem esperar as que
+        estão rodando. Retorna {id do jogador: carta da mão real}.
+        """
+        jobs = [
+            (player_id, controller.difficulty, controller.card_ai.search_iterations,
+             seat_seed(seed, state.turn_number, player_id))
+            for player_id, controller in controllers.items()
+            if not state.players[player_id].has_played_card
+        ]
+        
+        if executor is None:
+            vectors = [_choose_card_job(state, *job, should_stop=should_stop) for job in jobs]
+        else:
+            snapshot = state.snapshot()
+            futures = [executor.submit(_choose_card_job, snapshot, *job) for job in jobs]
+            pending = set(futures)
+            while pending:
+                if should_stop and should_stop():
+                    for future in pending:
+                        future.cancel()
+                    return {}
+                _, pending = wait(pending, AIController.BATCH_POLL_INTERVAL, FIRST_COMPLETED)
+            vectors = [future.result() for future in futures]
+        
+        choices = {}
+        for (player_id, *_), vector in zip(jobs, vectors):
+            cards = state.players[player_id].hand.cards
+            choices[player_id] = next((c for c in cards if c.get_vector() == vector), cards[0])
+        return choices
+    
     def update(self, dt, game_state, phase):
         """Atualiza a IA baseado na fase do jogo"""
         if phase == 'play_cards':
@@ -258,4 +386,18 @@ class AIController:
         if phase == 'play_cards':
             self.card_ai.reset_decision()
         elif phase == 'movement':
-            self.movement_ai.reset_decision()
\ No newline at end of file
+            self.movement_ai.reset_decision()
+
+
+def seat_seed(seed, turn, player_id):
+    """Semente independente para (partida, turno, assento)"""
+    return int(np.random.SeedSequence([seed, turn, player_id]).generate_state(1)[0])
+
+def _choose_card_job(state, player_id, difficulty, search_iterations, seed, should_stop=None):
+    """Decisão de carta de um assento (também roda em outro processo); retorna o vetor"""
+    controller = AIController(state.players[player_id], difficulty,
+                              search_iterations=search_iterations, rng=random.Random(seed))
+    view = state.get_ai_view(player_id)
+    view['should_stop'] = should_stop
+    card = controller.choose_card(view)
+    return card.get_vector() if card is not None else None
@@ -0,0 +1,206 @@
+# src/ai_worker.py - Decisões da IA fora da thread principal
+
+import multiprocessing
+import queue
+import random
+import threading
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor
+import pygame
+from config import MAX_PLAYERS
+from src.ai import AIController, seat_seed
+from src.rng import derive_seed
+
+# Evento postado quando uma decisão fica pronta
+AI_DECISION_EVENT = pygame.event.custom_type()
+
+class AIRequest:
+    """Pedido de decisão para um jogador (carta ou movimento)"""
+    
+    _next_id = 0
+    
+    def __init__(self, controller, snapshot, player_id, kind, seed=0):
+        AIRequest._next_id += 1
+        self.id = AIRequest._next_id
+        self.controller = controller
+        self.snapshot = snapshot
+        self.player_id = player_id
+        self.kind = kind
+        self.seed = seed
+        self.turn = snapshot.turn_number
+        self.cancel_event = threading.Event()
+    
+    @property
+    def cancelled(self):
+        """Verifica se o pedido foi cancelado"""
+        return self.cancel_event.is_set()
+    
+    def cancel(self):
+        """Cancela o pedido (a busca para na próxima verificação)"""
+        self.cancel_event.set()
+
+
+class AIWorker:
+    """Uma thread que executa AIController.choose_card/choose_move
+    
+    Cada pedido recebe uma cópia do estado (GameState.snapshot) e decide
+    com o controlador da thread para aquele assento: criado na primeira
+    vez (AIController.clone) e mantido entre pedidos, para que a rota
+    planejada da MovementAI seja reaproveitada; só o gerador é ressemeado
+    a cada pedido. A busca nunca toca no estado nem nos controladores que
+    a interface está usando. O resultado volta como AI_DECISION_EVENT na
+    fila de eventos do pygame; pedidos cancelados não postam nada.
+    
+    O pedido 'cards' recebe {id do jogador: AIController} e decide todos os
+    assentos de uma vez com AIController.choose_cards_batch. Com mais de
+    um assento, o lote roda num pool de processos do próprio worker,
+    criado no primeiro lote e encerrado em shutdown (Game.close). O pool
+    usa o contexto 'spawn': os filhos não herdam o SDL nem a thread da
+    interface e, com main.py protegido por __main__ e freeze_support, não
+    abrem janelas. Se o pool não puder ser criado ou quebrar, o lote roda
+    nesta thread.
+    """
+    
+    def __init__(self):
+        self.requests = queue.Queue()
+        self.current = None
+        self.thread = None
+        
+        # Controladores da thread: id do jogador -> (controlador da interface, cópia, gerador)
+        self.controllers = {}
+        
+        # Pool de processos dos lotes de cartas (criado no primeiro uso)
+        self.pool = None
+        self.pool_failed = False
+    
+    def start(self):
+        """Inicia a thread (daemon: não segura o encerramento do jogo)"""
+        if self.thread is None or not self.thread.is_alive():
+            self.thread = threading.Thread(target=self.run, name='ai-worker', daemon=True)
+            self.thread.start()
+    
+    def request(self, controller, state, player_id, kind, seed=0):
+        """Agenda uma decisão; cancela qualquer pedido anterior"""
+        self.cancel()
+        request = AIRequest(controller, state.snapshot(), player_id, kind, seed)
+        self.current = request
+        self.start()
+        self.requests.put(request)
+        return request
+    
+    def cancel(self):
+        """Cancela o pedido em andamento"""
+        if self.current is not None:
+            self.current.cancel()
+            self.current = None
+    
+    def is_pending(self, request_id=None):
+        """Verifica se há pedido em andamento (ou se é o pedido dado)"""
+        if self.current is None:
+            return False
+        return request_id is None or self.current.id == request_id
+    
+    def finish(self, request_id):
+        """Marca o pedido como consumido pela interface"""
+        if self.current is not None and self.current.id == request_id:
+            self.current = None
+    
+    def shutdown(self):
+        """Cancela o pedido atual e encerra a thread e o pool de processos"""
+        self.cancel()
+        if self.thread is not None:
+            self.requests.put(None)
+            self.thread = None
+        if self.pool is not None:
+            self.pool.shutdown(wait=False, cancel_futures=True)
+            self.pool = None
+    
+    def get_pool(self):
+        """Pool de processos dos lotes, criado no primeiro uso (None se indisponível)"""
+        if self.pool is None and not self.pool_failed:
+            try:
+                self.pool = ProcessPoolExecutor(max_workers=MAX_PLAYERS,
+                                                mp_context=multiprocessing.get_context('spawn'))
+            except (OSError, NotImplementedError, ValueError) as e:
+                print(f"IA sem processos auxiliares: {e}")
+                self.pool_failed = True
+        return self.pool
+    
+    def run(self):
+        """Laço da thread"""
+        while True:
+            request = self.requests.get()
+            if request is None:
+                return
+            if request.cancelled:
+                continue
+            
+            try:
+                result = self.decide(request)
+            except Exception as e:
+                print(f"Erro na IA: {e}")
+                result = None
+            
+            if not request.cancelled:
+                pygame.event.post(pygame.event.Event(
+                    AI_DECISION_EVENT,
+                    request_id=request.id,
+                    player_id=request.player_id,
+                    kind=request.kind,
+                    turn=request.turn,
+                    result=result
+                ))
+    
+    def seat_controller(self, request):
+        """Controlador da thread para o assento do pedido
+        
+        Criado uma vez por controlador da interface; a cada pedido passa a
+        apontar para o jogador da cópia do estado e recebe a semente do
+        pedido (turno, assento e tipo), então a decisão continua
+        reproduzível.
+        """
+        player = request.snapshot.players[request.player_id]
+        entry = self.controllers.get(request.player_id)
+        if entry is None or entry[0] is not request.controller:
+            rng = random.Random()
+            entry = (request.controller, request.controller.clone(player, rng), rng)
+            self.controllers[request.player_id] = entry
+        
+        _, controller, rng = entry
+        rng.seed(derive_seed(seat_seed(request.seed, request.turn, request.player_id),
+                             request.kind))
+        controller.attach(player)
+        return controller
+    
+    def decide_cards(self, request):
+        """Lote de cartas: em paralelo no pool quando há mais de um assento"""
+        snapshot = request.snapshot
+        waiting = [player_id for player_id in request.controller
+                   if not snapshot.players[player_id].has_played_card]
+        executor = self.get_pool() if len(waiting) > 1 else None
+        
+        try:
+            choices = AIController.choose_cards_batch(request.controller, snapshot, executor,
+                                                      request.seed, request.cancel_event.is_set)
+        except BrokenExecutor as e:
+            # Processo filho morreu: segue sem pool nesta partida
+            print(f"Pool da IA indisponível: {e}")
+            self.pool = None
+            self.pool_failed = True
+            choices = AIController.choose_cards_batch(request.controller, snapshot, None,
+                                                      request.seed, request.cancel_event.is_set)
+        return {player_id: card.get_vector() for player_id, card in choices.items()}
+    
+    def decide(self, request):
+        """Executa a decisão sobre a cópia do estado"""
+        snapshot = request.snapshot
+        if request.kind == 'cards':
+            return self.decide_cards(request)
+        
+        controller = self.seat_controller(request)
+        view = snapshot.get_ai_view(request.player_id)
+        view['should_stop'] = request.cancel_event.is_set
+        
+        if request.kind == 'card':
+            card = controller.choose_card(view)
+            return card.get_vector() if card is not None else None
+        return controller.choose_move(view)
@@ -0,0 +1,147 @@
+# src/arena.py - Partidas IA contra IA em lote (vários processos)
+
+import json
+import math
+import multiprocessing
+import numpy as np
+from config import *
+from src.simulation import play_headless_game
+
+# Quantil da normal para intervalos de 95%
+Z_95 = 1.959964
+
+def match_seed(base_seed, match_index):
+    """Semente determinística de uma partida"""
+    return int(np.random.SeedSequence([base_seed, match_index]).generate_state(1)[0])
+
+def seat_order(configs, match_index):
+    """Rodízio de assentos: cada configuração começa em cada posição igualmente"""
+    shift = match_index % len(configs)
+    return configs[shift:] + configs[:shift]
+
+def match_winners(result):
+    """Assentos vencedores de uma partida de play_headless_game
+    
+    Partida sem vencedor (peixes acabaram ou limite de turnos): vence por
+    pontos quem tem mais peixes.
+    """
+    fish = result['fish']
+    if not result['finished'] and max(fish) > 0:
+        return [seat for seat, count in enumerate(fish) if count == max(fish)]
+    return result['winners']
+
+def run_match(args):
+    """Executa uma partida (roda nos processos do pool); retorna o registro JSON"""
+    match_index, base_seed, configs, max_turns, search_iterations = args
+    seed = match_seed(base_seed, match_index)
+    seats = seat_order(list(configs), match_index)
+    
+    result = play_headless_game(len(seats), seats, max_turns, search_iterations, seed)
+    
+    return {
+        'match': match_index,
+        'seed': seed,
+        'seats': seats,
+        'winners': [seats[i] for i in match_winners(result)],
+        'fish': result['fish'],
+        'turns': result['turns'],
+        'finished': result['finished']
+    }
+
+def run_arena(configs, matches, base_seed=0, max_turns=200, search_iterations=32,
+              processes=None, output=None, progress=None):
+    """Executa as partidas em todos os núcleos, gravando cada uma em JSONL
+    
+    output: arquivo aberto para escrita (uma linha por partida, na ordem
+    em que terminam). progress(registro) é chamado para cada partida.
+    Retorna a lista de registros, ordenada pelo índice da partida.
+    """
+    jobs = [(i, base_seed, tuple(configs), max_turns, search_iterations) for i in range(matches)]
+    records = []
+    
+    chunksize = max(1, matches // ((processes or multiprocessing.cpu_count()) * 8))
+    with multiprocessing.Pool(processes) as pool:
+        for record in pool.imap_unordered(run_match, jobs, chunksize):
+            records.append(record)
+            if output is not None:
+                output.write(json.dumps(record) + '\n')
+                output.flush()
+            if progress is not None:
+                progress(record)
+    
+    records.sort(key=lambda record: record['match'])
+    return records
+
+def wilson_interval(successes, trials, z=Z_95):
+    """Intervalo de Wilson para uma proporção"""
+    if trials == 0:
+        return (0.0, 1.0)
+    p = successes / trials
+    denominator = 1 + z * z / trials
+    center = (p + z * z / (2 * trials)) / denominator
+    margin = z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / denominator
+    return (max(0.0, center - margin), min(1.0, center + margin))
+
+def mean_interval(values, z=Z_95):
+    """Média com intervalo normal (média ± z * erro padrão)"""
+    n = len(values)
+    if n == 0:
+        return (0.0, 0.0, 0.0)
+    mean = sum(values) / n
+    if n == 1:
+        return (mean, mean, mean)
+    variance = sum((v - mean) ** 2 for v in values) / (n - 1)
+    margin = z * math.sqrt(variance / n)
+    return (mean, mean - margin, mean + margin)
+
+def summarize(records):
+    """Vitórias, peixes por partida e turnos por configuração"""
+    configs = []
+    for record in records:
+        for config in record['seats']:
+            if config not in configs:
+                configs.append(config)
+    
+    summary = {'matches': len(records), 'configs': {}}
+    summary['turns'] = mean_interval([record['turns'] for record in records])
+    summary['finished'] = sum(record['finished'] for record in records)
+    
+    for config in configs:
+        seats = wins = 0
+        fish = []
+        for record in records:
+            for seat, name in enumerate(record['seats']):
+                if name == config:
+                    seats += 1
+                    fish.append(record['fish'][seat])
+            # Empate conta como vitória parcial
+            if config in record['winners']:
+                wins += record['winners'].count(config) / len(record['winners'])
+        
+        summary['configs'][config] = {
+            'seats': seats,
+            'wins': wins,
+            'win_rate': wins / seats if seats else 0.0,
+            'win_interval': wilson_interval(wins, seats),
+            'fish': mean_interval(fish)
+        }
+    return summary
+
+def format_summary(summary):
+    """Tabela de texto do resumo"""
+    mean, low, high = summary['turns']
+    lines = [
+        f"Partidas: {summary['matches']} (terminadas: {summary['finished']})",
+        f"Turnos por partida: {mean:.2f} [{low:.2f}, {high:.2f}]",
+        "",
+        f"{'Configuração':<14}{'Assentos':>9}{'Vitórias':>10}{'Taxa':>8}{'IC 95%':>18}{'Peixes/partida':>24}"
+    ]
+    for config, data in summary['configs'].items():
+        low, high = data['win_interval']
+        fish, fish_low, fish_high = data['fish']
+        lines.append(
+            f"{config:<14}{data['seats']:>9}{data['wins']:>10.1f}{data['win_rate']:>8.1%}"
+            f"{f'[{low:.1%}, {high:.1%}]':>18}"
+            f"{f'{fish:.2f} [{fish_low:.2f}, {fish_high:.2f}]':>24}"
+        )
+    return '\n'.join(lines)
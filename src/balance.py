@@ -0,0 +1,167 @@
+# src/balance.py - Análise de balanceamento por simulação em massa
+
+import hashlib
+import itertools
+import json
+import multiprocessing
+import os
+import numpy as np
+from src.arena import match_seed, match_winners, wilson_interval, mean_interval
+from src.rules import RuleSet, DEFAULT_RULES
+from src.simulation import play_headless_game
+
+# Regras que podem variar numa varredura (campos do RuleSet)
+RULE_PARAMETERS = RuleSet.FIELDS
+
+# Mude quando a simulação mudar: invalida os resultados guardados
+CACHE_VERSION = 4
+
+def point_key(rules, settings):
+    """Chave de cache de um ponto da varredura"""
+    data = {'version': CACHE_VERSION, 'rules': rules.to_dict(), 'settings': settings}
+    text = json.dumps(data, sort_keys=True, default=list)
+    return hashlib.sha1(text.encode()).hexdigest()[:16]
+
+def play_balance_game(args):
+    """Executa uma partida de um ponto (roda nos processos do pool)"""
+    point_index, game_index, rules, settings = args
+    seed = match_seed(settings['seed'], game_index)
+    difficulties = [settings['difficulty']] * settings['players']
+    
+    result = play_headless_game(settings['players'], difficulties, settings['max_turns'],
+                                settings['search_iterations'], seed, rules)
+    
+    return point_index, {
+        'winners': match_winners(result),
+        'turns': result['turns'],
+        'finished': result['finished'],
+        'stalemate': result['stalemate'],
+        'fish': result['fish']
+    }
+
+def summarize_point(records, players):
+    """Vantagem do primeiro jogador, duração das partidas e taxa de empate"""
+    games = len(records)
+    wins = np.zeros(players)
+    for record in records:
+        # Vitória compartilhada conta como fração
+        for seat in record['winners']:
+            wins[seat] += 1 / len(record['winners'])
+    
+    turns = np.array([record['turns'] for record in records])
+    stalemates = sum(record['stalemate'] for record in records)
+    unfinished = sum(not record['finished'] for record in records)
+    low, high = wilson_interval(wins[0], games)
+    
+    histogram, edges = np.histogram(turns, bins=min(10, max(1, len(set(turns.tolist())))))
+    return {
+        'games': games,
+        'seat_win_rate': (wins / games).round(4).tolist(),
+        'first_player_advantage': float(wins[0] / games - 1 / players),
+        'first_player_interval': (low - 1 / players, high - 1 / players),
+        'turns_mean': mean_interval(turns.tolist()),
+        'turns_percentiles': {str(q): float(np.percentile(turns, q)) for q in (10, 50, 90)},
+        'turns_histogram': {'counts': histogram.tolist(), 'edges': edges.round(1).tolist()},
+        'stalemate_rate': stalemates / games,
+        'unfinished_rate': unfinished / games
+    }
+
+
+class BalanceCache:
+    """Resultados por ponto da varredura, um arquivo JSON por chave"""
+    
+    def __init__(self, directory):
+        self.directory = directory
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+    
+    def path(self, key):
+        """Arquivo de uma chave"""
+        return os.path.join(self.directory, f"{key}.json")
+    
+    def get(self, key):
+        """Resultado guardado ou None"""
+        if not self.directory or not os.path.exists(self.path(key)):
+            return None
+        with open(self.path(key)) as f:
+            return json.load(f)
+    
+    def put(self, key, entry):
+        """Guarda um resultado (escrita atômica)"""
+        if not self.directory:
+            return
+        temp_path = self.path(key) + '.tmp'
+        with open(temp_path, 'w') as f:
+            json.dump(entry, f)
+        os.replace(temp_path, self.path(key))
+
+
+def sweep_points(sweep):
+    """Produto cartesiano de {campo do RuleSet: [valores]} sobre as regras padrão"""
+    names = list(sweep)
+    return [DEFAULT_RULES.replace(**dict(zip(names, values)))
+            for values in itertools.product(*(sweep[name] for name in names))]
+
+def run_balance(points, games=500, players=2, difficulty='MEDIO', max_turns=200,
+                search_iterations=8, seed=0, processes=None, cache_dir='.balance_cache',
+                progress=None):
+    """Simula games partidas por ponto e retorna [(regras, resumo, do_cache)]
+    
+    Pontos já guardados no cache voltam na hora; os outros são jogados
+    juntos num único pool (todos os núcleos), cada ponto guardado assim
+    que sua última partida termina. As sementes são as mesmas em todos os
+    pontos, então diferenças entre pontos vêm das regras.
+    """
+    settings = {'games': games, 'players': players, 'difficulty': difficulty,
+                'max_turns': max_turns, 'search_iterations': search_iterations, 'seed': seed}
+    cache = BalanceCache(cache_dir)
+    
+    results = [None] * len(points)
+    keys = [point_key(rules, settings) for rules in points]
+    pending = []
+    for index, key in enumerate(keys):
+        entry = cache.get(key)
+        if entry is not None:
+            results[index] = (points[index], entry['summary'], True)
+        else:
+            pending.append(index)
+    
+    if pending:
+        jobs = [(index, game_index, points[index], settings)
+                for index in pending for game_index in range(games)]
+        records = {index: [] for index in pending}
+        chunksize = max(1, len(jobs) // ((processes or multiprocessing.cpu_count()) * 8))
+        
+        with multiprocessing.Pool(processes) as pool:
+            for index, record in pool.imap_unordered(play_balance_game, jobs, chunksize):
+                records[index].append(record)
+                if progress is not None:
+                    progress(index, record)
+                if len(records[index]) == games:
+                    summary = summarize_point(records[index], players)
+                    cache.put(keys[index], {'rules': points[index].to_dict(), 'settings': settings,
+                                            'summary': summary, 'records': records[index]})
+                    results[index] = (points[index], summary, False)
+    return results
+
+def format_report(results, varied):
+    """Tabela de resultados; varied são as regras que mudam entre os pontos"""
+    header = [name for name in varied] + ['1º jogador', 'IC 95%', 'turnos (p10/p50/p90)',
+                                          'empates', 'sem fim']
+    rows = []
+    for rules, summary, cached in results:
+        low, high = summary['first_player_interval']
+        p = summary['turns_percentiles']
+        rows.append([str(getattr(rules, name)) for name in varied] + [
+            f"{summary['first_player_advantage']:+.3f}",
+            f"{low:+.3f}..{high:+.3f}",
+            f"{p['10']:.0f}/{p['50']:.0f}/{p['90']:.0f}",
+            f"{summary['stalemate_rate']:.1%}",
+            f"{summary['unfinished_rate']:.1%}" + (' (cache)' if cached else '')
+        ])
+    
+    widths = [max(len(str(row[i])) for row in [header] + rows) for i in range(len(header))]
+    lines = ['  '.join(str(cell).ljust(width) for cell, width in zip(header, widths))]
+    for row in rows:
+        lines.append('  '.join(cell.ljust(width) for cell, width in zip(row, widths)))
+    return '\n'.join(lines)
@@ -3,22 +3,32 @@
 import pygame
 import math
 from config import *
-from src.tile_manager import TileManager
+from src.tile_manager import get_tile_manager
 from src.layout_manager import layout_manager
+from src.occupancy import OccupancyGrid
 
 class Board:
     """Tabuleiro do jogo com layout responsivo"""
     
-    def __init__(self, size=BOARD_SIZE):
+    def __init__(self, size=BOARD_SIZE, layout=None):
         self.size = size
+        self.layout = layout or layout_manager
         self.grid = [[None for _ in range(size)] for _ in range(size)]
+        self.occupancy = OccupancyGrid(size)
         
         # Sistema de destaque
         self.highlight_cells = []
         self.wave_offset = 0
         
         # Gerenciador de tiles
-        self.tile_manager = TileManager()
+        self.tile_manager = get_tile_manager()
+        
+        # Camadas estáticas, refeitas só quando o layout muda: o tabuleiro
+        # (água e grade, opaco) e as faixas de coordenadas ao redor
+        self.static_layer = None
+        self.static_pos = None
+        self.label_layers = []
+        self.static_key = None
         
         print(f"Tabuleiro criado: {size}x{size} (responsivo)")
     
@@ -28,7 +38,7 @@ class Board:
     
     def update_screen_size(self, width, height):
         """Atualiza tamanho da tela"""
-        layout_manager.update_screen_size(width, height)
+        self.layout.update_screen_size(width, height)
     
     def is_valid_position(self, x, y):
         """Verifica se a posição é válida"""
@@ -36,14 +46,16 @@ class Board:
     
     def is_occupied(self, x, y):
         """Verifica se a posição está ocupada"""
-        if not self.is_valid_position(x, y):
-            return True
-        return self.grid[y][x] is not None
+        return self.occupancy.is_occupied(x, y)
     
     def place_object(self, x, y, obj):
         """Coloca um objeto no tabuleiro"""
         if self.is_valid_position(x, y):
             self.grid[y][x] = obj
+            if obj is None:
+                self.occupancy.release(x, y)
+            else:
+                self.occupancy.occupy(x, y)
             return True
         return False
     
@@ -52,6 +64,7 @@ class Board:
         if self.is_valid_position(x, y):
             obj = self.grid[y][x]
             self.grid[y][x] = None
+            self.occupancy.release(x, y)
             return obj
         return None
     
@@ -67,69 +80,123 @@ class Board:
             obj = self.grid[from_y][from_x]
             self.grid[from_y][from_x] = None
             self.grid[to_y][to_x] = obj
+            self.occupancy.release(from_x, from_y)
+            if obj is not None:
+                self.occupancy.occupy(to_x, to_y)
             return True
         return False
     
     def get_valid_moves(self, x, y, max_distance):
         """Retorna movimentos válidos a partir de uma posição"""
-        valid_moves = []
-        
-        for dx in range(-max_distance, max_distance + 1):
-            for dy in range(-max_distance, max_distance + 1):
-                if dx == 0 and dy == 0:
-                    continue
-                    
-                new_x, new_y = x + dx, y + dy
-                
-                if abs(dx) + abs(dy) <= max_distance:
-                    if self.is_valid_position(new_x, new_y) and not self.is_occupied(new_x, new_y):
-                        valid_moves.append((new_x, new_y))
-        
-        return valid_moves
+        # Losango pré-calculado AND células livres
+        return self.occupancy.valid_moves(x, y, max_distance)
     
     def highlight_moves(self, moves):
         """Destaca células válidas para movimento"""
         self.highlight_cells = moves
-        
+    
     def clear_highlights(self):
         """Limpa células destacadas"""
         self.highlight_cells = []
     
     def screen_to_board(self, screen_x, screen_y):
         """Converte coordenadas da tela para coordenadas do tabuleiro"""
-        return layout_manager.get_screen_to_board_coordinates(screen_x, screen_y)
+        return self.layout.get_screen_to_board_coordinates(screen_x, screen_y)
     
     def board_to_screen(self, board_x, board_y):
         """Converte coordenadas do tabuleiro para coordenadas da tela"""
-        return layout_manager.get_scaled_board_coordinates(board_x, board_y)
+        return self.layout.get_scaled_board_coordinates(board_x, board_y)
     
     def draw(self, surface):
         """Desenha o tabuleiro responsivo"""
         # Atualiza tamanho da tela
         screen_width, screen_height = surface.get_size()
-        layout_manager.update_screen_size(screen_width, screen_height)
+        self.layout.update_screen_size(screen_width, screen_height)
         
-        # Desenha tiles de água como fundo
-        self.draw_water_tiles(surface)
+        # Água, grade e coordenadas: um único blit da camada pronta
+        self.draw_static_layer(surface)
         
-        # Desenha grade responsiva
-        layout_manager.draw_board_grid(surface)
-        
-        # Desenha highlights
+        # Desenha highlights (as coordenadas ficam fora das células)
         self.draw_highlights(surface)
+    
+    def static_layer_key(self, screen_size):
+        """O que muda a camada estática: tela, área do tabuleiro e fonte"""
+        board_area = self.layout.get_board_area()
+        return (screen_size, tuple(board_area.values()), self.layout.get_font_size(16))
+    
+    def invalidate_static_layer(self):
+        """Força a reconstrução da camada estática no próximo draw"""
+        self.static_key = None
+    
+    def build_static_layer(self):
+        """Compõe água e grade numa superfície opaca do tamanho do tabuleiro
+        
+        O fundo é COLORS['BACKGROUND'] (o mesmo que Game.draw usa para limpar
+        a tela), então a sobra entre a última célula e a borda da área fica
+        igual ao desenho direto. Os rótulos ficam em faixas à parte
+        (build_label_layers), fora do retângulo do tabuleiro.
+        """
+        board_area = self.layout.get_board_area()
+        origin = (board_area['x'], board_area['y'])
+        
+        # +1: a última linha da grade fica sobre a borda da área (telas
+        # minúsculas dão área negativa; a camada fica com 1 pixel)
+        layer = pygame.Surface((max(1, board_area['width'] + 1), max(1, board_area['height'] + 1)))
+        layer.fill(COLORS['BACKGROUND'])
+        self.draw_water_tiles(layer, origin)
+        self.layout.draw_board_grid(layer, origin)
         
-        # Desenha coordenadas responsivas
-        layout_manager.draw_coordinates(surface)
+        if pygame.display.get_surface() is not None:
+            layer = layer.convert()
+        self.static_layer = layer
+        self.static_pos = origin
     
-    def draw_water_tiles(self, surface):
-        """Desenha tiles de água responsivos"""
+    def build_label_layers(self):
+        """Uma faixa transparente por lado com os rótulos das coordenadas
+        
+        Os rótulos são copiados para a faixa com BLEND_RGBA_MAX sobre pixels
+        zerados, o que preserva cor e alfa de cada pixel (um blit normal
+        misturaria as bordas suavizadas com o preto transparente e as
+        escureceria). Como os rótulos de um lado não se sobrepõem, desenhar
+        a faixa equivale a desenhar cada rótulo.
+        """
+        sides = {}
+        for side, text_surface, text_rect in self.layout.get_coordinate_labels():
+            sides.setdefault(side, []).append((text_surface, text_rect))
+        
+        self.label_layers = []
+        for labels in sides.values():
+            bounds = labels[0][1].unionall([rect for _, rect in labels[1:]])
+            layer = pygame.Surface(bounds.size, pygame.SRCALPHA)
+            for text_surface, text_rect in labels:
+                layer.blit(text_surface, text_rect.move(-bounds.x, -bounds.y),
+                           special_flags=pygame.BLEND_RGBA_MAX)
+            self.label_layers.append((layer, bounds.topleft))
+    
+    def draw_static_layer(self, surface):
+        """Desenha tabuleiro e rótulos, refazendo-os se a tela ou a célula mudou"""
+        key = self.static_layer_key(surface.get_size())
+        if key != self.static_key:
+            self.build_static_layer()
+            self.build_label_layers()
+            self.static_key = key
+        surface.blit(self.static_layer, self.static_pos)
+        for layer, pos in self.label_layers:
+            surface.blit(layer, pos)
+    
+    def draw_water_tiles(self, surface, origin=(0, 0)):
+        """Desenha tiles de água responsivos
+        
+        origin é a posição de surface na tela.
+        """
         water_tile = self.tile_manager.get_water_tile()
-        board_area = layout_manager.get_board_area()
+        board_area = self.layout.get_board_area()
+        left = board_area['x'] - origin[0]
+        top = board_area['y'] - origin[1]
         
         if not water_tile:
             # Fallback para cor sólida
-            board_rect = pygame.Rect(board_area['x'], board_area['y'], 
-                                   board_area['width'], board_area['height'])
+            board_rect = pygame.Rect(left, top, board_area['width'], board_area['height'])
             pygame.draw.rect(surface, COLORS['BOARD'], board_rect)
             return
         
@@ -141,13 +208,13 @@ class Board:
         # Desenha tiles de água
         for row in range(self.size):
             for col in range(self.size):
-                x = board_area['x'] + col * cell_size
-                y = board_area['y'] + row * cell_size
+                x = left + col * cell_size
+                y = top + row * cell_size
                 surface.blit(water_tile, (x, y))
     
     def draw_highlights(self, surface):
         """Desenha células destacadas responsivas"""
-        board_area = layout_manager.get_board_area()
+        board_area = self.layout.get_board_area()
         cell_size = board_area['cell_size']
         
         for cell_x, cell_y in self.highlight_cells:
@@ -168,9 +235,8 @@ class Board:
     
     def get_all_occupied_positions(self):
         """Retorna todas as posições ocupadas"""
-        occupied = []
-        for y in range(self.size):
-            for x in range(self.size):
-                if self.grid[y][x] is not None:
-                    occupied.append((x, y))
-        return occupied
+        return list(self.occupancy.occupied)
+    
+    def random_free_position(self, exclude=()):
+        """Sorteia uma posição livre em O(1)"""
+        return self.occupancy.random_free_cell(exclude)
@@ -3,12 +3,15 @@
 import pygame
 import math
 from config import *
-from src.utils import board_to_screen, lerp
+from src.utils import lerp, get_font
+from src.sprite_cache import sprite_cache
+from src.layout_manager import layout_manager
 
 class Boat:
     """Classe que representa um barco no jogo"""
     
-    def __init__(self, x, y, player_id, color):
+    def __init__(self, x, y, player_id, color, layout=None, movement_limit=MOVEMENT_LIMIT):
+        self.layout = layout or layout_manager
         self.x = x
         self.y = y
         self.player_id = player_id
@@ -19,7 +22,8 @@ class Boat:
         self.sail_color = (255, 255, 255)  # Vela branca
         
         # Movimento
-        self.moves_remaining = MOVEMENT_LIMIT
+        self.movement_limit = movement_limit
+        self.moves_remaining = movement_limit
         self.fish_collected = 0
         self.is_moving = False
         self.move_progress = 0
@@ -165,7 +169,7 @@ class Boat:
         
     def reset_moves(self):
         """Reseta os movimentos para o próximo turno"""
-        self.moves_remaining = MOVEMENT_LIMIT - self.fish_collected
+        self.moves_remaining = self.movement_limit - self.fish_collected
         
     def update(self, dt):
         """Atualiza o barco"""
@@ -194,7 +198,7 @@ class Boat:
         # Desenha rastro
         for i, (trail_x, trail_y) in enumerate(self.trail):
             alpha = int(255 * (i + 1) / len(self.trail))
-            trail_screen_x, trail_screen_y = board_to_screen(trail_x, trail_y)
+            trail_screen_x, trail_screen_y = self.layout.get_scaled_board_coordinates(trail_x, trail_y)
             
             # Cria uma superfície com transparência
             trail_surface = pygame.Surface((12, 12), pygame.SRCALPHA)
@@ -205,7 +209,7 @@ class Boat:
                        (trail_screen_x - 6, trail_screen_y - 6))
         
         # Posição na tela
-        screen_x, screen_y = board_to_screen(self.visual_x, self.visual_y)
+        screen_x, screen_y = self.layout.get_scaled_board_coordinates(self.visual_x, self.visual_y)
         
         # Efeito de balanço
         wobble = math.sin(self.bob_offset) * 2
@@ -218,7 +222,7 @@ class Boat:
             
             # Aplica rotação se estiver em movimento
             if self.is_moving and abs(self.rotation) > 5:
-                rotated_sprite = pygame.transform.rotate(self.sprite, -self.rotation)
+                rotated_sprite = sprite_cache.rotated(self.sprite, -self.rotation)
                 rotated_rect = rotated_sprite.get_rect(center=(screen_x, screen_y))
                 screen.blit(rotated_sprite, rotated_rect)
             else:
@@ -237,7 +241,7 @@ class Boat:
             
             # Se tem mais de 5, mostra o número
             if self.fish_collected > 5:
-                font = pygame.font.Font(None, 16)
+                font = get_font(16)
                 text = font.render(f"+{self.fish_collected - 5}", True, COLORS['WHITE'])
                 text_rect = text.get_rect()
                 text_rect.center = (screen_x + 25, screen_y + self.size // 2 + 15)
@@ -286,7 +290,7 @@ class Boat:
         pygame.draw.line(screen, (139, 69, 19), mast_start, mast_end, 3)
         
         # Número do jogador
-        font = pygame.font.Font(None, 18)
+        font = get_font(18)
         text = font.render(str(self.player_id + 1), True, COLORS['WHITE'])
         text_rect = text.get_rect(center=(screen_x, screen_y))
         screen.blit(text, text_rect)
@@ -5,6 +5,7 @@ import random
 import math
 from config import *
 from src.utils import draw_text
+from src.rules import DEFAULT_RULES
 
 class Card:
     """Classe que representa uma carta de movimento"""
@@ -121,7 +122,9 @@ class Card:
 class CardDeck:
     """Classe que gerencia o baralho de cartas"""
     
-    def __init__(self):
+    def __init__(self, rules=DEFAULT_RULES, rng=None):
+        self.rules = rules
+        self.rng = rng or random
         self.cards = []
         self.create_deck()
         self.shuffle()
@@ -131,22 +134,12 @@ class CardDeck:
         # Cria múltiplas cópias de cada vetor
         for vector in MOVEMENT_CARDS:
             # Quantidade de cópias baseada na força do vetor
-            magnitude = abs(vector[0]) + abs(vector[1])
-            if magnitude == 0:
-                copies = 4  # Cartas sem movimento
-            elif magnitude == 1:
-                copies = 6  # Movimentos básicos
-            elif magnitude == 2:
-                copies = 4  # Movimentos diagonais ou fortes
-            else:
-                copies = 2  # Movimentos muito fortes
-            
-            for _ in range(copies):
+            for _ in range(self.rules.card_copies(vector)):
                 self.cards.append(Card(vector))
     
     def shuffle(self):
         """Embaralha o baralho"""
-        random.shuffle(self.cards)
+        self.rng.shuffle(self.cards)
         
     def draw_card(self):
         """Compra uma carta do baralho"""
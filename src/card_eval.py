@@ -0,0 +1,69 @@
+# src/card_eval.py - Avaliação vetorizada de cartas (IA, dicas e simulações)
+
+import numpy as np
+from config import *
+
+# Todos os vetores distintos do baralho, na ordem de MOVEMENT_CARDS
+ALL_VECTORS = np.array(list(dict.fromkeys(MOVEMENT_CARDS)), dtype=np.int32)
+
+# Alcances da heurística (os pesos vêm de AI_WEIGHTS)
+OPPONENT_RADIUS = 5
+OPPONENT_FISH_RADIUS = 3
+
+def _as_points(points):
+    """Sequência de (x, y) como array (n, 2)"""
+    return np.asarray(points, dtype=np.int32).reshape(-1, 2)
+
+def score_card_vectors(vectors, boat_pos, fish_positions, other_boat_positions,
+                       board_size=BOARD_SIZE, weights=AI_WEIGHTS,
+                       collection_distance=COLLECTION_DISTANCE):
+    """Pontua cada vetor contra todos os peixes e barcos de uma vez
+    
+    vectors: (k, 2); fish_positions e other_boat_positions: sequências de
+    (x, y). Retorna um array (k,) de pontuações:
+    - aproximar o peixe mais próximo do barco e colocá-lo no alcance de coleta
+    - penalidade por empurrar esse peixe para fora do tabuleiro
+    - penalidade por aproximar peixes de oponentes próximos
+    """
+    vectors = _as_points(vectors)
+    fish = _as_points(fish_positions)
+    boats = _as_points(other_boat_positions)
+    boat = np.asarray(boat_pos, dtype=np.int32)
+    scores = np.zeros(len(vectors))
+    if not len(fish):
+        return scores
+    
+    # Peixe mais próximo (empate: o primeiro da lista)
+    fish_dist = np.abs(fish - boat).sum(axis=1)
+    closest = int(np.argmin(fish_dist))
+    closest_dist = fish_dist[closest]
+    
+    moved = fish[closest] + vectors
+    new_dist = np.abs(moved - boat).sum(axis=1)
+    scores += np.maximum(closest_dist - new_dist, 0) * weights['approach']
+    scores += np.where(new_dist <= collection_distance, weights['collect_bonus'], 0)
+    off_board = np.any((moved < 0) | (moved >= board_size), axis=1)
+    scores -= off_board * weights['off_board']
+    
+    # Oponentes próximos: conta peixes vizinhos que cada vetor aproxima deles
+    if len(boats):
+        boats = boats[np.abs(boats - boat).sum(axis=1) < OPPONENT_RADIUS]
+    if len(boats):
+        before = np.abs(boats[:, None, :] - fish[None, :, :]).sum(axis=2)           # (b, m)
+        shifted = fish[None, :, :] + vectors[:, None, :]                            # (k, m, 2)
+        after = np.abs(boats[None, :, None, :] - shifted[:, None, :, :]).sum(axis=3)  # (k, b, m)
+        helped = (after < before) & (before < OPPONENT_FISH_RADIUS)
+        scores -= helped.sum(axis=(1, 2)) * weights['opponent_penalty']
+    
+    return scores
+
+def rank_card_vectors(boat_pos, fish_positions, other_boat_positions,
+                      vectors=ALL_VECTORS, board_size=BOARD_SIZE, weights=AI_WEIGHTS,
+                      collection_distance=COLLECTION_DISTANCE):
+    """Vetores ordenados da melhor para a pior pontuação, com as pontuações"""
+    vectors = _as_points(vectors)
+    scores = score_card_vectors(vectors, boat_pos, fish_positions,
+                                other_boat_positions, board_size, weights,
+                                collection_distance)
+    order = np.argsort(-scores, kind='stable')
+    return [tuple(vectors[i].tolist()) for i in order], scores[order]
@@ -3,7 +3,7 @@
 import pygame
 import math
 from config import *
-from src.utils import create_gradient_surface
+from src.utils import create_gradient_surface, get_font
 
 class CardRenderer:
     """Renderizador de cartas visuais do Caçador dos Mares"""
@@ -123,7 +123,7 @@ class CardRenderer:
     
     def draw_coordinate_text(self, surface, vector):
         """Desenha o texto com as coordenadas"""
-        font = pygame.font.Font(None, 24)
+        font = get_font(24)
         coord_text = f"({vector[0]}, {vector[1]})"
         
         text_surface = font.render(coord_text, True, self.colors['coordinate_text'])
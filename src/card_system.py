@@ -3,14 +3,16 @@
 import pygame
 import math
 from config import *
+from src.utils import get_font
 from src.layout_manager import layout_manager
 
 class VisualCard:
     """Carta visual baseada no design do PDF fornecido"""
     
-    def __init__(self, vector, card_id=None):
+    def __init__(self, vector, card_id=None, layout=None):
         self.vector = vector
         self.card_id = card_id or f"card_{vector[0]}_{vector[1]}"
+        self.layout = layout or layout_manager
         
         # Dimensões responsivas
         self.base_width = 100
@@ -30,7 +32,7 @@ class VisualCard:
     
     def get_dimensions(self):
         """Retorna dimensões responsivas da carta"""
-        scale = layout_manager.get_element_scale_factor()
+        scale = self.layout.get_element_scale_factor()
         width = int(self.base_width * scale)
         height = int(self.base_height * scale)
         return width, height
@@ -51,7 +53,7 @@ class VisualCard:
     
     def get_surface(self):
         """Retorna superfície da carta com cache"""
-        scale = layout_manager.get_element_scale_factor()
+        scale = self.layout.get_element_scale_factor()
         
         # Verifica cache
         cache_key = f"{scale}_{self.is_selected}_{self.is_hovered}_{self.is_face_down}_{int(self.animation_time * 10)}"
@@ -121,7 +123,7 @@ class VisualCard:
     def draw_card_border(self, surface, width, height):
         """Desenha borda da carta"""
         border_color = (255, 255, 255)  # Branco como no PDF
-        border_width = max(2, int(3 * layout_manager.get_element_scale_factor()))
+        border_width = max(2, int(3 * self.layout.get_element_scale_factor()))
         
         # Borda externa
         pygame.draw.rect(surface, border_color, (0, 0, width, height), border_width)
@@ -149,7 +151,7 @@ class VisualCard:
         
         # Borda dourada
         pygame.draw.rect(surface, (255, 255, 0), (0, 0, width, height), 
-                        max(3, int(4 * layout_manager.get_element_scale_factor())))
+                        max(3, int(4 * self.layout.get_element_scale_factor())))
     
     def draw_vector_visualization(self, surface, width, height):
         """Desenha visualização do vetor como no PDF"""
@@ -165,11 +167,11 @@ class VisualCard:
         
         # Cor do vetor (branco como no PDF)
         vector_color = (255, 255, 255)
-        line_width = max(2, int(3 * layout_manager.get_element_scale_factor()))
+        line_width = max(2, int(3 * self.layout.get_element_scale_factor()))
         
         if self.vector == (0, 0):
             # Para vetor zero, desenha círculo (como no PDF)
-            radius = max(6, int(8 * layout_manager.get_element_scale_factor()))
+            radius = max(6, int(8 * self.layout.get_element_scale_factor()))
             pygame.draw.circle(surface, vector_color, (center_x, center_y), radius, line_width)
             
             # Ponto central
@@ -187,7 +189,7 @@ class VisualCard:
         angle = math.atan2(end_y - start_y, end_x - start_x)
         
         # Tamanho da seta baseado na escala
-        arrow_size = max(8, int(12 * layout_manager.get_element_scale_factor()))
+        arrow_size = max(8, int(12 * self.layout.get_element_scale_factor()))
         arrow_angle = math.pi / 6  # 30 graus
         
         # Pontos da seta
@@ -202,8 +204,8 @@ class VisualCard:
     
     def draw_coordinates_text(self, surface, width, height):
         """Desenha texto das coordenadas como no PDF"""
-        font_size = layout_manager.get_font_size(18)
-        font = pygame.font.Font(None, font_size)
+        font_size = self.layout.get_font_size(18)
+        font = get_font(font_size)
         
         # Texto das coordenadas
         coord_text = f"({self.vector[0]}, {self.vector[1]})"
@@ -212,10 +214,10 @@ class VisualCard:
         # Posição na parte inferior
         text_rect = text_surface.get_rect()
         text_rect.centerx = width // 2
-        text_rect.bottom = height - max(8, int(10 * layout_manager.get_element_scale_factor()))
+        text_rect.bottom = height - max(8, int(10 * self.layout.get_element_scale_factor()))
         
         # Fundo semi-transparente para legibilidade
-        bg_padding = max(4, int(6 * layout_manager.get_element_scale_factor()))
+        bg_padding = max(4, int(6 * self.layout.get_element_scale_factor()))
         bg_rect = text_rect.inflate(bg_padding * 2, bg_padding)
         bg_surface = pygame.Surface((bg_rect.width, bg_rect.height), pygame.SRCALPHA)
         bg_surface.set_alpha(128)
@@ -236,11 +238,11 @@ class VisualCard:
         
         # Borda
         pygame.draw.rect(surface, (255, 255, 255), (0, 0, width, height), 
-                        max(2, int(3 * layout_manager.get_element_scale_factor())))
+                        max(2, int(3 * self.layout.get_element_scale_factor())))
         
         # Logo "Caçador dos Mares" (texto simples)
-        font_size = layout_manager.get_font_size(12)
-        font = pygame.font.Font(None, font_size)
+        font_size = self.layout.get_font_size(12)
+        font = get_font(font_size)
         
         text_lines = ["Caçador", "dos", "Mares"]
         line_height = font_size + 2
@@ -266,21 +268,22 @@ class VisualCard:
         
         # Efeito de elevação para carta selecionada
         if self.is_selected:
-            draw_y -= max(10, int(15 * layout_manager.get_element_scale_factor()))
+            draw_y -= max(10, int(15 * self.layout.get_element_scale_factor()))
         
         surface.blit(card_surface, (x, draw_y))
 
 class CardHand:
     """Mão de cartas do jogador"""
     
-    def __init__(self):
+    def __init__(self, layout=None):
+        self.layout = layout or layout_manager
         self.cards = []
         self.selected_index = -1
         self.card_spacing_ratio = 1.1  # 10% de espaçamento
     
     def add_card(self, vector):
         """Adiciona carta à mão"""
-        card = VisualCard(vector)
+        card = VisualCard(vector, layout=self.layout)
         self.cards.append(card)
     
     def remove_card(self, index):
@@ -0,0 +1,166 @@
+# src/drift.py - Distribuição exata do vetor de deriva do turno
+
+from math import comb
+import numpy as np
+from config import *
+from src.rules import DEFAULT_RULES
+
+# Vetores distintos do baralho
+VECTORS = list(dict.fromkeys(MOVEMENT_CARDS))
+VECTOR_INDEX = {vector: i for i, vector in enumerate(VECTORS)}
+MAX_COMPONENT = max(max(abs(x), abs(y)) for x, y in VECTORS)
+
+# Baralhos completos por composição (RuleSet.deck_copies)
+_full_decks = {}
+
+def full_deck(rules=DEFAULT_RULES):
+    """Cópias de cada vetor no baralho completo"""
+    deck = _full_decks.get(rules.deck_copies)
+    if deck is None:
+        deck = np.array([rules.card_copies(vector) for vector in VECTORS], dtype=np.int64)
+        deck.setflags(write=False)
+        _full_decks[rules.deck_copies] = deck
+    return deck
+
+class DeckTracker:
+    """Histograma das cartas que um jogador ainda não viu
+    
+    Começa com o baralho completo; tira as cartas que o jogador compra e
+    as cartas dos oponentes reveladas na resolução. Quando o baralho é
+    refeito, soma um baralho completo: as únicas cartas não vistas que
+    sobravam eram as das mãos dos oponentes, que continuam desconhecidas.
+    """
+    
+    def __init__(self, rules=DEFAULT_RULES):
+        self.deck = full_deck(rules)
+        self.counts = self.deck.copy()
+    
+    def reset(self):
+        """Volta ao baralho completo"""
+        self.counts = self.deck.copy()
+    
+    def add_deck(self):
+        """Baralho refeito: mais um baralho completo de cartas desconhecidas"""
+        self.counts += self.deck
+    
+    def remove(self, vector):
+        """Uma carta desse vetor foi vista"""
+        index = VECTOR_INDEX[tuple(vector)]
+        if self.counts[index] > 0:
+            self.counts[index] -= 1
+    
+    def add(self, vector):
+        """Uma carta vista voltou a ser desconhecida"""
+        self.counts[VECTOR_INDEX[tuple(vector)]] += 1
+    
+    def total(self):
+        """Quantidade de cartas não vistas"""
+        return int(self.counts.sum())
+
+
+class DriftDistribution:
+    """Probabilidades do vetor total numa grade 2-D centrada em (0, 0)
+    
+    probs[radius + dx, radius + dy] é a probabilidade do vetor (dx, dy).
+    """
+    
+    def __init__(self, probs, radius):
+        self.probs = probs
+        self.radius = radius
+    
+    def probability(self, vector):
+        """Probabilidade de um vetor total"""
+        ix = vector[0] + self.radius
+        iy = vector[1] + self.radius
+        if 0 <= ix < self.probs.shape[0] and 0 <= iy < self.probs.shape[1]:
+            return float(self.probs[ix, iy])
+        return 0.0
+    
+    def items(self):
+        """Pares (vetor, probabilidade) com probabilidade positiva, do mais provável ao menos"""
+        xs, ys = np.nonzero(self.probs)
+        weights = self.probs[xs, ys]
+        order = np.argsort(-weights, kind='stable')
+        return [((int(xs[i]) - self.radius, int(ys[i]) - self.radius), float(weights[i]))
+                for i in order]
+    
+    def most_likely(self):
+        """Vetor mais provável"""
+        ix, iy = np.unravel_index(int(np.argmax(self.probs)), self.probs.shape)
+        return (int(ix) - self.radius, int(iy) - self.radius)
+    
+    def expected(self):
+        """Vetor esperado (média)"""
+        offsets = np.arange(self.probs.shape[0]) - self.radius
+        return (float(self.probs.sum(axis=1) @ offsets),
+                float(self.probs.sum(axis=0) @ offsets))
+    
+    def shifted(self, vector):
+        """Distribuição somada a um vetor conhecido (ex.: a própria carta)"""
+        radius = self.radius + max(abs(vector[0]), abs(vector[1]))
+        size = 2 * radius + 1
+        probs = np.zeros((size, size))
+        ox = radius - self.radius + vector[0]
+        oy = radius - self.radius + vector[1]
+        width = self.probs.shape[0]
+        probs[ox:ox + width, oy:oy + width] = self.probs
+        return DriftDistribution(probs, radius)
+
+
+def sum_distribution(counts, draws, scale=1):
+    """Distribuição da soma de draws cartas tiradas sem reposição
+    
+    Convolução por tipo de carta: ways[j] guarda, numa grade 2-D, o número
+    de maneiras de escolher j cartas entre os tipos já processados; cada
+    tipo entra com t cópias (C(c, t) maneiras, deslocamento t * vetor).
+    O resultado é hipergeométrico multivariado exato. scale multiplica
+    cada vetor (RuleSet.current_multiplier).
+    """
+    total = int(np.sum(counts))
+    draws = min(draws, total)
+    radius = MAX_COMPONENT * scale * draws
+    size = 2 * radius + 1
+    
+    ways = [np.zeros((size, size)) for _ in range(draws + 1)]
+    ways[0][radius, radius] = 1.0
+    
+    for (vx, vy), count in zip(VECTORS, counts):
+        vx, vy = vx * scale, vy * scale
+        count = int(count)
+        if not count:
+            continue
+        updated = [grid.copy() for grid in ways]  # t = 0
+        for j in range(draws + 1):
+            if not ways[j].any():
+                continue
+            for t in range(1, min(count, draws - j) + 1):
+                sx, sy = t * vx, t * vy
+                source = ways[j]
+                target = updated[j + t]
+                # target[x + sx, y + sy] += C(count, t) * source[x, y]
+                x0, x1 = max(0, -sx), min(size, size - sx)
+                y0, y1 = max(0, -sy), min(size, size - sy)
+                target[x0 + sx:x1 + sx, y0 + sy:y1 + sy] += comb(count, t) * source[x0:x1, y0:y1]
+        ways = updated
+    
+    probs = ways[draws]
+    if total:
+        probs = probs / comb(total, draws)
+    return DriftDistribution(probs, radius)
+
+
+def turn_drift_distribution(state, player_id):
+    """Distribuição do vetor total do turno vista por um jogador
+    
+    A carta do próprio jogador, se já jogada, é conhecida; as dos
+    oponentes vêm das cartas que ele ainda não viu.
+    """
+    tracker = state.deck_trackers[player_id]
+    rules = state.rules
+    distribution = sum_distribution(tracker.counts, state.num_players - 1,
+                                    rules.current_multiplier)
+    
+    own_card = state.cards_played.get(player_id)
+    if own_card is not None:
+        distribution = distribution.shifted(rules.drift(own_card.vector))
+    return distribution
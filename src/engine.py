@@ -0,0 +1,688 @@
+# src/engine.py - Núcleo de regras sem pygame (simulação headless)
+
+import copy
+import random
+from config import *
+from src.fish_store import FishStore, FISH_TYPES
+from src.occupancy import OccupancyGrid
+from src.zobrist import get_zobrist_keys, HASH_MASK
+from src.drift import DeckTracker, turn_drift_distribution
+from src.heatmap import HeatmapEngine
+from src.rules import DEFAULT_RULES
+from src.rng import RandomStreams
+
+HAND_SIZE = 3
+
+def manhattan(pos1, pos2):
+    """Distância de Manhattan sem depender de src.utils (pygame)"""
+    return abs(pos1[0] - pos2[0]) + abs(pos1[1] - pos2[1])
+
+
+class RuleCard:
+    """Carta de movimento sem dados visuais"""
+    
+    __slots__ = ('vector',)
+    
+    def __init__(self, vector):
+        self.vector = tuple(vector)
+    
+    def get_vector(self):
+        """Retorna o vetor de movimento"""
+        return self.vector
+    
+    def __repr__(self):
+        return f"RuleCard{self.vector}"
+
+
+class RuleDeck:
+    """Baralho de cartas de movimento"""
+    
+    def __init__(self, rules=DEFAULT_RULES, rng=random):
+        self.rules = rules
+        self.rng = rng
+        self.cards = []
+        self.create_deck()
+        self.shuffle()
+    
+    def create_deck(self):
+        """Cria o baralho com todas as cartas"""
+        for vector in MOVEMENT_CARDS:
+            for _ in range(self.rules.card_copies(vector)):
+                self.cards.append(RuleCard(vector))
+    
+    def shuffle(self):
+        """Embaralha o baralho"""
+        self.rng.shuffle(self.cards)
+    
+    def draw_card(self):
+        """Compra uma carta, reembaralhando se o baralho acabou"""
+        if not self.cards:
+            self.create_deck()
+            self.shuffle()
+        return self.cards.pop()
+    
+    def return_card(self, card):
+        """Retorna uma carta ao baralho"""
+        self.cards.append(card)
+
+
+class RuleHand:
+    """Mão de cartas de um jogador"""
+    
+    def __init__(self, max_cards=HAND_SIZE):
+        self.cards = []
+        self.max_cards = max_cards
+    
+    def add_card(self, card):
+        """Adiciona uma carta à mão"""
+        if len(self.cards) < self.max_cards:
+            self.cards.append(card)
+            return True
+        return False
+    
+    def remove_card(self, card):
+        """Remove uma carta da mão"""
+        if card in self.cards:
+            self.cards.remove(card)
+            return True
+        return False
+
+
+class BoatState:
+    """Estado lógico de um barco"""
+    
+    def __init__(self, x, y, player_id, movement_limit=MOVEMENT_LIMIT):
+        self.x = x
+        self.y = y
+        self.player_id = player_id
+        self.movement_limit = movement_limit
+        self.moves_remaining = movement_limit
+        self.fish_collected = 0
+    
+    def get_position(self):
+        """Retorna a posição do barco"""
+        return (self.x, self.y)
+    
+    def can_move(self):
+        """Verifica se o barco pode se mover"""
+        return self.moves_remaining > 0
+    
+    def move_to(self, x, y):
+        """Move o barco, consumindo um movimento"""
+        if not self.can_move():
+            return False
+        self.x = x
+        self.y = y
+        self.moves_remaining -= 1
+        return True
+    
+    def collect_fish(self):
+        """Coleta um peixe"""
+        self.fish_collected += 1
+        if self.moves_remaining > 0:
+            self.moves_remaining = max(0, self.moves_remaining - 1)
+    
+    def reset_moves(self):
+        """Reseta os movimentos para o próximo turno"""
+        self.moves_remaining = self.movement_limit - self.fish_collected
+
+
+class PlayerState:
+    """Estado lógico de um jogador"""
+    
+    def __init__(self, player_id, name, is_ai=False, ai_difficulty='MEDIO'):
+        self.id = player_id
+        self.name = name
+        self.is_ai = is_ai
+        self.ai_difficulty = ai_difficulty
+        
+        self.boat = None
+        self.hand = RuleHand()
+        self.played_card = None
+        
+        # Estatísticas
+        self.fish_collected = 0
+        self.turns_played = 0
+        self.total_distance_moved = 0
+        
+        # Estado do turno
+        self.has_played_card = False
+        self.has_moved = False
+    
+    def create_boat(self, x, y, movement_limit=MOVEMENT_LIMIT):
+        """Cria o barco do jogador"""
+        self.boat = BoatState(x, y, self.id, movement_limit)
+    
+    def collect_fish(self):
+        """Coleta um peixe"""
+        self.fish_collected += 1
+        if self.boat:
+            self.boat.collect_fish()
+    
+    def play_card(self, card):
+        """Joga uma carta da mão"""
+        if self.hand.remove_card(card):
+            self.played_card = card
+            self.has_played_card = True
+            return True
+        return False
+    
+    def move_boat(self, x, y):
+        """Move o barco do jogador"""
+        if self.boat and self.boat.can_move():
+            old_pos = self.boat.get_position()
+            if self.boat.move_to(x, y):
+                self.total_distance_moved += manhattan(old_pos, (x, y))
+                self.has_moved = True
+                return True
+        return False
+    
+    def end_turn(self):
+        """Finaliza o turno do jogador"""
+        self.turns_played += 1
+        self.has_played_card = False
+        self.has_moved = False
+        self.played_card = None
+        if self.boat:
+            self.boat.reset_moves()
+    
+    def __repr__(self):
+        return f"PlayerState({self.id}, {self.name}, AI={self.is_ai})"
+
+
+class GameState:
+    """Estado e regras de uma partida, sem tela, sprites ou layout
+    
+    A interface (src/game.py) apenas chama as transições e consome os
+    eventos de pop_events() para animar o que mudou. Todas as regras
+    (tamanho do tabuleiro, movimento, coleta, vitória, baralho e
+    correntes) vêm de self.rules. Todo sorteio usa os fluxos de
+    self.random (RandomStreams), derivados de seed: a mesma semente
+    repete a partida.
+    """
+    
+    def __init__(self, num_players=2, player_names=None, ai_players=None,
+                 ai_difficulty='MEDIO', rules=None, seed=None):
+        self.rules = rules or DEFAULT_RULES
+        self.random = RandomStreams(seed)
+        self.board_size = board_size = self.rules.board_size
+        self.num_players = num_players
+        
+        if player_names is None:
+            player_names = [f"Jogador {i + 1}" for i in range(num_players)]
+        if ai_players is None:
+            ai_players = [i > 0 for i in range(num_players)]
+        
+        self.players = [
+            PlayerState(i, player_names[i], ai_players[i], ai_difficulty)
+            for i in range(num_players)
+        ]
+        self.deck = RuleDeck(self.rules, self.random.stream('deck'))
+        
+        # Cartas que cada jogador ainda não viu (distribuição da deriva)
+        self.deck_trackers = [DeckTracker(self.rules) for _ in range(num_players)]
+        self.heatmaps = HeatmapEngine(board_size, self.rules.collection_distance)
+        
+        # Peixes e barcos no tabuleiro
+        self.fish = FishStore()
+        self.boat_cells = {}  # (x, y) -> id do jogador
+        self.occupancy = OccupancyGrid(board_size)
+        
+        # Controle de turnos
+        self.current_player_index = 0
+        self.turn_number = 1
+        self.phase = 'setup'
+        self.winner = None
+        self.start_player_token = 0
+        self.cards_played = {}
+        self.last_vector = (0, 0)
+        
+        # Eventos para a interface
+        self.events = []
+        
+        # Registros para desfazer as transições make_* (busca da IA)
+        self.undo_stack = []
+        
+        # Hash Zobrist incremental (ligado por enable_hashing)
+        self.zobrist = None
+        self.zobrist_hash = 0
+        self.hash_history = []
+    
+    def emit(self, event_type, **data):
+        """Registra um evento para a interface"""
+        data['type'] = event_type
+        self.events.append(data)
+    
+    def pop_events(self):
+        """Retorna e limpa os eventos pendentes"""
+        events = self.events
+        self.events = []
+        return events
+    
+    @property
+    def current_player(self):
+        """Jogador da vez"""
+        return self.players[self.current_player_index]
+    
+    def is_valid_position(self, x, y):
+        """Verifica se a posição está dentro do tabuleiro"""
+        return 0 <= x < self.board_size and 0 <= y < self.board_size
+    
+    def is_occupied(self, x, y):
+        """Verifica se há barco na posição (fora do tabuleiro conta como ocupado)"""
+        return self.occupancy.is_occupied(x, y)
+    
+    def get_valid_moves(self, player_id):
+        """Retorna destinos válidos para o barco do jogador"""
+        boat = self.players[player_id].boat
+        if not boat:
+            return []
+        
+        return self.occupancy.valid_moves(boat.x, boat.y, boat.moves_remaining)
+    
+    def is_valid_move(self, player_id, x, y):
+        """Verifica um destino sem montar a lista de movimentos"""
+        boat = self.players[player_id].boat
+        if not boat or not self.is_valid_position(x, y):
+            return False
+        return self.occupancy.can_move(boat.x, boat.y, x, y, boat.moves_remaining)
+    
+    def random_free_position(self, exclude=(), rng=None):
+        """Sorteia uma célula sem barco e fora de exclude (fluxo 'spawns' por padrão)"""
+        return self.occupancy.random_free_cell(exclude, rng or self.random.stream('spawns'))
+    
+    def add_fish(self, x, y, fish_type=None):
+        """Adiciona um peixe ao tabuleiro e retorna seu id"""
+        if fish_type is None:
+            fish_type = self.random.stream('spawns').choice(FISH_TYPES)
+        
+        fish_id = self.fish.add(x, y, FISH_TYPES.index(fish_type))
+        self.emit('fish_added', fish_id=fish_id, x=x, y=y, fish_type=fish_type)
+        return fish_id
+    
+    def remove_fish(self, fish_id):
+        """Remove um peixe"""
+        self.fish.remove(fish_id)
+    
+    def get_fish_positions(self):
+        """Retorna posições de todos os peixes"""
+        return self.fish.positions()
+    
+    def move_all_fish(self, vector):
+        """Move todos os peixes; os que saem do tabuleiro são removidos"""
+        moved, culled = self.fish.move_all(vector, self.board_size)
+        self.emit('fish_drifted', vector=tuple(vector), removed=culled.tolist())
+        return moved, culled
+    
+    def collect_fish(self):
+        """Cada peixe vai para o barco mais próximo dentro do alcance"""
+        owners = [p for p in self.players if p.boat]
+        caught, boat_index = self.fish.collect(
+            [p.boat.get_position() for p in owners], self.rules.collection_distance
+        )
+        
+        collected = []
+        for fish_id, index in zip(caught.tolist(), boat_index.tolist()):
+            player = owners[index]
+            player.collect_fish()
+            collected.append((fish_id, player))
+            self.emit('fish_collected', fish_id=fish_id, player_id=player.id)
+        
+        return collected
+    
+    def setup_game(self):
+        """Coloca os peixes iniciais e abre a fase de posicionamento"""
+        occupied = set()
+        
+        for _ in range(self.num_players * self.rules.initial_fish_per_player):
+            pos = self.random_free_position(occupied)
+            if pos:
+                self.add_fish(pos[0], pos[1])
+                occupied.add(pos)
+        
+        self.phase = 'setup'
+        self.current_player_index = 0
+        self.emit('phase_changed', phase=self.phase)
+    
+    def place_boat(self, player_id, x, y):
+        """Posiciona o barco do jogador da vez"""
+        player = self.players[player_id]
+        if (self.phase != 'setup' or player_id != self.current_player_index
+                or player.boat or self.is_occupied(x, y)):
+            return False
+        
+        player.create_boat(x, y, self.rules.movement_limit)
+        self.boat_cells[(x, y)] = player_id
+        self.occupancy.occupy(x, y)
+        self.emit('boat_placed', player_id=player_id, x=x, y=y)
+        
+        self.current_player_index = (self.current_player_index + 1) % self.num_players
+        if all(p.boat for p in self.players):
+            self.start_turn()
+        return True
+    
+    def start_turn(self):
+        """Distribui cartas e abre a fase de jogar cartas"""
+        self.phase = 'preparation'
+        
+        for player in self.players:
+            while len(player.hand.cards) < player.hand.max_cards:
+                self.deal_card(player)
+        
+        self.phase = 'play_cards'
+        self.current_player_index = self.start_player_token
+        self.emit('turn_started', turn=self.turn_number)
+        self.emit('phase_changed', phase=self.phase)
+    
+    def deal_card(self, player):
+        """Compra uma carta para o jogador e registra que ele a viu"""
+        if not self.deck.cards:
+            # Baralho será refeito: um baralho completo de cartas desconhecidas
+            for tracker in self.deck_trackers:
+                tracker.add_deck()
+        
+        card = self.deck.draw_card()
+        player.hand.add_card(card)
+        self.deck_trackers[player.id].remove(card.vector)
+        return card
+    
+    def play_card(self, player_id, card):
+        """Jogador da vez joga uma carta (face para baixo)"""
+        player = self.players[player_id]
+        if (self.phase != 'play_cards' or player_id != self.current_player_index
+                or player.has_played_card or not player.play_card(card)):
+            return False
+        
+        self.cards_played[player_id] = card
+        self.emit('card_played', player_id=player_id)
+        
+        self.current_player_index = (self.current_player_index + 1) % self.num_players
+        if all(p.has_played_card for p in self.players):
+            self.start_movement()
+        return True
+    
+    def start_movement(self):
+        """Abre a fase de movimentação"""
+        self.phase = 'movement'
+        self.current_player_index = self.start_player_token
+        self.emit('phase_changed', phase=self.phase)
+    
+    def move_boat(self, player_id, x, y):
+        """Move o barco do jogador da vez"""
+        player = self.players[player_id]
+        if (self.phase != 'movement' or player_id != self.current_player_index
+                or player.has_moved or not self.is_valid_move(player_id, x, y)):
+            return False
+        
+        old_pos = player.boat.get_position()
+        if not player.move_boat(x, y):
+            return False
+        
+        del self.boat_cells[old_pos]
+        self.boat_cells[(x, y)] = player_id
+        self.occupancy.move(old_pos[0], old_pos[1], x, y)
+        self.emit('boat_moved', player_id=player_id, x=x, y=y)
+        self.next_movement_player()
+        return True
+    
+    def skip_movement(self, player_id):
+        """Jogador da vez passa a movimentação"""
+        player = self.players[player_id]
+        if self.phase != 'movement' or player_id != self.current_player_index or player.has_moved:
+            return False
+        
+        player.has_moved = True
+        self.next_movement_player()
+        return True
+    
+    def next_movement_player(self):
+        """Próximo jogador na movimentação"""
+        self.current_player_index = (self.current_player_index + 1) % self.num_players
+        if all(p.has_moved for p in self.players):
+            self.resolve_turn()
+    
+    def resolve_turn(self):
+        """Revela as cartas, move os peixes e faz a coleta"""
+        self.phase = 'resolution'
+        
+        total_vector = [0, 0]
+        for card in self.cards_played.values():
+            vector = card.get_vector()
+            total_vector[0] += vector[0]
+            total_vector[1] += vector[1]
+        self.last_vector = self.rules.drift(total_vector)
+        self.emit('turn_resolved', vector=self.last_vector)
+        
+        # Cartas reveladas: cada jogador passa a conhecer as dos outros
+        for player_id, tracker in enumerate(self.deck_trackers):
+            for owner_id, card in self.cards_played.items():
+                if owner_id != player_id:
+                    tracker.remove(card.vector)
+        
+        self.move_all_fish(self.last_vector)
+        self.collect_fish()
+        
+        if not self.check_victory():
+            self.end_turn()
+        return self.last_vector
+    
+    def check_victory(self):
+        """Verifica vitória"""
+        winners = [p for p in self.players if p.fish_collected >= self.rules.winning_fish_count]
+        
+        if winners:
+            self.winner = winners[0] if len(winners) == 1 else winners
+            self.phase = 'game_over'
+            self.emit('game_over', winners=[p.id for p in winners])
+            return True
+        return False
+    
+    def end_turn(self):
+        """Finaliza o turno e começa o próximo"""
+        for player in self.players:
+            player.end_turn()
+        
+        self.start_player_token = (self.start_player_token + 1) % self.num_players
+        self.turn_number += 1
+        self.cards_played.clear()
+        self.emit('turn_ended')
+        self.start_turn()
+    
+    def is_game_over(self):
+        """Verifica se a partida terminou"""
+        return self.phase == 'game_over'
+    
+    def is_stalemate(self):
+        """Sem peixes no mar ninguém pode mais pontuar"""
+        return len(self.fish) == 0 and not self.is_game_over() and self.phase != 'setup'
+    
+    def snapshot(self):
+        """Cópia independente do estado para a IA pensar em outra thread
+        
+        Chaves Zobrist e mapas pré-calculados são só leitura e ficam
+        compartilhados; eventos pendentes não são copiados.
+        """
+        memo = {id(self.zobrist): self.zobrist, id(self.heatmaps): self.heatmaps,
+                id(self.rules): self.rules, id(self.events): []}
+        return copy.deepcopy(self, memo)
+    
+    def get_ai_view(self, player_id):
+        """Monta o game_state esperado por src/ai.py"""
+        player = self.players[player_id]
+        view = {
+            'fish_positions': self.get_fish_positions(),
+            'other_boats': [p.boat for p in self.players if p.boat and p is not player],
+            'valid_moves': self.get_valid_moves(player_id) if self.phase == 'movement' else [],
+            'predicted_fish_positions': [],
+            'engine_state': self,
+            'rules': self.rules
+        }
+        
+        if self.phase == 'movement':
+            # Peixes deslocados pelo vetor total mais provável e mapa de todos os vetores
+            distribution = turn_drift_distribution(self, player_id)
+            vector = distribution.most_likely()
+            own_card = self.cards_played.get(player_id)
+            view['drift_distribution'] = distribution
+            view['fish_heatmap'] = self.heatmaps.build(view['fish_positions'], distribution)
+            view['prediction_key'] = (own_card.vector if own_card else None,
+                                      self.deck_trackers[player_id].counts.tobytes())
+            view['predicted_fish_positions'] = [
+                (x + vector[0], y + vector[1]) for x, y in view['fish_positions']
+                if self.is_valid_position(x + vector[0], y + vector[1])
+            ]
+        if self.zobrist:
+            view['position_hash'] = self.zobrist.position_hash(self)
+        return view
+    
+    def enable_hashing(self):
+        """Liga o hash Zobrist, mantido pelas transições make_*/unmake"""
+        self.zobrist = get_zobrist_keys(self.board_size, self.num_players,
+                                        self.rules.winning_fish_count)
+        self.zobrist_hash = self.zobrist.full_hash(self)
+        self.hash_history = []
+        return self.zobrist_hash
+    
+    def refresh_hash(self):
+        """Recalcula o hash após transições normais (fora de make/unmake)"""
+        if self.zobrist:
+            self.zobrist_hash = self.zobrist.full_hash(self)
+        return self.zobrist_hash
+    
+    def _push_hash(self, delta):
+        """Guarda o hash atual e aplica um delta"""
+        self.hash_history.append(self.zobrist_hash)
+        self.zobrist_hash = (self.zobrist_hash + delta) & HASH_MASK
+    
+    def current_vector(self):
+        """Deriva dos peixes pelas cartas já jogadas no turno"""
+        total_x = total_y = 0
+        for card in self.cards_played.values():
+            total_x += card.vector[0]
+            total_y += card.vector[1]
+        return self.rules.drift((total_x, total_y))
+    
+    def make_play_card(self, player_id, card):
+        """Joga uma carta de forma reversível (sem eventos nem troca de fase)"""
+        player = self.players[player_id]
+        index = player.hand.cards.index(card)
+        self.undo_stack.append(('card', player_id, card, index, player.played_card))
+        
+        if self.zobrist:
+            vector_index = self.zobrist.vector_index[card.vector]
+            self._push_hash(self.zobrist.played[player_id][vector_index]
+                            - self.zobrist.hand[player_id][vector_index])
+        
+        del player.hand.cards[index]
+        player.played_card = card
+        player.has_played_card = True
+        self.cards_played[player_id] = card
+    
+    def make_move_boat(self, player_id, x, y):
+        """Move um barco de forma reversível; o destino não é validado"""
+        player = self.players[player_id]
+        boat = player.boat
+        self.undo_stack.append(('move', player_id, boat.x, boat.y, boat.moves_remaining,
+                                player.has_moved, player.total_distance_moved))
+        
+        if self.zobrist:
+            keys = self.zobrist.boat[player_id]
+            self._push_hash(keys[self.zobrist.cell(x, y)] - keys[self.zobrist.cell(boat.x, boat.y)])
+        
+        del self.boat_cells[(boat.x, boat.y)]
+        self.boat_cells[(x, y)] = player_id
+        self.occupancy.move(boat.x, boat.y, x, y)
+        
+        player.total_distance_moved += manhattan((boat.x, boat.y), (x, y))
+        boat.x = x
+        boat.y = y
+        boat.moves_remaining -= 1
+        player.has_moved = True
+    
+    def make_drift(self, vector):
+        """Desloca os peixes de forma reversível"""
+        before = self.zobrist.fish_hash(self.fish) if self.zobrist else 0
+        _, culled = self.fish.move_all(vector, self.board_size)
+        self.undo_stack.append(('drift', tuple(vector), culled))
+        
+        if self.zobrist:
+            self._push_hash(self.zobrist.fish_hash(self.fish) - before)
+    
+    def make_collect(self):
+        """Faz a coleta de forma reversível; retorna os ids dos jogadores que pontuaram"""
+        owners = [p for p in self.players if p.boat]
+        before = self.zobrist.fish_hash(self.fish) if self.zobrist else 0
+        caught, boat_index = self.fish.collect(
+            [(p.boat.x, p.boat.y) for p in owners], self.rules.collection_distance
+        )
+        
+        delta = 0
+        scorers = []
+        for index in boat_index.tolist():
+            player = owners[index]
+            scorers.append((player.id, player.boat.moves_remaining))
+            if self.zobrist:
+                delta -= self.zobrist.score_key(player.id, player.fish_collected)
+                delta += self.zobrist.score_key(player.id, player.fish_collected + 1)
+            player.collect_fish()
+        
+        self.undo_stack.append(('collect', caught, scorers))
+        if self.zobrist:
+            self._push_hash(delta + self.zobrist.fish_hash(self.fish) - before)
+        return [player_id for player_id, _ in scorers]
+    
+    def make_resolve(self):
+        """Deriva pela soma das cartas jogadas e coleta (dois registros)"""
+        self.make_drift(self.current_vector())
+        return self.make_collect()
+    
+    def unmake(self):
+        """Desfaz a última transição make_*"""
+        record = self.undo_stack.pop()
+        kind = record[0]
+        if self.zobrist:
+            self.zobrist_hash = self.hash_history.pop()
+        
+        if kind == 'card':
+            _, player_id, card, index, previous_card = record
+            player = self.players[player_id]
+            player.hand.cards.insert(index, card)
+            player.played_card = previous_card
+            player.has_played_card = False
+            del self.cards_played[player_id]
+        
+        elif kind == 'move':
+            _, player_id, old_x, old_y, moves, has_moved, distance = record
+            player = self.players[player_id]
+            boat = player.boat
+            
+            del self.boat_cells[(boat.x, boat.y)]
+            self.boat_cells[(old_x, old_y)] = player_id
+            self.occupancy.move(boat.x, boat.y, old_x, old_y)
+            
+            boat.x = old_x
+            boat.y = old_y
+            boat.moves_remaining = moves
+            player.has_moved = has_moved
+            player.total_distance_moved = distance
+        
+        elif kind == 'drift':
+            _, vector, culled = record
+            self.fish.alive[culled] = True
+            ids = self.fish.alive_ids()
+            self.fish.x[ids] -= vector[0]
+            self.fish.y[ids] -= vector[1]
+        
+        elif kind == 'collect':
+            _, caught, scorers = record
+            self.fish.alive[caught] = True
+            for player_id, moves in reversed(scorers):
+                player = self.players[player_id]
+                player.fish_collected -= 1
+                player.boat.fish_collected -= 1
+                player.boat.moves_remaining = moves
+    
+    def undo_to(self, depth):
+        """Desfaz transições até a pilha voltar a ter depth registros"""
+        while len(self.undo_stack) > depth:
+            self.unmake()
@@ -5,11 +5,15 @@ import random
 import math
 from config import *
 from src.layout_manager import layout_manager
+from src.sprite_cache import sprite_cache
+from src.fish_store import FishStore, FISH_TYPES
 
 class Fish:
     """Peixe com posicionamento responsivo"""
     
-    def __init__(self, x, y, fish_type='blue'):
+    def __init__(self, x, y, fish_type='blue', fish_id=None, layout=None):
+        self.id = fish_id
+        self.layout = layout or layout_manager
         self.x = x
         self.y = y
         self.target_x = x
@@ -36,7 +40,7 @@ class Fish:
             sprite_manager = get_sprite_manager()
             if sprite_manager:
                 sprite_name = f"fish_{self.fish_type}"
-                self.sprite = sprite_manager.get_sprite(sprite_name)
+                self.sprite = sprite_manager.get_sprite(sprite_name, 'fish')
         except Exception as e:
             print(f"Erro ao carregar sprite do peixe: {e}")
             self.sprite = None
@@ -54,7 +58,7 @@ class Fish:
     
     def get_screen_position(self):
         """Retorna posição na tela com layout responsivo"""
-        return layout_manager.get_scaled_board_coordinates(
+        return self.layout.get_scaled_board_coordinates(
             int(self.visual_x), int(self.visual_y)
         )
     
@@ -93,12 +97,8 @@ class Fish:
         
         if self.sprite:
             # Escala sprite baseado no tamanho da célula
-            sprite_size = layout_manager.get_sprite_size(64)
-            
-            if self.sprite.get_size() != (sprite_size, sprite_size):
-                scaled_sprite = pygame.transform.scale(self.sprite, (sprite_size, sprite_size))
-            else:
-                scaled_sprite = self.sprite
+            sprite_size = self.layout.get_sprite_size(64)
+            scaled_sprite = sprite_cache.scaled(self.sprite, (sprite_size, sprite_size))
             
             sprite_rect = scaled_sprite.get_rect()
             sprite_rect.center = (int(final_x), int(final_y))
@@ -110,7 +110,7 @@ class Fish:
     
     def draw_manual(self, surface, x, y):
         """Desenha peixe manualmente como fallback"""
-        size = layout_manager.get_sprite_size(32)
+        size = self.layout.get_sprite_size(32)
         
         # Cores dos peixes
         colors = {
@@ -145,60 +145,85 @@ class Fish:
         pygame.draw.circle(surface, COLORS['BLACK'], (eye_x, eye_y), size//12)
 
 class FishManager:
-    """Gerenciador de peixes responsivo"""
+    """Gerenciador de peixes responsivo
+    
+    As posições ficam num FishStore (colunas NumPy); os objetos Fish são só
+    proxies de desenho, indexados pelo id do peixe no store.
+    """
     
-    def __init__(self):
-        self.fish_list = []
-        self.fish_types = ['blue', 'orange', 'green', 'pink', 'brown', 'grey']
+    def __init__(self, layout=None, store=None, rng=None):
+        self.layout = layout or layout_manager
+        self.store = store if store is not None else FishStore()
+        self.rng = rng or random
+        self.proxies = {}
+        self.fish_types = FISH_TYPES
     
-    def add_fish(self, x, y, fish_type=None):
+    @property
+    def fish_list(self):
+        """Proxies dos peixes vivos"""
+        return list(self.proxies.values())
+    
+    def add_fish(self, x, y, fish_type=None, fish_id=None):
         """Adiciona um peixe na posição especificada"""
         if fish_type is None:
-            fish_type = random.choice(self.fish_types)
+            fish_type = self.rng.choice(self.fish_types)
+        
+        if fish_id is None:
+            fish_id = self.store.add(x, y, self.fish_types.index(fish_type))
         
-        fish = Fish(x, y, fish_type)
-        self.fish_list.append(fish)
+        fish = Fish(x, y, fish_type, fish_id, self.layout)
+        self.proxies[fish_id] = fish
         return fish
     
     def remove_fish(self, fish):
         """Remove um peixe"""
-        if fish in self.fish_list:
-            self.fish_list.remove(fish)
+        if fish is not None:
+            self.store.remove(fish.id)
+            self.proxies.pop(fish.id, None)
+    
+    def get_fish_by_id(self, fish_id):
+        """Retorna o peixe com o id do store"""
+        return self.proxies.get(fish_id)
     
     def get_fish_at(self, x, y):
         """Retorna peixe na posição especificada"""
-        for fish in self.fish_list:
-            fish_x, fish_y = fish.get_position()
-            if fish_x == x and fish_y == y:
-                return fish
-        return None
+        fish_id = self.store.find_at(x, y)
+        return self.proxies.get(fish_id) if fish_id is not None else None
     
     def move_all_fish(self, vector):
         """Move todos os peixes pelo vetor especificado"""
-        for fish in self.fish_list[:]:  # Cópia da lista
-            current_x, current_y = fish.get_position()
-            new_x = current_x + vector[0]
-            new_y = current_y + vector[1]
-            
-            # Remove peixes que saem do tabuleiro
-            if not (0 <= new_x < BOARD_SIZE and 0 <= new_y < BOARD_SIZE):
-                self.remove_fish(fish)
-            else:
-                fish.set_target_position(new_x, new_y)
+        self.store.move_all(vector, self.layout.board_size)
+        self.sync()
+    
+    def sync(self):
+        """Alinha os proxies com o store (novos, removidos e movidos)"""
+        alive = self.store.alive_ids().tolist()
+        
+        for fish_id in list(self.proxies):
+            if not self.store.is_alive(fish_id):
+                del self.proxies[fish_id]
+        
+        for fish_id in alive:
+            x, y = self.store.get_position(fish_id)
+            fish = self.proxies.get(fish_id)
+            if fish is None:
+                self.add_fish(x, y, self.store.get_type(fish_id), fish_id)
+            elif (fish.target_x, fish.target_y) != (x, y):
+                fish.set_target_position(x, y)
     
     def update(self, dt):
         """Atualiza todos os peixes"""
-        for fish in self.fish_list:
+        for fish in self.proxies.values():
             fish.update(dt)
     
     def draw(self, surface):
         """Desenha todos os peixes"""
-        for fish in self.fish_list:
+        for fish in self.proxies.values():
             fish.draw(surface)
     
     def get_all_positions(self):
         """Retorna posições de todos os peixes"""
-        return [fish.get_position() for fish in self.fish_list]
+        return self.store.positions()
 
-# Instância global
+# Instância global (partidas usam o FishManager do seu GameContext)
 fish_manager = FishManager()
@@ -0,0 +1,115 @@
+# src/fish_store.py - Peixes em colunas NumPy (struct-of-arrays)
+
+import numpy as np
+
+FISH_TYPES = ['blue', 'orange', 'green', 'pink', 'brown', 'grey']
+
+class FishStore:
+    """Colunas x/y/tipo/vivo; o id do peixe é o índice da linha
+    
+    Linhas nunca são reaproveitadas: um peixe removido só fica com
+    alive=False, então ids continuam válidos para a interface e para
+    desfazer jogadas.
+    """
+    
+    def __init__(self, capacity=16):
+        self.count = 0
+        self.x = np.zeros(capacity, dtype=np.int32)
+        self.y = np.zeros(capacity, dtype=np.int32)
+        self.type = np.zeros(capacity, dtype=np.int8)
+        self.alive = np.zeros(capacity, dtype=bool)
+    
+    def __len__(self):
+        return int(np.count_nonzero(self.alive[:self.count]))
+    
+    def _grow(self):
+        """Dobra a capacidade das colunas"""
+        capacity = max(16, len(self.x) * 2)
+        for name in ('x', 'y', 'type', 'alive'):
+            column = getattr(self, name)
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[:len(column)] = column
+            setattr(self, name, grown)
+    
+    def add(self, x, y, type_index=0):
+        """Adiciona um peixe e retorna seu id"""
+        if self.count == len(self.x):
+            self._grow()
+        
+        fish_id = self.count
+        self.x[fish_id] = x
+        self.y[fish_id] = y
+        self.type[fish_id] = type_index
+        self.alive[fish_id] = True
+        self.count += 1
+        return fish_id
+    
+    def remove(self, fish_id):
+        """Marca o peixe como removido"""
+        if 0 <= fish_id < self.count:
+            self.alive[fish_id] = False
+    
+    def is_alive(self, fish_id):
+        """Verifica se o peixe ainda está no tabuleiro"""
+        return 0 <= fish_id < self.count and bool(self.alive[fish_id])
+    
+    def alive_ids(self):
+        """Ids dos peixes no tabuleiro, em ordem de criação"""
+        return np.flatnonzero(self.alive[:self.count])
+    
+    def get_position(self, fish_id):
+        """Posição de um peixe"""
+        return (int(self.x[fish_id]), int(self.y[fish_id]))
+    
+    def get_type(self, fish_id):
+        """Nome do tipo do peixe"""
+        return FISH_TYPES[self.type[fish_id]]
+    
+    def positions(self):
+        """Lista de posições (x, y) dos peixes vivos"""
+        ids = self.alive_ids()
+        return list(zip(self.x[ids].tolist(), self.y[ids].tolist()))
+    
+    def positions_array(self):
+        """Posições dos peixes vivos como array (n, 2)"""
+        ids = self.alive_ids()
+        return np.stack((self.x[ids], self.y[ids]), axis=1)
+    
+    def find_at(self, x, y):
+        """Id do primeiro peixe vivo em (x, y) ou None"""
+        ids = self.alive_ids()
+        hits = ids[(self.x[ids] == x) & (self.y[ids] == y)]
+        return int(hits[0]) if hits.size else None
+    
+    def move_all(self, vector, board_size):
+        """Desloca todos os peixes; retorna (ids movidos, ids que saíram do tabuleiro)"""
+        ids = self.alive_ids()
+        new_x = self.x[ids] + vector[0]
+        new_y = self.y[ids] + vector[1]
+        self.x[ids] = new_x
+        self.y[ids] = new_y
+        
+        inside = (new_x >= 0) & (new_x < board_size) & (new_y >= 0) & (new_y < board_size)
+        culled = ids[~inside]
+        self.alive[culled] = False
+        return ids[inside], culled
+    
+    def collect(self, boat_positions, max_distance):
+        """Entrega cada peixe ao barco mais próximo dentro do alcance
+        
+        boat_positions é uma sequência (n, 2); empates ficam com o barco de
+        menor índice. Retorna (ids coletados, índice do barco de cada um).
+        """
+        ids = self.alive_ids()
+        boats = np.asarray(boat_positions, dtype=np.int32).reshape(-1, 2)
+        if not ids.size or not boats.size:
+            return ids[:0], ids[:0]
+        
+        distances = (np.abs(self.x[ids, None] - boats[None, :, 0]) +
+                     np.abs(self.y[ids, None] - boats[None, :, 1]))
+        closest = np.argmin(distances, axis=1)
+        in_range = distances[np.arange(ids.size), closest] <= max_distance
+        
+        caught = ids[in_range]
+        self.alive[caught] = False
+        return caught, closest[in_range]
@@ -1,21 +1,21 @@
 # src/game.py - Jogo com UI responsiva completa
 
 import pygame
-import random
 from config import *
-from src.board import Board
 from src.player import Player
-from src.fish import Fish, fish_manager
-from src.card import CardDeck
+from src.game_context import GameContext
 from src.card_system import CardHand, VisualCard
 from src.ai import AIController
-from src.layout_manager import layout_manager
+from src.zobrist import TranspositionTable
+from src.ai_worker import AIWorker, AI_DECISION_EVENT
+from src.simulation import choose_ai_boat_position
 from src.utils import *
 
 class Game:
     """Classe principal do jogo com UI responsiva"""
     
-    def __init__(self, screen, host_player, num_players=2, ai_difficulty='MEDIO'):
+    def __init__(self, screen, host_player, num_players=2, ai_difficulty='MEDIO', rules=None,
+                 seed=None):
         self.screen = screen
         self.clock = pygame.time.Clock()
         
@@ -32,25 +32,26 @@ class Game:
         self.num_players = num_players
         self.ai_difficulty = ai_difficulty
         
-        # Componentes do jogo responsivos
-        self.board = Board()
+        # Componentes da partida (nada compartilhado com outras partidas)
+        self.context = GameContext(
+            num_players,
+            player_names=[host_player] + [f"IA {i}" for i in range(1, num_players)],
+            ai_difficulty=ai_difficulty,
+            rules=rules,
+            seed=seed
+        )
+        self.layout = self.context.layout
+        self.board = self.context.board
+        self.fish_manager = self.context.fish_manager
         self.players = []
-        self.deck = CardDeck()
         
-        # Estado do jogo
-        self.current_player_index = 0
-        self.turn_number = 1
-        self.phase = 'setup'
-        self.winner = None
-        
-        # Controle de turnos
-        self.start_player_token = 0
-        self.cards_played = {}
-        self.fish_to_add = 0
+        # Regras da partida (sem pygame); esta classe só desenha o estado
+        self.state = self.context.state
         
         # UI responsiva
         self.ui_message = ""
         self.ui_message_timer = 0
+        self.ui_message_surfaces = None  # (chave, texto, fundo) da mensagem atual
         self.card_hands = {}  # Mãos visuais dos jogadores
         self.selected_card_index = -1
         
@@ -58,16 +59,43 @@ class Game:
         self.animations = []
         self.ui_scale = 1.0
         
+        # IA pensa numa thread separada; o resultado chega como evento
+        self.ai_worker = AIWorker()
+        self.ai_request = None
+        self.ai_decision = None
+        self.ai_timer = 0
+        self.ai_card_choices = {}  # turno -> {id do jogador: vetor}
+        self.ai_seed = self.state.random.derive('ai-batch')
+        
         # Inicializa jogadores e UI
         self.setup_players(host_player)
         self.setup_responsive_ui()
         self.setup_game()
     
+    @property
+    def phase(self):
+        return self.state.phase
+    
+    @property
+    def current_player_index(self):
+        return self.state.current_player_index
+    
+    @property
+    def turn_number(self):
+        return self.state.turn_number
+    
+    @property
+    def winner(self):
+        winner = self.state.winner
+        if isinstance(winner, list):
+            return [self.players[p.id] for p in winner]
+        return self.players[winner.id] if winner else None
+    
     def setup_responsive_ui(self):
         """Configura UI responsiva"""
         # Cria mãos de cartas visuais para cada jogador
         for i, player in enumerate(self.players):
-            hand = CardHand()
+            hand = CardHand(self.layout)
             # Adiciona cartas de exemplo (serão substituídas pelo deck real)
             example_vectors = [(1, 0), (0, 1), (-1, 0)]
             for vector in example_vectors:
@@ -80,42 +108,86 @@ class Game:
         player = Player(0, host_player, COLORS['PLAYER_COLORS'][0], is_ai=False)
         self.players.append(player)
         
-        # Jogadores IA
+        # Jogadores IA (compartilham uma tabela de transposição)
+        self.state.enable_hashing()
+        self.transposition_table = TranspositionTable()
         for i in range(1, self.num_players):
             ai_name = f"IA {i}"
             player = Player(i, ai_name, COLORS['PLAYER_COLORS'][i], is_ai=True)
-            player.ai_controller = AIController(player, self.ai_difficulty)
+            player.ai_controller = AIController(self.state.players[i], self.ai_difficulty,
+                                                self.transposition_table,
+                                                rng=self.state.random.ai(i))
             self.players.append(player)
     
     def setup_game(self):
         """Inicializa o jogo"""
         # Adiciona peixes iniciais
-        occupied = []
+        self.state.setup_game()
+        self.sync_state()
+        self.show_message("Posicione seus barcos no tabuleiro")
+    
+    def sync_state(self):
+        """Aplica na interface os eventos gerados pelas regras"""
+        for event in self.state.pop_events():
+            event_type = event['type']
+            
+            if event_type == 'fish_collected':
+                player = self.players[event['player_id']]
+                player.collect_fish()
+                self.show_message(f"{player.name} coletou um peixe!")
+            
+            elif event_type == 'boat_placed':
+                player = self.players[event['player_id']]
+                player.create_boat(event['x'], event['y'], self.layout,
+                                   self.state.rules.movement_limit)
+                self.board.place_object(event['x'], event['y'], player.boat)
+                self.show_message(f"Barco do {player.name} posicionado!")
+            
+            elif event_type == 'boat_moved':
+                player = self.players[event['player_id']]
+                old_pos = player.boat.get_position()
+                player.move_boat(event['x'], event['y'])
+                self.board.move_object(old_pos[0], old_pos[1], event['x'], event['y'])
+                self.board.clear_highlights()
+            
+            elif event_type == 'card_played':
+                self.players[event['player_id']].has_played_card = True
+                self.card_hands[event['player_id']].selected_index = -1
+                self.update_visual_hands()
+            
+            elif event_type == 'turn_started':
+                self.update_visual_hands()
+                self.show_message("Escolha uma carta para jogar")
+            
+            elif event_type == 'turn_ended':
+                self.transposition_table.new_generation()
+                for player in self.players:
+                    player.end_turn()
+            
+            elif event_type == 'phase_changed' and event['phase'] == 'movement':
+                self.show_message("Mova seu barco (ESPAÇO para passar)")
         
-        for _ in range(self.num_players):
-            pos = generate_random_position(occupied)
-            if pos:
-                fish_manager.add_fish(pos[0], pos[1])
-                occupied.append(pos)
+        # Peixes do store compartilhado com as regras
+        self.fish_manager.sync()
         
-        self.phase = 'setup'
-        self.show_message("Posicione seus barcos no tabuleiro")
+        if self.state.phase == 'movement':
+            self.show_highlights_for_current_player()
     
     def update_screen_size(self, width, height):
         """Atualiza tamanho da tela para responsividade"""
-        layout_manager.update_screen_size(width, height)
+        self.layout.update_screen_size(width, height)
         self.board.update_screen_size(width, height)
         
         # Atualiza escala da UI
-        self.ui_scale = layout_manager.get_element_scale_factor()
+        self.ui_scale = self.layout.get_element_scale_factor()
     
     def get_ui_areas(self):
         """Retorna áreas da UI responsiva"""
         screen_width, screen_height = self.screen.get_size()
-        layout_manager.update_screen_size(screen_width, screen_height)
+        self.layout.update_screen_size(screen_width, screen_height)
         
-        ui_area = layout_manager.get_ui_area()
-        board_area = layout_manager.get_board_area()
+        ui_area = self.layout.get_ui_area()
+        board_area = self.layout.get_board_area()
         
         # Área de informações do jogo (parte superior da UI)
         info_area = {
@@ -146,6 +218,11 @@ class Game:
             self.update_screen_size(event.w, event.h)
             return None
         
+        if event.type == AI_DECISION_EVENT:
+            if self.ai_request is not None and event.request_id == self.ai_request.id:
+                self.ai_decision = event
+            return None
+        
         areas = self.get_ui_areas()
         current_player = self.players[self.current_player_index]
         
@@ -163,12 +240,20 @@ class Game:
         
         elif event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
+                self.cancel_ai()
                 return 'pause'
             elif event.key == pygame.K_SPACE and self.phase == 'movement':
                 # Pula movimento
-                if not current_player.is_ai and not current_player.has_moved:
-                    current_player.has_moved = True
-                    self.next_movement_player()
+                if not current_player.is_ai:
+                    self.state.skip_movement(self.current_player_index)
+                    self.board.clear_highlights()
+                    self.sync_state()
+            elif event.key == pygame.K_RETURN and self.phase == 'play_cards':
+                # Confirma a carta selecionada
+                if not current_player.is_ai:
+                    hand = self.card_hands.get(self.current_player_index)
+                    if hand and hand.selected_index >= 0:
+                        self.play_card_index(current_player, hand.selected_index)
         
         return None
     
@@ -178,16 +263,12 @@ class Game:
         
         if self.phase == 'setup' and not current_player.boat:
             # Posiciona barco
-            if not self.board.is_occupied(x, y):
-                self.place_player_boat(current_player, x, y)
-                self.next_setup_player()
+            self.place_player_boat(current_player, x, y)
         
         elif self.phase == 'movement' and not current_player.is_ai:
             # Move barco
-            if not current_player.has_moved and current_player.boat:
-                boat_pos = current_player.boat.get_position()
-                if (x, y) in self.board.highlight_cells:
-                    self.move_player_boat(current_player, x, y)
+            if (x, y) in self.board.highlight_cells:
+                self.move_player_boat(current_player, x, y)
         
         return None
     
@@ -202,59 +283,43 @@ class Game:
         hand = self.card_hands.get(self.current_player_index)
         if hand:
             clicked_index = hand.handle_click(mouse_pos)
-            if clicked_index >= 0:
-                selected_card = hand.get_selected_card()
-                if selected_card:
-                    # Confirma jogada da carta
-                    # TODO: Implementar confirmação
-                    pass
+            if clicked_index >= 0 and hand.selected_index == -1:
+                # Segundo clique na mesma carta confirma a jogada
+                self.play_card_index(current_player, clicked_index)
         
         return None
     
-    def next_setup_player(self):
-        """Próximo jogador no setup"""
-        self.current_player_index = (self.current_player_index + 1) % len(self.players)
-        
-        # Verifica se todos posicionaram
-        if all(p.boat for p in self.players):
-            self.start_turn()
+    def play_card_index(self, player, index):
+        """Joga a carta na posição index da mão do jogador"""
+        cards = self.state.players[player.id].hand.cards
+        if 0 <= index < len(cards):
+            self.play_card(player, cards[index])
+    
+    def play_card(self, player, card):
+        """Joga uma carta do jogador"""
+        if self.state.play_card(player.id, card):
+            player.played_card = card
+            self.sync_state()
+            return True
+        return False
     
     def place_player_boat(self, player, x, y):
         """Posiciona barco do jogador"""
-        player.create_boat(x, y)
-        self.board.place_object(x, y, player.boat)
-        self.show_message(f"Barco do {player.name} posicionado!")
+        if self.state.place_boat(player.id, x, y):
+            self.sync_state()
+            return True
+        return False
     
     def move_player_boat(self, player, x, y):
         """Move barco do jogador"""
-        old_pos = player.boat.get_position()
-        
-        if player.move_boat(x, y):
-            self.board.move_object(old_pos[0], old_pos[1], x, y)
-            self.board.clear_highlights()
-            self.next_movement_player()
-    
-    def start_turn(self):
-        """Inicia novo turno"""
-        self.phase = 'preparation'
-        
-        # Distribui cartas
-        for player in self.players:
-            while len(player.hand.cards) < 3:
-                card = self.deck.draw_card()
-                if card:
-                    player.hand.add_card(card)
-        
-        # Atualiza mãos visuais
-        self.update_visual_hands()
-        
-        self.phase = 'play_cards'
-        self.current_player_index = self.start_player_token
-        self.show_message("Escolha uma carta para jogar")
+        if self.state.move_boat(player.id, x, y):
+            self.sync_state()
+            return True
+        return False
     
     def update_visual_hands(self):
         """Atualiza mãos visuais com cartas reais"""
-        for i, player in enumerate(self.players):
+        for i, player in enumerate(self.state.players):
             if i in self.card_hands:
                 hand = self.card_hands[i]
                 hand.cards.clear()
@@ -263,84 +328,13 @@ class Game:
                 for card in player.hand.cards:
                     hand.add_card(card.get_vector())
     
-    def next_movement_player(self):
-        """Próximo jogador no movimento"""
-        self.current_player_index = (self.current_player_index + 1) % len(self.players)
-        
-        # Verifica se todos moveram
-        if all(p.has_moved for p in self.players):
-            self.resolve_turn()
-        else:
-            # Destaca movimentos do próximo jogador
-            self.show_highlights_for_current_player()
-    
     def show_highlights_for_current_player(self):
         """Mostra movimentos válidos"""
         player = self.players[self.current_player_index]
-        if player.boat and not player.has_moved:
-            pos = player.boat.get_position()
-            valid_moves = self.board.get_valid_moves(pos[0], pos[1], player.boat.moves_remaining)
-            self.board.highlight_moves(valid_moves)
-    
-    def resolve_turn(self):
-        """Resolve turno"""
-        # Calcula vetor resultante
-        total_vector = [0, 0]
-        for player_id, card in self.cards_played.items():
-            vector = card.get_vector()
-            total_vector[0] += vector[0]
-            total_vector[1] += vector[1]
-        
-        # Move peixes
-        fish_manager.move_all_fish(total_vector)
-        
-        # Coleta peixes
-        self.collect_fish()
-        
-        # Próximo turno ou fim de jogo
-        if not self.check_victory():
-            self.end_turn()
-    
-    def collect_fish(self):
-        """Coleta peixes próximos"""
-        for fish in fish_manager.fish_list[:]:
-            fish_pos = fish.get_position()
-            closest_player = None
-            closest_distance = float('inf')
-            
-            for player in self.players:
-                if player.boat:
-                    boat_pos = player.boat.get_position()
-                    distance = manhattan_distance(boat_pos, fish_pos)
-                    
-                    if distance <= COLLECTION_DISTANCE and distance < closest_distance:
-                        closest_distance = distance
-                        closest_player = player
-            
-            if closest_player:
-                closest_player.collect_fish()
-                fish_manager.remove_fish(fish)
-                self.show_message(f"{closest_player.name} coletou um peixe!")
-    
-    def check_victory(self):
-        """Verifica vitória"""
-        winners = [p for p in self.players if p.fish_collected >= WINNING_FISH_COUNT]
-        
-        if winners:
-            self.winner = winners[0] if len(winners) == 1 else winners
-            self.phase = 'game_over'
-            return True
-        return False
-    
-    def end_turn(self):
-        """Finaliza turno"""
-        for player in self.players:
-            player.end_turn()
-        
-        self.start_player_token = (self.start_player_token + 1) % len(self.players)
-        self.turn_number += 1
-        self.cards_played.clear()
-        self.start_turn()
+        if player.is_ai:
+            self.board.clear_highlights()
+        elif not self.state.current_player.has_moved:
+            self.board.highlight_moves(self.state.get_valid_moves(self.current_player_index))
     
     def show_message(self, message):
         """Mostra mensagem temporária"""
@@ -351,7 +345,7 @@ class Game:
         """Atualiza o jogo"""
         # Atualiza responsividade
         screen_size = self.screen.get_size()
-        layout_manager.update_screen_size(screen_size[0], screen_size[1])
+        self.layout.update_screen_size(screen_size[0], screen_size[1])
         
         # Atualiza timer de mensagem
         if self.ui_message_timer > 0:
@@ -359,7 +353,7 @@ class Game:
         
         # Atualiza componentes
         self.board.update(dt)
-        fish_manager.update(dt)
+        self.fish_manager.update(dt)
         
         for player in self.players:
             if hasattr(player, 'update'):
@@ -373,8 +367,99 @@ class Game:
         # Atualiza IA
         current_player = self.players[self.current_player_index]
         if current_player.is_ai and hasattr(current_player, 'ai_controller'):
-            # TODO: Implementar lógica de IA
-            pass
+            self.update_ai(current_player, dt)
+    
+    def update_ai(self, player, dt):
+        """Pede decisões ao AIWorker e aplica as que chegaram"""
+        if self.phase == 'setup':
+            if not self.state.players[player.id].boat:
+                pos = choose_ai_boat_position(self.state)
+                if pos:
+                    self.place_player_boat(player, pos[0], pos[1])
+            return
+        
+        if self.phase == 'play_cards':
+            self.update_ai_cards(player, dt)
+            return
+        if self.phase != 'movement':
+            return
+        kind, ai = 'move', player.ai_controller.movement_ai
+        
+        # Pedido antigo (outro jogador, fase ou turno) não vale mais
+        request = self.ai_request
+        if request is not None and (request.player_id != player.id or request.kind != kind
+                                    or request.turn != self.turn_number):
+            self.cancel_ai()
+            request = None
+        
+        if request is None:
+            self.ai_request = self.ai_worker.request(player.ai_controller, self.state,
+                                                     player.id, kind, seed=self.ai_seed)
+            self.ai_decision = None
+            self.ai_timer = 0
+            return
+        
+        # Respeita o tempo mínimo de "pensar" da dificuldade
+        self.ai_timer += dt
+        if self.ai_decision is not None and self.ai_timer >= ai.decision_delay():
+            decision = self.ai_decision
+            self.ai_worker.finish(request.id)
+            self.ai_request = None
+            self.ai_decision = None
+            self.apply_ai_decision(player, kind, decision.result)
+    
+    def update_ai_cards(self, player, dt):
+        """Cartas de todos os assentos de IA são escolhidas de uma vez, em paralelo"""
+        self.ai_timer += dt
+        choices = self.ai_card_choices.get(self.turn_number)
+        
+        if choices is None:
+            request = self.ai_request
+            if request is None or request.kind != 'cards' or request.turn != self.turn_number:
+                self.cancel_ai()
+                seats = {
+                    p.id: p.ai_controller for p in self.players
+                    if p.is_ai and not self.state.players[p.id].has_played_card
+                }
+                self.ai_request = self.ai_worker.request(seats, self.state, None, 'cards',
+                                                         seed=self.ai_seed)
+                self.ai_timer = 0
+            elif self.ai_decision is not None:
+                self.ai_card_choices = {self.turn_number: self.ai_decision.result or {}}
+                self.ai_worker.finish(request.id)
+                self.ai_request = None
+                self.ai_decision = None
+            return
+        
+        # Cada assento ainda respeita o tempo mínimo de "pensar"
+        if self.ai_timer >= player.ai_controller.card_ai.decision_delay():
+            self.ai_timer = 0
+            self.apply_ai_decision(player, 'card', choices.get(player.id))
+    
+    def apply_ai_decision(self, player, kind, result):
+        """Executa a decisão da IA no estado real"""
+        if kind == 'card':
+            cards = self.state.players[player.id].hand.cards
+            if not cards:
+                return
+            card = next((c for c in cards if c.get_vector() == result), None)
+            self.play_card(player, card or player.ai_controller.card_ai.rng.choice(cards))
+        else:
+            if result and self.move_player_boat(player, result[0], result[1]):
+                return
+            self.state.skip_movement(player.id)
+            self.sync_state()
+    
+    def cancel_ai(self):
+        """Descarta a decisão em andamento (pausa, saída, troca de fase)"""
+        self.ai_worker.cancel()
+        self.ai_request = None
+        self.ai_decision = None
+    
+    def close(self):
+        """Encerra a partida: cancela a IA e para a thread"""
+        self.cancel_ai()
+        self.ai_worker.shutdown()
     
     def draw(self):
         """Desenha o jogo com UI responsiva"""
@@ -385,7 +470,7 @@ class Game:
         self.board.draw(self.screen)
         
         # Desenha peixes
-        fish_manager.draw(self.screen)
+        self.fish_manager.draw(self.screen)
         
         # Desenha barcos
         for player in self.players:
@@ -413,13 +498,13 @@ class Game:
         pygame.draw.rect(self.screen, COLORS['WHITE'], ui_bg, 2)
         
         # Título
-        font_size = layout_manager.get_font_size(32)
+        font_size = self.layout.get_font_size(32)
         draw_text(self.screen, "CAÇADOR DOS MARES", 
                  info_area['x'] + 20, info_area['y'] + 20,
                  size=font_size, color=COLORS['WHITE'])
         
         # Turno
-        font_size = layout_manager.get_font_size(24)
+        font_size = self.layout.get_font_size(24)
         draw_text(self.screen, f"Turno: {self.turn_number}", 
                  info_area['x'] + 20, info_area['y'] + 60,
                  size=font_size, color=COLORS['WHITE'])
@@ -435,7 +520,7 @@ class Game:
         }
         
         phase_text = phase_names.get(self.phase, self.phase)
-        font_size = layout_manager.get_font_size(20)
+        font_size = self.layout.get_font_size(20)
         draw_text(self.screen, f"Fase: {phase_text}", 
                  info_area['x'] + 20, info_area['y'] + 90,
                  size=font_size, color=COLORS['YELLOW'])
@@ -446,8 +531,8 @@ class Game:
             is_current = (i == self.current_player_index)
             color = player.color if not is_current else COLORS['YELLOW']
             
-            player_text = f"{player.name}: {player.fish_collected} peixes"
-            font_size = layout_manager.get_font_size(18)
+            player_text = f"{player.name}: {self.state.players[i].fish_collected} peixes"
+            font_size = self.layout.get_font_size(18)
             draw_text(self.screen, player_text,
                      info_area['x'] + 20, info_area['y'] + y_offset,
                      size=font_size, color=color)
@@ -469,30 +554,40 @@ class Game:
             
             hand.draw(self.screen, center_x, center_y)
     
+    def get_message_surfaces(self, font_size):
+        """Texto e fundo da mensagem atual, criados uma vez por mensagem
+        
+        O texto é uma cópia da superfície do cache de textos: o alpha do
+        desvanecimento muda a cada quadro e não pode vazar para o cache.
+        """
+        key = (self.ui_message, font_size)
+        if self.ui_message_surfaces is None or self.ui_message_surfaces[0] != key:
+            text_surface = render_text(self.ui_message, font_size, COLORS['WHITE']).copy()
+            width, height = text_surface.get_rect().inflate(40, 20).size
+            bg_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+            bg_surface.fill((0, 0, 0))
+            self.ui_message_surfaces = (key, text_surface, bg_surface)
+        return self.ui_message_surfaces[1:]
+    
     def draw_messages(self):
         """Desenha mensagens temporárias"""
         if self.ui_message and self.ui_message_timer > 0:
             screen_width, screen_height = self.screen.get_size()
             
             # Posição centralizada
-            font_size = layout_manager.get_font_size(24)
+            font_size = self.layout.get_font_size(24)
             
             # Calcula alpha baseado no tempo restante
             alpha = min(255, int(255 * self.ui_message_timer / 3.0))
             
-            # Desenha fundo semi-transparente
-            font = pygame.font.Font(None, font_size)
-            text_surface = font.render(self.ui_message, True, COLORS['WHITE'])
+            text_surface, bg_surface = self.get_message_surfaces(font_size)
             text_rect = text_surface.get_rect()
             text_rect.centerx = screen_width // 2
             text_rect.centery = screen_height // 4
             
-            # Fundo
+            # Fundo semi-transparente
             bg_rect = text_rect.inflate(40, 20)
-            bg_surface = pygame.Surface((bg_rect.width, bg_rect.height), pygame.SRCALPHA)
             bg_surface.set_alpha(alpha // 2)
-            bg_surface.fill((0, 0, 0))
-            
             self.screen.blit(bg_surface, bg_rect)
             
             # Texto com transparência
@@ -0,0 +1,41 @@
+# src/game_context.py - Estado isolado por partida
+
+from config import *
+from src.engine import GameState
+
+class GameContext:
+    """Tudo que pertence a uma única partida: regras, peixes, tabuleiro, baralho e layout
+    
+    Nada aqui é global, então várias partidas podem existir no mesmo
+    processo (threads, asyncio, simulador). Com headless=True só o estado
+    de regras é criado, sem superfícies pygame.
+    """
+    
+    def __init__(self, num_players=2, player_names=None, ai_players=None,
+                 ai_difficulty='MEDIO', headless=False, rules=None, seed=None):
+        self.state = GameState(num_players, player_names, ai_players, ai_difficulty, rules, seed)
+        self.headless = headless
+        
+        self.layout = None
+        self.board = None
+        self.fish_manager = None
+        
+        if not headless:
+            from src.layout_manager import LayoutManager
+            from src.board import Board
+            from src.fish import FishManager
+            
+            self.layout = LayoutManager(self.state.board_size)
+            self.board = Board(self.state.board_size, layout=self.layout)
+            self.fish_manager = FishManager(layout=self.layout, store=self.state.fish,
+                                            rng=self.state.random.stream('spawns'))
+    
+    @property
+    def deck(self):
+        """Baralho da partida"""
+        return self.state.deck
+    
+    @property
+    def players(self):
+        """Jogadores (estado de regras) da partida"""
+        return self.state.players
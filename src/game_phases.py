@@ -2,7 +2,7 @@
 
 import pygame
 from config import *
-from src.utils import draw_text, create_gradient_surface
+from src.utils import draw_text, render_text, create_gradient_surface
 
 class GamePhaseManager:
     """Gerenciador de fases do jogo Caçador dos Mares"""
@@ -233,9 +233,7 @@ class GamePhaseManager:
             
             if alpha > 0:
                 # Background da notificação
-                text_surface = pygame.font.Font(None, 24).render(
-                    notification['message'], True, COLORS['WHITE']
-                )
+                text_surface = render_text(notification['message'], 24, COLORS['WHITE'])
                 
                 padding = 20
                 bg_width = text_surface.get_width() + padding * 2
@@ -0,0 +1,175 @@
+# src/heatmap.py - Mapas de probabilidade das posições dos peixes
+
+import numpy as np
+from config import *
+
+# Alcance do núcleo de proximidade usado pela avaliação de movimentos
+KERNEL_RADIUS = 5
+
+# Pesos que definem o núcleo de proximidade
+PROXIMITY_WEIGHTS = ('fish_catch', 'fish_near', 'fish_far')
+
+def proximity_score(distance, weights=AI_WEIGHTS, collection_distance=COLLECTION_DISTANCE):
+    """Pontuação de estar a distance casas de um peixe (mesma escala da MovementAI)"""
+    if distance <= collection_distance:
+        return weights['fish_catch']
+    elif distance <= 3:
+        return weights['fish_near'] - distance * weights['fish_near'] / 5
+    elif distance <= 5:
+        return weights['fish_far'] - distance * weights['fish_far'] / 10
+    return 0
+
+def proximity_key(weights):
+    """Parte dos pesos que afeta o núcleo de proximidade"""
+    return tuple(weights[name] for name in PROXIMITY_WEIGHTS)
+
+_catch_kernels = {}
+
+def get_catch_kernel(weights=AI_WEIGHTS, collection_distance=COLLECTION_DISTANCE):
+    """Núcleo de proximidade para um conjunto de pesos e alcance de coleta"""
+    key = (proximity_key(weights), collection_distance)
+    kernel = _catch_kernels.get(key)
+    if kernel is None:
+        kernel = _diamond_kernel(KERNEL_RADIUS,
+                                 lambda d: proximity_score(d, weights, collection_distance))
+        _catch_kernels[key] = kernel
+    return kernel
+
+def _diamond_kernel(radius, weight):
+    """Núcleo (2r+1)^2 com weight(d) para cada distância de Manhattan d <= r"""
+    offsets = np.arange(-radius, radius + 1)
+    distance = np.abs(offsets[:, None]) + np.abs(offsets[None, :])
+    kernel = np.zeros(distance.shape)
+    for d in range(radius + 1):
+        kernel[distance == d] = weight(d)
+    return kernel
+
+def convolve(grid, kernel):
+    """Soma de cópias deslocadas de grid (bordas contam como zero)"""
+    radius = kernel.shape[0] // 2
+    rows, cols = grid.shape
+    padded = np.pad(grid, radius)
+    result = np.zeros(grid.shape)
+    for i, j in zip(*np.nonzero(kernel)):
+        result += kernel[i, j] * padded[i:i + rows, j:j + cols]
+    return result
+
+def reach_probability(points, inside, probs, board_size, collection_distance):
+    """P(algum peixe no alcance de coleta de cada célula)
+    
+    Para cada vetor de deriva, os peixes que ficam no tabuleiro viram uma
+    grade de presença n x n, dilatada pelo losango de coleta com
+    collection_distance passos de vizinhança 4 (o losango de raio r é a
+    soma de r cruzes). As k grades são combinadas pelas probabilidades.
+    A memória fica em O(k * n^2), sem a distância de cada célula a cada
+    peixe.
+    """
+    k = len(probs)
+    present = np.zeros((k, board_size, board_size), dtype=bool)
+    vector_index = np.broadcast_to(np.arange(k)[:, None], inside.shape)
+    present[vector_index[inside], points[..., 0][inside], points[..., 1][inside]] = True
+    
+    reached = present
+    for _ in range(collection_distance):
+        grown = reached.copy()
+        grown[:, 1:] |= reached[:, :-1]
+        grown[:, :-1] |= reached[:, 1:]
+        grown[:, :, 1:] |= reached[:, :, :-1]
+        grown[:, :, :-1] |= reached[:, :, 1:]
+        reached = grown
+    return (probs @ reached.reshape(k, -1)).reshape(board_size, board_size)
+
+
+class FishHeatmap:
+    """Mapas de um turno, indexados por [x, y]
+    
+    landing: número esperado de peixes em cada célula após a deriva
+    near: probabilidade de algum peixe cair a até collection_distance da célula
+    catch: landing suavizado pelo núcleo de proximidade (pontuação esperada)
+    
+    IAs com pesos de proximidade próprios usam catch_for, que convolui
+    landing com o núcleo delas (uma vez por mapa e conjunto de pesos).
+    near só é calculado no primeiro acesso (apenas o RoutePlanner o usa);
+    landed guarda as posições após a deriva até lá.
+    """
+    
+    def __init__(self, landing, catch, collection_distance=COLLECTION_DISTANCE, landed=None):
+        self.landing = landing
+        self.catch = catch
+        self.collection_distance = collection_distance
+        self.custom_catch = {proximity_key(AI_WEIGHTS): catch}
+        self.landed = landed
+        self._near = None
+    
+    @property
+    def near(self):
+        """Probabilidade de algum peixe cair no alcance de coleta de cada célula"""
+        if self._near is None:
+            size = self.landing.shape[0]
+            if self.landed is None:
+                self._near = np.zeros((size, size))
+            else:
+                self._near = reach_probability(*self.landed, size, self.collection_distance)
+                self.landed = None
+        return self._near
+    
+    def catch_for(self, weights):
+        """Mapa de captura com os pesos de proximidade dados"""
+        key = proximity_key(weights)
+        catch = self.custom_catch.get(key)
+        if catch is None:
+            catch = convolve(self.landing, get_catch_kernel(weights, self.collection_distance))
+            self.custom_catch[key] = catch
+        return catch
+    
+    def score(self, x, y, weights=None):
+        """Pontuação esperada de terminar o movimento em (x, y)"""
+        catch = self.catch if weights is None else self.catch_for(weights)
+        return float(catch[x, y])
+    
+    def best_cells(self, cells):
+        """Células ordenadas da maior para a menor pontuação"""
+        cells = list(cells)
+        if not cells:
+            return []
+        xs, ys = zip(*cells)
+        order = np.argsort(-self.catch[list(xs), list(ys)], kind='stable')
+        return [cells[i] for i in order]
+
+
+class HeatmapEngine:
+    """Transforma a distribuição do vetor de deriva em mapas sobre o tabuleiro"""
+    
+    def __init__(self, board_size=BOARD_SIZE, collection_distance=COLLECTION_DISTANCE):
+        self.board_size = board_size
+        self.collection_distance = collection_distance
+        self.catch_kernel = get_catch_kernel(AI_WEIGHTS, collection_distance)
+    
+    def landed(self, fish_positions, distribution):
+        """Posições após cada vetor possível; peixes fora do tabuleiro somem
+        
+        Retorna (pontos (k, m, 2), dentro (k, m), probabilidades (k,)).
+        """
+        vectors, probs = zip(*distribution.items())
+        vectors = np.array(vectors, dtype=np.int32)
+        fish = np.asarray(fish_positions, dtype=np.int32).reshape(-1, 2)
+        
+        points = fish[None, :, :] + vectors[:, None, :]
+        inside = np.all((points >= 0) & (points < self.board_size), axis=2)
+        return points, inside, np.array(probs)
+    
+    def build(self, fish_positions, distribution):
+        """Monta os mapas do turno"""
+        size = self.board_size
+        landing = np.zeros((size, size))
+        if not len(fish_positions):
+            return FishHeatmap(landing, landing.copy(), self.collection_distance)
+        
+        points, inside, probs = self.landed(fish_positions, distribution)
+        
+        # Número esperado de peixes por célula
+        weights = np.broadcast_to(probs[:, None], inside.shape)
+        np.add.at(landing, (points[..., 0][inside], points[..., 1][inside]), weights[inside])
+        
+        catch = convolve(landing, self.catch_kernel)
+        return FishHeatmap(landing, catch, self.collection_distance, (points, inside, probs))
@@ -2,11 +2,14 @@
 
 import pygame
 from config import *
+from src.utils import get_font
+from src.sprite_cache import sprite_cache
 
 class LayoutManager:
     """Gerenciador de layout responsivo para o Caçador dos Mares"""
     
-    def __init__(self):
+    def __init__(self, board_size=BOARD_SIZE):
+        self.board_size = board_size  # Casas por lado (RuleSet da partida)
         self.screen_width = WINDOW_WIDTH
         self.screen_height = WINDOW_HEIGHT
         self.margin_ratio = 0.05  # 5% de margem
@@ -16,7 +19,7 @@ class LayoutManager:
         # Cache de layouts calculados
         self.layout_cache = {}
         self.last_screen_size = (0, 0)
-        
+    
     def update_screen_size(self, width, height):
         """Atualiza tamanho da tela e recalcula layout"""
         if (width, height) != self.last_screen_size:
@@ -24,6 +27,7 @@ class LayoutManager:
             self.screen_height = height
             self.last_screen_size = (width, height)
             self.layout_cache.clear()  # Limpa cache quando tela muda
+            sprite_cache.invalidate()  # Sprites escalados para o tamanho antigo
     
     def get_margins(self):
         """Retorna margens baseadas no tamanho da tela"""
@@ -60,7 +64,7 @@ class LayoutManager:
             'y': board_y,
             'width': board_size,
             'height': board_size,
-            'cell_size': board_size // BOARD_SIZE
+            'cell_size': board_size // self.board_size
         }
     
     def get_ui_area(self):
@@ -108,7 +112,7 @@ class LayoutManager:
         board_y = (screen_y - board_area['y']) // board_area['cell_size']
         
         # Verifica limites
-        if 0 <= board_x < BOARD_SIZE and 0 <= board_y < BOARD_SIZE:
+        if 0 <= board_x < self.board_size and 0 <= board_y < self.board_size:
             return (board_x, board_y)
         
         return None
@@ -134,35 +138,44 @@ class LayoutManager:
         sprite_size = int(board_area['cell_size'] * 0.8)  # 80% do tamanho da célula
         return max(16, min(128, sprite_size))
     
-    def draw_board_grid(self, surface):
-        """Desenha grade do tabuleiro responsiva"""
+    def draw_board_grid(self, surface, origin=(0, 0)):
+        """Desenha grade do tabuleiro responsiva
+        
+        origin é a posição de surface na tela (camadas menores que a tela).
+        """
         board_area = self.get_board_area()
+        left = board_area['x'] - origin[0]
+        top = board_area['y'] - origin[1]
         
         # Cor da grade baseada no contraste
         grid_color = (45, 125, 184)
         
         # Linhas verticais
-        for i in range(BOARD_SIZE + 1):
-            x = board_area['x'] + (i * board_area['cell_size'])
-            start_pos = (x, board_area['y'])
-            end_pos = (x, board_area['y'] + board_area['height'])
+        for i in range(self.board_size + 1):
+            x = left + (i * board_area['cell_size'])
+            start_pos = (x, top)
+            end_pos = (x, top + board_area['height'])
             pygame.draw.line(surface, grid_color, start_pos, end_pos, 1)
         
         # Linhas horizontais
-        for i in range(BOARD_SIZE + 1):
-            y = board_area['y'] + (i * board_area['cell_size'])
-            start_pos = (board_area['x'], y)
-            end_pos = (board_area['x'] + board_area['width'], y)
+        for i in range(self.board_size + 1):
+            y = top + (i * board_area['cell_size'])
+            start_pos = (left, y)
+            end_pos = (left + board_area['width'], y)
             pygame.draw.line(surface, grid_color, start_pos, end_pos, 1)
     
-    def draw_coordinates(self, surface):
-        """Desenha coordenadas do tabuleiro"""
+    def get_coordinate_labels(self):
+        """Rótulos das coordenadas: (lado, superfície, retângulo na tela)
+        
+        lado é 'left', 'right', 'top' ou 'bottom'.
+        """
         board_area = self.get_board_area()
         font_size = self.get_font_size(16)
-        font = pygame.font.Font(None, font_size)
+        font = get_font(font_size)
+        labels = []
         
         # Números nas laterais (linhas)
-        for i in range(BOARD_SIZE):
+        for i in range(self.board_size):
             text = str(i + 1)
             text_surface = font.render(text, True, COLORS['WHITE'])
             text_rect = text_surface.get_rect()
@@ -170,14 +183,14 @@ class LayoutManager:
             # Esquerda
             text_rect.centery = board_area['y'] + (i * board_area['cell_size']) + (board_area['cell_size'] // 2)
             text_rect.right = board_area['x'] - 10
-            surface.blit(text_surface, text_rect)
+            labels.append(('left', text_surface, text_rect.copy()))
             
             # Direita
             text_rect.left = board_area['x'] + board_area['width'] + 10
-            surface.blit(text_surface, text_rect)
+            labels.append(('right', text_surface, text_rect.copy()))
         
         # Letras em cima e embaixo (colunas)
-        for i in range(BOARD_SIZE):
+        for i in range(self.board_size):
             letter = chr(ord('A') + i)
             text_surface = font.render(letter, True, COLORS['WHITE'])
             text_rect = text_surface.get_rect()
@@ -186,10 +199,17 @@ class LayoutManager:
             
             # Cima
             text_rect.bottom = board_area['y'] - 10
-            surface.blit(text_surface, text_rect)
+            labels.append(('top', text_surface, text_rect.copy()))
             
             # Baixo
             text_rect.top = board_area['y'] + board_area['height'] + 10
+            labels.append(('bottom', text_surface, text_rect.copy()))
+        
+        return labels
+    
+    def draw_coordinates(self, surface):
+        """Desenha coordenadas do tabuleiro"""
+        for _, text_surface, text_rect in self.get_coordinate_labels():
             surface.blit(text_surface, text_rect)
     
     def get_debug_info(self):
@@ -50,7 +50,7 @@ class MainMenu:
         if self.current_game:
             result = self.current_game.handle_event(event)
             if result == 'quit' or result == 'pause':
-                self.current_game = None
+                self.close_game()
                 return None
             return result
         
@@ -175,6 +175,19 @@ class MainMenu:
         except Exception as e:
             print(f"Erro na tela de conquistas: {e}")
     
+    def close_game(self):
+        """Fecha a partida atual (cancela a IA em andamento)"""
+        if self.current_game and hasattr(self.current_game, 'close'):
+            self.current_game.close()
+        self.current_game = None
+    
+    def get_layout(self):
+        """Layout da partida em andamento (o global fora de partidas)"""
+        game = self.current_game
+        # No modo história a partida do capítulo fica em current_game
+        game = getattr(game, 'current_game', game)
+        return getattr(game, 'layout', None) or layout_manager
+    
     def update(self, dt):
         """Atualiza menu"""
         if self.current_game:
@@ -182,7 +195,7 @@ class MainMenu:
                 self.current_game.update(dt)
             except Exception as e:
                 print(f"Erro ao atualizar jogo: {e}")
-                self.current_game = None
+                self.close_game()
     
     def draw(self):
         """Desenha menu responsivo"""
@@ -191,7 +204,7 @@ class MainMenu:
                 self.current_game.draw()
             except Exception as e:
                 print(f"Erro ao desenhar jogo: {e}")
-                self.current_game = None
+                self.close_game()
         else:
             self.draw_menu()
     
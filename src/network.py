@@ -3,6 +3,7 @@
 import socket
 import threading
 import pickle
+import secrets
 import time
 from config import *
 from src.game import Game
@@ -159,7 +160,7 @@ class GameServer:
         self.game_state = {
             'started': True,
             'players': self.get_players_list(),
-            'seed': int(time.time())  # Para sincronizar random
+            'seed': secrets.randbits(63)  # Mesma partida em todos os clientes
         }
         
         self.broadcast({
@@ -355,13 +356,9 @@ class NetworkGame(Game):
     
     def start_network_game(self, game_state):
         """Inicia o jogo em rede"""
-        # Define seed para sincronizar random
-        import random
-        random.seed(game_state['seed'])
-        
-        # Cria jogadores
+        # A semente do servidor gera os mesmos sorteios em todos os clientes
         players = game_state['players']
-        super().__init__(self.screen, self.username, len(players))
+        super().__init__(self.screen, self.username, len(players), seed=game_state['seed'])
         
         # Substitui jogadores pelos jogadores reais
         self.players = []
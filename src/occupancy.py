@@ -0,0 +1,214 @@
+# src/occupancy.py - Ocupação do tabuleiro em bitboard
+
+import random
+from array import array
+
+# Losangos relativos por raio: raio -> deslocamentos (dx, dy) sem o centro
+_diamond_offsets = {}
+
+def get_diamond_offsets(radius):
+    """Deslocamentos do losango de Manhattan em ordem de dx e depois dy
+    
+    Um único losango por raio, independente do tamanho do tabuleiro: a
+    célula consultada só soma a posição e descarta o que cai fora.
+    """
+    offsets = _diamond_offsets.get(radius)
+    if offsets is None:
+        offsets = tuple((dx, dy)
+                        for dx in range(-radius, radius + 1)
+                        for dy in range(-(radius - abs(dx)), radius - abs(dx) + 1)
+                        if dx or dy)
+        _diamond_offsets[radius] = offsets
+    return offsets
+
+def diamond_cells(size, x, y, radius):
+    """Células do losango (sem o centro) dentro do tabuleiro, em ordem de x e y"""
+    radius = min(radius, 2 * (size - 1))
+    return [(x + dx, y + dy) for dx, dy in get_diamond_offsets(radius)
+            if 0 <= x + dx < size and 0 <= y + dy < size]
+
+# Losangos relativos como máscara: (size, raio) -> bits centrados em (raio, raio)
+_relative_masks = {}
+
+# Um bit por linha na coluna 0: (1 << size) - 1 vezes isso seleciona colunas
+_column_repeats = {}
+
+def get_relative_mask(size, radius):
+    """Losango (sem o centro) com centro na célula (radius, radius)
+    
+    Só vale com 2 * radius < size: cada linha do losango cabe numa linha
+    do tabuleiro.
+    """
+    key = (size, radius)
+    mask = _relative_masks.get(key)
+    if mask is None:
+        mask = 0
+        for dx, dy in get_diamond_offsets(radius):
+            mask |= 1 << ((radius + dx) * size + radius + dy)
+        _relative_masks[key] = mask
+    return mask
+
+def get_column_repeat(size):
+    """Máscara com o bit da coluna 0 de cada linha"""
+    repeat = _column_repeats.get(size)
+    if repeat is None:
+        repeat = sum(1 << (row * size) for row in range(size))
+        _column_repeats[size] = repeat
+    return repeat
+
+def diamond_mask(size, x, y, radius):
+    """Losango (sem o centro) como máscara de bits
+    
+    O losango relativo do raio é deslocado para (x, y) e recortado pelas
+    colunas [y - radius, y + radius] dentro do tabuleiro; o recorte
+    também descarta as linhas fora do tabuleiro. Com 2 * radius >= size
+    uma linha do losango vazaria para a vizinha, então cada linha é
+    montada como um segmento de colunas já recortado.
+    """
+    radius = min(radius, 2 * (size - 1))
+    if 2 * radius < size:
+        mask = get_relative_mask(size, radius)
+        shift = (x - radius) * size + (y - radius)
+        mask = mask << shift if shift >= 0 else mask >> -shift
+        low = max(0, y - radius)
+        high = min(size, y + radius + 1)
+        return mask & ((1 << high) - (1 << low)) * get_column_repeat(size)
+    
+    mask = 0
+    for dx in range(-radius, radius + 1):
+        nx = x + dx
+        if not 0 <= nx < size:
+            continue
+        span = radius - abs(dx)
+        low = max(0, y - span)
+        high = min(size, y + span + 1)
+        mask |= ((1 << high) - (1 << low)) << (nx * size)
+    return mask & ~(1 << (x * size + y))
+
+def iter_cells(mask, size):
+    """Percorre as células (x, y) de uma máscara em ordem de x e depois y"""
+    while mask:
+        low = mask & -mask
+        yield divmod(low.bit_length() - 1, size)
+        mask ^= low
+
+
+class OccupancyGrid:
+    """Células ocupadas como bits de um inteiro
+    
+    O bit de (x, y) é x * size + y, então percorrer os bits em ordem
+    crescente dá a mesma ordem da varredura antiga por dx e dy. Os
+    destinos de um barco são um E entre o losango relativo do raio,
+    deslocado para o barco (ver diamond_mask), e as células livres.
+    
+    Além dos bits, mantém o conjunto de células ocupadas e uma lista de
+    células livres com remoção por troca, para sortear uma célula livre
+    em O(1). A lista só é montada no primeiro sorteio.
+    """
+    
+    def __init__(self, size):
+        self.size = size
+        self.bits = 0
+        self.occupied = set()
+        
+        # Células livres (índices) e posição de cada célula nessa lista (-1 = ocupada)
+        self.free_cells = None
+        self.free_slot = None
+    
+    def bit(self, x, y):
+        """Bit da célula (x, y)"""
+        return 1 << (x * self.size + y)
+    
+    def is_valid_position(self, x, y):
+        """Verifica se a posição está dentro do tabuleiro"""
+        return 0 <= x < self.size and 0 <= y < self.size
+    
+    def is_occupied(self, x, y):
+        """Fora do tabuleiro conta como ocupado"""
+        if not self.is_valid_position(x, y):
+            return True
+        return bool(self.bits & self.bit(x, y))
+    
+    def occupy(self, x, y):
+        """Marca a célula como ocupada"""
+        if (x, y) in self.occupied:
+            return
+        self.bits |= self.bit(x, y)
+        self.occupied.add((x, y))
+        
+        if self.free_cells is not None:
+            index = x * self.size + y
+            slot = self.free_slot[index]
+            last = self.free_cells.pop()
+            if last != index:
+                self.free_cells[slot] = last
+                self.free_slot[last] = slot
+            self.free_slot[index] = -1
+    
+    def release(self, x, y):
+        """Libera a célula"""
+        if (x, y) not in self.occupied:
+            return
+        self.bits &= ~self.bit(x, y)
+        self.occupied.discard((x, y))
+        
+        if self.free_cells is not None:
+            index = x * self.size + y
+            self.free_slot[index] = len(self.free_cells)
+            self.free_cells.append(index)
+    
+    def _build_free_cells(self):
+        """Monta a lista de células livres a partir dos bits"""
+        total = self.size * self.size
+        self.free_cells = array('l')
+        self.free_slot = array('l', [-1]) * total
+        for index in range(total):
+            if not self.bits >> index & 1:
+                self.free_slot[index] = len(self.free_cells)
+                self.free_cells.append(index)
+    
+    def free_count(self):
+        """Quantidade de células livres"""
+        return self.size * self.size - len(self.occupied)
+    
+    def random_free_cell(self, exclude=(), rng=random):
+        """Sorteia uma célula livre que não esteja em exclude (None se não houver)"""
+        if self.free_cells is None:
+            self._build_free_cells()
+        if not self.free_cells:
+            return None
+        
+        # Exclusões costumam ser poucas: algumas tentativas bastam
+        for _ in range(16):
+            cell = divmod(self.free_cells[rng.randrange(len(self.free_cells))], self.size)
+            if cell not in exclude:
+                return cell
+        
+        candidates = [divmod(index, self.size) for index in self.free_cells]
+        candidates = [cell for cell in candidates if cell not in exclude]
+        return rng.choice(candidates) if candidates else None
+    
+    def move(self, from_x, from_y, to_x, to_y):
+        """Move a ocupação de uma célula para outra"""
+        self.release(from_x, from_y)
+        self.occupy(to_x, to_y)
+    
+    def moves_mask(self, x, y, max_distance):
+        """Destinos livres a até max_distance (Manhattan) como máscara"""
+        if max_distance <= 0 or not self.is_valid_position(x, y):
+            return 0
+        return diamond_mask(self.size, x, y, max_distance) & ~self.bits
+    
+    def valid_moves(self, x, y, max_distance):
+        """Destinos livres a até max_distance (Manhattan) como lista"""
+        return list(iter_cells(self.moves_mask(x, y, max_distance), self.size))
+    
+    def can_move(self, x, y, to_x, to_y, max_distance):
+        """Verifica um destino em O(1), sem montar o losango"""
+        distance = abs(to_x - x) + abs(to_y - y)
+        return (0 < distance <= max_distance and self.is_valid_position(x, y)
+                and not self.is_occupied(to_x, to_y))
+    
+    def count_moves(self, x, y, max_distance):
+        """Quantidade de destinos livres"""
+        return bin(self.moves_mask(x, y, max_distance)).count('1')
@@ -33,9 +33,9 @@ class Player:
         self.has_played_card = False
         self.has_moved = False
         
-    def create_boat(self, x, y):
+    def create_boat(self, x, y, layout=None, movement_limit=MOVEMENT_LIMIT):
         """Cria o barco do jogador"""
-        self.boat = Boat(x, y, self.id, self.color)
+        self.boat = Boat(x, y, self.id, self.color, layout, movement_limit)
         
     def collect_fish(self):
         """Coleta um peixe"""
@@ -84,9 +84,9 @@ class Player:
             'average_distance': self.total_distance_moved / max(1, self.turns_played)
         }
     
-    def is_winner(self):
+    def is_winner(self, winning_fish_count=WINNING_FISH_COUNT):
         """Verifica se o jogador venceu"""
-        return self.fish_collected >= WINNING_FISH_COUNT
+        return self.fish_collected >= winning_fish_count
     
     def update(self, dt):
         """Atualiza o jogador"""
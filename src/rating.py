@@ -0,0 +1,95 @@
+# src/rating.py - Classificação Glicko das configurações de IA
+
+import math
+
+# Constantes do Glicko-1
+INITIAL_RATING = 1500.0
+INITIAL_RD = 350.0
+MIN_RD = 30.0
+RD_GROWTH = 35.0  # c: incerteza que volta a cada período sem jogos
+Q = math.log(10) / 400
+
+def g(rd):
+    """Peso de um resultado contra um oponente de desvio rd"""
+    return 1 / math.sqrt(1 + 3 * Q * Q * rd * rd / (math.pi * math.pi))
+
+def expected_score(rating, opponent_rating, opponent_rd):
+    """Pontuação esperada contra o oponente"""
+    return 1 / (1 + 10 ** (-g(opponent_rd) * (rating - opponent_rating) / 400))
+
+
+class Rating:
+    """Classificação (r, RD) de uma configuração"""
+    
+    def __init__(self, rating=INITIAL_RATING, rd=INITIAL_RD, games=0):
+        self.rating = rating
+        self.rd = rd
+        self.games = games
+    
+    def expected(self, other):
+        """Pontuação esperada contra outra classificação"""
+        return expected_score(self.rating, other.rating, other.rd)
+    
+    def information(self, other):
+        """Quanto uma partida entre as duas deve reduzir a incerteza
+        
+        Proporcional a (RD_a^2 + RD_b^2) * E * (1 - E): pares incertos e
+        equilibrados rendem mais informação que um favorito óbvio.
+        """
+        e = self.expected(other)
+        return (self.rd ** 2 + other.rd ** 2) * e * (1 - e)
+    
+    def interval(self):
+        """Intervalo de 95% da classificação"""
+        return (self.rating - 1.96 * self.rd, self.rating + 1.96 * self.rd)
+    
+    def to_dict(self):
+        """Representação para o checkpoint"""
+        return {'rating': self.rating, 'rd': self.rd, 'games': self.games}
+    
+    @classmethod
+    def from_dict(cls, data):
+        """Reconstrói a partir do checkpoint"""
+        return cls(data['rating'], data['rd'], data['games'])
+
+
+def update_ratings(ratings, results):
+    """Aplica um período de avaliação do Glicko-1
+    
+    results: lista de (nome_a, nome_b, pontuação de a), pontuação em
+    {0, 0.5, 1}. Todas as atualizações usam as classificações do início do
+    período. Quem não jogou só tem o desvio inflado por RD_GROWTH.
+    """
+    games = {name: [] for name in ratings}
+    for a, b, score in results:
+        games[a].append((b, score))
+        games[b].append((a, 1 - score))
+    
+    # Início do período: a incerteza cresce (até o desvio inicial)
+    start = {
+        name: Rating(rating.rating, min(math.hypot(rating.rd, RD_GROWTH), INITIAL_RD), rating.games)
+        for name, rating in ratings.items()
+    }
+    
+    updated = {}
+    for name, current in start.items():
+        played = games[name]
+        if not played:
+            updated[name] = current
+            continue
+        
+        variance_inv = 0.0
+        delta = 0.0
+        for opponent_name, score in played:
+            opponent = start[opponent_name]
+            weight = g(opponent.rd)
+            e = expected_score(current.rating, opponent.rating, opponent.rd)
+            variance_inv += weight * weight * e * (1 - e)
+            delta += weight * (score - e)
+        variance_inv *= Q * Q
+        
+        precision = 1 / current.rd ** 2 + variance_inv
+        rating = current.rating + Q / precision * delta
+        rd = max(math.sqrt(1 / precision), MIN_RD)
+        updated[name] = Rating(rating, rd, current.games + len(played))
+    return updated
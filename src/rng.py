@@ -0,0 +1,42 @@
+# src/rng.py - Fluxos aleatórios nomeados de uma partida
+
+import random
+import secrets
+import numpy as np
+
+def derive_seed(seed, name):
+    """Semente de 64 bits do fluxo name, derivada da semente da partida"""
+    name_key = int.from_bytes(name.encode('utf-8'), 'little')
+    low, high = np.random.SeedSequence([seed, name_key]).generate_state(2)
+    return int(low) | (int(high) << 32)
+
+
+class RandomStreams:
+    """Geradores independentes de uma partida, todos derivados de uma semente
+    
+    Cada parte da partida sorteia do seu próprio fluxo ('deck', 'spawns',
+    'placement', 'ai-<id>', ...), então a ordem em que elas consomem
+    números não afeta as outras, e partidas no mesmo processo (simulações
+    em paralelo, IA em outra thread) não interferem entre si. Guardar
+    seed basta para repetir a partida (replays, clientes em rede).
+    """
+    
+    def __init__(self, seed=None):
+        self.seed = seed if seed is not None else secrets.randbits(64)
+        self.streams = {}
+    
+    def derive(self, name):
+        """Semente inteira de um fluxo (ex.: para outro processo)"""
+        return derive_seed(self.seed, name)
+    
+    def stream(self, name):
+        """random.Random do fluxo name (o mesmo objeto a cada chamada)"""
+        rng = self.streams.get(name)
+        if rng is None:
+            rng = random.Random(self.derive(name))
+            self.streams[name] = rng
+        return rng
+    
+    def ai(self, player_id):
+        """Fluxo da IA de um jogador"""
+        return self.stream(f"ai-{player_id}")
@@ -0,0 +1,170 @@
+# src/route_planner.py - Rotas de barco para vários turnos
+
+import numpy as np
+from config import *
+from src.drift import sum_distribution
+from src.heatmap import convolve, get_catch_kernel, _diamond_kernel
+from src.occupancy import diamond_cells
+
+# Núcleo de "algum peixe no alcance de coleta" (contagem esperada)
+_reach_kernels = {}
+
+def get_reach_kernel(radius):
+    """Losango cheio de raio radius"""
+    kernel = _reach_kernels.get(radius)
+    if kernel is None:
+        kernel = _diamond_kernel(radius, lambda d: 1.0)
+        _reach_kernels[radius] = kernel
+    return kernel
+
+def diamond_max(grid, radius):
+    """Melhor valor alcançável a até radius casas de cada célula
+    
+    O losango de raio r é a soma de r cruzes de raio 1, então bastam r
+    passos de máximo com os quatro vizinhos (sem tabela de índices).
+    """
+    result = grid.copy()
+    for _ in range(radius):
+        step = result.copy()
+        np.maximum(step[1:], result[:-1], out=step[1:])
+        np.maximum(step[:-1], result[1:], out=step[:-1])
+        np.maximum(step[:, 1:], result[:, :-1], out=step[:, 1:])
+        np.maximum(step[:, :-1], result[:, 1:], out=step[:, :-1])
+        result = step
+    return result
+
+
+class RoutePlan:
+    """Destinos planejados para os próximos turnos
+    
+    cells[i] é onde o barco deve terminar o movimento no turno turn + i.
+    O plano continua valendo enquanto o barco está onde o plano previa, o
+    orçamento de movimento não mudou, o destino segue alcançável e o mapa
+    de captura do turno ainda dá ao destino pelo menos uma fração do valor
+    esperado quando o plano foi feito, com os mesmos pesos do planejador.
+    """
+    
+    TOLERANCE = 0.5
+    
+    def __init__(self, turn, start, budget, cells, expected, value, weights=AI_WEIGHTS):
+        self.turn = turn
+        self.start = start
+        self.budget = budget
+        self.cells = cells
+        self.expected = expected
+        self.value = value
+        self.weights = weights
+    
+    def step_index(self, turn):
+        """Índice do passo do turno dado (None fora do plano)"""
+        index = turn - self.turn
+        return index if 0 <= index < len(self.cells) else None
+    
+    def next_move(self, state, player_id, heatmap=None):
+        """Destino deste turno conferido contra o estado atual
+        
+        Retorna (válido, destino); destino igual à posição atual = ficar.
+        Com válido=False o plano precisa ser refeito.
+        """
+        index = self.step_index(state.turn_number)
+        boat = state.players[player_id].boat
+        if index is None or boat is None:
+            return False, None
+        
+        expected_pos = self.cells[index - 1] if index else self.start
+        if boat.get_position() != expected_pos or boat.moves_remaining != self.budget:
+            return False, None
+        
+        target = self.cells[index]
+        if target != expected_pos and not state.is_valid_move(player_id, *target):
+            return False, None
+        
+        if heatmap is not None and heatmap.score(*target, self.weights) < self.TOLERANCE * self.expected[index]:
+            return False, None
+        return True, target
+
+
+class RoutePlanner:
+    """Planejamento por programação dinâmica sobre (turno, célula, orçamento)
+    
+    O campo de peixes de cada turno futuro vem do mapa do turno atual
+    convoluído pela distribuição de deriva de um turno inteiro (peixes que
+    saem do tabuleiro somem). V_t[b] é o valor de terminar o turno t numa
+    célula com orçamento b; o próximo turno é alcançado por um máximo no
+    losango de raio b (a tabela de alcance do orçamento), que descarta de
+    uma vez todas as células dominadas. Coletar um peixe gasta um ponto de
+    orçamento para sempre, então o ramo "coletou" usa o orçamento b - 1.
+    Tamanho do tabuleiro, alcance de coleta e correntes vêm das regras da
+    partida (state.rules) a cada plano.
+    """
+    
+    def __init__(self, horizon=3, discount=0.8, weights=AI_WEIGHTS):
+        self.horizon = horizon
+        self.discount = discount
+        self.weights = weights
+    
+    def fish_fields(self, heatmap, turn_distribution_probs):
+        """Mapas (captura, probabilidade de coleta) para cada turno do horizonte"""
+        # A convolução soma grid[x + d] * k[d]; a deriva leva x para x + v
+        drift_kernel = turn_distribution_probs[::-1, ::-1]
+        reach_kernel = get_reach_kernel(heatmap.collection_distance)
+        catch_kernel = get_catch_kernel(self.weights, heatmap.collection_distance)
+        
+        fields = [(heatmap.catch_for(self.weights), heatmap.near)]
+        landing = heatmap.landing
+        for _ in range(1, self.horizon):
+            landing = convolve(landing, drift_kernel)
+            catch = convolve(landing, catch_kernel)
+            near = np.minimum(convolve(landing, reach_kernel), 1.0)
+            fields.append((catch, near))
+        return fields
+    
+    def value_tables(self, fields, budget):
+        """Tabelas V_t[b] de trás para frente, para b = 0..budget"""
+        size = fields[0][0].shape[0]
+        values = [None] * len(fields)
+        following = np.zeros((budget + 1, size, size))
+        
+        for t in range(len(fields) - 1, -1, -1):
+            catch, near = fields[t]
+            reachable = np.array([diamond_max(following[b], b) for b in range(budget + 1)])
+            
+            current = np.empty_like(following)
+            for b in range(budget + 1):
+                caught = reachable[max(0, b - 1)]
+                current[b] = catch + self.discount * (near * caught + (1 - near) * reachable[b])
+            values[t] = current
+            following = current
+        return values
+    
+    def plan(self, state, player_id, heatmap, future_counts=None):
+        """Monta um plano a partir da posição atual do barco"""
+        player = state.players[player_id]
+        boat = player.boat
+        budget = boat.moves_remaining
+        
+        if future_counts is None:
+            future_counts = state.deck_trackers[player_id].counts
+        turn_distribution = sum_distribution(future_counts, state.num_players,
+                                             state.rules.current_multiplier)
+        
+        fields = self.fish_fields(heatmap, turn_distribution.probs)
+        values = self.value_tables(fields, budget)
+        
+        # Primeiro passo: só destinos realmente livres (ou ficar)
+        start = boat.get_position()
+        candidates = [start] + state.get_valid_moves(player_id)
+        first = values[0][budget]
+        cells = [max(candidates, key=lambda cell: first[cell])]
+        
+        # Passos seguintes: melhor célula do losango, sem considerar barcos
+        size = state.board_size
+        for t in range(1, len(values)):
+            x, y = cells[-1]
+            reach = [(x, y)] + diamond_cells(size, x, y, budget) if budget > 0 else [(x, y)]
+            table = values[t][budget]
+            cells.append(max(reach, key=lambda cell: table[cell]))
+        
+        expected = [float(fields[t][0][cell]) for t, cell in enumerate(cells)]
+        return RoutePlan(state.turn_number, start, budget, cells, expected,
+                         float(first[cells[0]]), self.weights)
@@ -0,0 +1,93 @@
+# src/rules.py - Regras de uma partida (tabuleiro, movimento, vitória e baralho)
+
+from config import *
+
+class RuleSet:
+    """Regras que valem para uma única partida
+    
+    Os valores padrão vêm de config.py. Cada GameState guarda o seu
+    RuleSet e todos os componentes (peixes, barcos, baralho, IA, mapas)
+    leem as regras dele, então variantes, capítulos da história e
+    simulações com regras diferentes convivem no mesmo processo.
+    O objeto é imutável: use replace para derivar uma variante.
+    
+    current_multiplier multiplica o vetor total das cartas na deriva dos
+    peixes (correntes mais fortes).
+    """
+    
+    FIELDS = ('board_size', 'movement_limit', 'collection_distance', 'winning_fish_count',
+              'initial_fish_per_player', 'deck_copies', 'current_multiplier')
+    
+    __slots__ = FIELDS
+    
+    def __init__(self, board_size=BOARD_SIZE, movement_limit=MOVEMENT_LIMIT,
+                 collection_distance=COLLECTION_DISTANCE, winning_fish_count=WINNING_FISH_COUNT,
+                 initial_fish_per_player=INITIAL_FISH_PER_PLAYER, deck_copies=DECK_COPIES,
+                 current_multiplier=1):
+        if board_size < 2 or movement_limit < 0 or collection_distance < 0:
+            raise ValueError("Regras inválidas para o tabuleiro ou o movimento")
+        if winning_fish_count < 1 or current_multiplier < 1 or not deck_copies:
+            raise ValueError("Regras inválidas para a vitória, as correntes ou o baralho")
+        
+        object.__setattr__(self, 'board_size', int(board_size))
+        object.__setattr__(self, 'movement_limit', int(movement_limit))
+        object.__setattr__(self, 'collection_distance', int(collection_distance))
+        object.__setattr__(self, 'winning_fish_count', int(winning_fish_count))
+        object.__setattr__(self, 'initial_fish_per_player', int(initial_fish_per_player))
+        object.__setattr__(self, 'deck_copies', tuple(int(n) for n in deck_copies))
+        object.__setattr__(self, 'current_multiplier', int(current_multiplier))
+    
+    def __setattr__(self, name, value):
+        raise AttributeError("RuleSet é imutável; use replace()")
+    
+    def replace(self, **changes):
+        """Cópia com alguns campos trocados"""
+        values = self.to_dict()
+        values.update(changes)
+        return RuleSet(**values)
+    
+    def card_copies(self, vector):
+        """Quantidade de cópias de um vetor no baralho"""
+        magnitude = abs(vector[0]) + abs(vector[1])
+        return self.deck_copies[min(magnitude, len(self.deck_copies) - 1)]
+    
+    def drift(self, vector):
+        """Deslocamento dos peixes para o vetor total das cartas"""
+        return (vector[0] * self.current_multiplier, vector[1] * self.current_multiplier)
+    
+    def to_dict(self):
+        """Campos como dicionário (JSON, chaves de cache)"""
+        return {name: getattr(self, name) for name in self.FIELDS}
+    
+    @classmethod
+    def from_dict(cls, data):
+        """Reconstrói a partir de to_dict (campos ausentes usam o padrão)"""
+        return cls(**{name: data[name] for name in cls.FIELDS if name in data})
+    
+    def key(self):
+        """Tupla que identifica as regras (igualdade e hash)"""
+        return tuple(getattr(self, name) for name in self.FIELDS)
+    
+    def __eq__(self, other):
+        return isinstance(other, RuleSet) and self.key() == other.key()
+    
+    def __hash__(self):
+        return hash(self.key())
+    
+    def __copy__(self):
+        return self
+    
+    def __deepcopy__(self, memo):
+        return self
+    
+    def __reduce__(self):
+        return (RuleSet.from_dict, (self.to_dict(),))
+    
+    def __repr__(self):
+        changed = {name: value for name, value in self.to_dict().items()
+                   if value != getattr(DEFAULT_RULES, name, value)}
+        return f"RuleSet({', '.join(f'{k}={v!r}' for k, v in changed.items())})"
+
+
+# Regras de config.py
+DEFAULT_RULES = RuleSet()
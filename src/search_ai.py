@@ -0,0 +1,213 @@
+# src/search_ai.py - Busca Monte Carlo para a escolha de cartas
+
+import math
+import random
+import time
+import numpy as np
+from config import *
+from src.zobrist import get_zobrist_keys, derive_key
+
+class CardSearch:
+    """Escolha de carta por amostragem, com orçamento de tempo (anytime)
+    
+    Cada iteração escolhe uma carta da mão por UCB1, sorteia as cartas
+    desconhecidas dos oponentes a partir do que resta do baralho, simula a
+    movimentação (cada barco vai para perto do peixe mais próximo após a
+    deriva), deriva e coleta com make_*/unmake e pontua o resultado.
+    Quando o tempo (ou, se dado, o limite de iterações) acaba, devolve a
+    carta com a melhor média até ali.
+    
+    Com uma tabela de transposição, a recompensa de cada rollout é guardada
+    pela posição após a deriva (ver rollout_key): ordens de cartas com a
+    mesma soma de vetores levam à mesma posição e reaproveitam a entrada.
+    """
+    
+    EXPLORATION = 1.2
+    
+    def __init__(self, state, player_id, time_budget, max_iterations=None, rng=random,
+                 should_stop=None, table=None):
+        self.state = state
+        self.player_id = player_id
+        self.time_budget = time_budget
+        self.max_iterations = max_iterations
+        self.rng = rng
+        self.should_stop = should_stop  # cancelamento vindo de outra thread
+        self.table = table
+        
+        self.iterations = 0
+        self.stats = {}  # vetor -> [visitas, soma das recompensas]
+    
+    def unknown_pool(self):
+        """Vetores que o jogador não vê: baralho, mãos e cartas viradas dos oponentes"""
+        state = self.state
+        pool = [card.vector for card in state.deck.cards]
+        for player in state.players:
+            if player.id == self.player_id:
+                continue
+            pool.extend(card.vector for card in player.hand.cards)
+            if player.id in state.cards_played:
+                pool.append(state.cards_played[player.id].vector)
+        return pool
+    
+    def movement_order(self):
+        """Jogadores na ordem da fase de movimentação"""
+        state = self.state
+        start = state.start_player_token
+        return [state.players[(start + i) % state.num_players] for i in range(state.num_players)]
+    
+    def greedy_target(self, player, fish):
+        """Destino (ou None para ficar) mais perto de um peixe previsto"""
+        boat = player.boat
+        radius = boat.moves_remaining
+        if radius <= 0:
+            return None
+        
+        # Caminho direto: anda até radius casas rumo ao peixe mais próximo
+        distances = np.abs(fish - (boat.x, boat.y)).sum(axis=1)
+        nearest = int(np.argmin(distances))
+        if distances[nearest] == 0:
+            return None
+        dx = int(fish[nearest][0]) - boat.x
+        dy = int(fish[nearest][1]) - boat.y
+        step_x = max(-radius, min(radius, dx))
+        rest = radius - abs(step_x)
+        step_y = max(-rest, min(rest, dy))
+        target = (boat.x + step_x, boat.y + step_y)
+        if not self.state.occupancy.is_occupied(*target):
+            return target
+        
+        # Caminho bloqueado por outro barco: avalia todos os destinos
+        moves = self.state.occupancy.valid_moves(boat.x, boat.y, radius)
+        if not moves:
+            return None
+        
+        cells = np.array([(boat.x, boat.y)] + moves, dtype=np.int32)
+        distances = np.abs(cells[:, None, :] - fish[None, :, :]).sum(axis=2).min(axis=1)
+        best = int(np.argmin(distances))  # empate favorece ficar parado
+        return moves[best - 1] if best else None
+    
+    def rollout(self, vector):
+        """Simula o resto do turno com a carta dada; retorna a recompensa"""
+        state = self.state
+        depth = len(state.undo_stack)
+        
+        opponents = state.num_players - 1
+        pool = self.unknown_pool()
+        if len(pool) >= opponents:
+            sampled = self.rng.sample(pool, opponents)
+        else:
+            sampled = [self.rng.choice(MOVEMENT_CARDS) for _ in range(opponents)]
+        
+        drift = [vector[0], vector[1]]
+        for dx, dy in sampled:
+            drift[0] += dx
+            drift[1] += dy
+        drift = state.rules.drift(drift)
+        
+        # A deriva não depende dos barcos: derivar antes de mover dá o mesmo
+        # resultado e a posição já derivada serve de chave
+        state.make_drift(drift)
+        key = self.rollout_key() if self.table is not None else None
+        reward = self.table.probe(key) if key is not None else None
+        
+        if reward is None:
+            fish = state.fish.positions_array()
+            if len(fish):
+                for player in self.movement_order():
+                    if player.boat and not player.has_moved:
+                        target = self.greedy_target(player, fish)
+                        if target:
+                            state.make_move_boat(player.id, target[0], target[1])
+            
+            scorers = state.make_collect()
+            reward = self.score(scorers)
+            if key is not None:
+                self.table.store(key, reward)
+        
+        state.undo_to(depth)
+        return reward
+    
+    def rollout_key(self):
+        """Chave da posição após a deriva, sem o turno
+        
+        Barcos e peixes (position_hash) mais o que o resto do rollout lê:
+        quem começa a movimentação, o orçamento de cada barco e o placar
+        do jogador que busca.
+        """
+        state = self.state
+        keys = state.zobrist or get_zobrist_keys(state.board_size, state.num_players,
+                                                 state.rules.winning_fish_count)
+        budgets = tuple((p.boat.moves_remaining, p.has_moved) if p.boat else None
+                        for p in state.players)
+        return derive_key(keys.position_hash(state), 'rollout', self.player_id,
+                          state.start_player_token, budgets,
+                          state.players[self.player_id].fish_collected)
+    
+    def score(self, scorers):
+        """Peixes próprios menos a média dos oponentes, com bônus de vitória"""
+        state = self.state
+        mine = scorers.count(self.player_id)
+        theirs = (len(scorers) - mine) / max(1, state.num_players - 1)
+        reward = mine - theirs
+        
+        me = state.players[self.player_id]
+        if me.fish_collected >= state.rules.winning_fish_count:
+            reward += 5
+        
+        # Desempate: terminar perto dos peixes que sobraram
+        remaining = state.fish.positions_array()
+        if len(remaining):
+            nearest = np.abs(remaining - (me.boat.x, me.boat.y)).sum(axis=1).min()
+            reward -= 0.25 * nearest / (2 * state.board_size)
+        return reward
+    
+    def select(self, vectors):
+        """UCB1 sobre os vetores distintos da mão"""
+        for vector in vectors:
+            if self.stats[vector][0] == 0:
+                return vector
+        
+        log_total = math.log(self.iterations)
+        best, best_value = None, -math.inf
+        for vector in vectors:
+            visits, total = self.stats[vector]
+            value = total / visits + self.EXPLORATION * math.sqrt(log_total / visits)
+            if value > best_value:
+                best, best_value = vector, value
+        return best
+    
+    def run(self):
+        """Busca até o orçamento acabar; retorna a carta escolhida
+        
+        Com max_iterations o relógio não é consultado: a busca só para pelas
+        iterações ou por should_stop, então o resultado não depende da
+        velocidade da máquina. Sem ele, vale o orçamento de tempo.
+        """
+        player = self.state.players[self.player_id]
+        cards = player.hand.cards
+        if not cards or not player.boat:
+            return None
+        
+        vectors = list(dict.fromkeys(card.vector for card in cards))
+        self.stats = {vector: [0, 0.0] for vector in vectors}
+        if len(vectors) == 1 or not len(self.state.fish):
+            return cards[0]
+        
+        deadline = None if self.max_iterations else time.perf_counter() + self.time_budget
+        while True:
+            vector = self.select(vectors)
+            stats = self.stats[vector]
+            stats[0] += 1
+            stats[1] += self.rollout(vector)
+            self.iterations += 1
+            
+            if deadline is None:
+                if self.iterations >= self.max_iterations:
+                    break
+            elif self.iterations >= len(vectors) and time.perf_counter() >= deadline:
+                break
+            if self.should_stop and self.should_stop():
+                break
+        
+        best = max(vectors, key=lambda v: self.stats[v][1] / max(1, self.stats[v][0]))
+        return next(card for card in cards if card.vector == best)
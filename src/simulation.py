@@ -0,0 +1,80 @@
+# src/simulation.py - Partidas IA contra IA sem janela
+
+from config import *
+from src.game_context import GameContext
+from src.ai import AIController
+from src.zobrist import TranspositionTable
+
+def choose_ai_boat_position(state):
+    """Posição inicial do barco para um jogador IA"""
+    return state.random_free_position(state.fish.positions(), state.random.stream('placement'))
+
+def play_ai_turn(state, controllers):
+    """Executa a ação do jogador da vez; retorna False se não houve ação"""
+    player = state.current_player
+    controller = controllers[player.id]
+    
+    if state.phase == 'setup':
+        pos = choose_ai_boat_position(state)
+        return pos is not None and state.place_boat(player.id, pos[0], pos[1])
+    
+    if state.phase == 'play_cards':
+        card = controller.choose_card(state.get_ai_view(player.id))
+        if card is None:
+            card = controller.card_ai.rng.choice(player.hand.cards)
+        return state.play_card(player.id, card)
+    
+    if state.phase == 'movement':
+        move = controller.choose_move(state.get_ai_view(player.id))
+        if move and state.move_boat(player.id, move[0], move[1]):
+            return True
+        return state.skip_movement(player.id)
+    
+    return False
+
+def play_headless_game(num_players=2, ai_difficulties=None, max_turns=200,
+                       search_iterations=None, seed=None, rules=None):
+    """Joga uma partida completa só com IAs e retorna o resumo
+    
+    search_iterations limita a busca de cartas por iterações em vez de
+    tempo, para resultados que não dependem da velocidade da máquina.
+    Com seed (e search_iterations) a partida é reproduzível, mesmo com
+    outras partidas rodando no mesmo processo. rules é um RuleSet
+    (padrão: as regras de config.py).
+    """
+    if ai_difficulties is None:
+        ai_difficulties = ['MEDIO'] * num_players
+    
+    context = GameContext(num_players, ai_players=[True] * num_players, headless=True,
+                          rules=rules, seed=seed)
+    state = context.state
+    state.enable_hashing()
+    
+    # Uma tabela por partida, compartilhada pelas IAs (avaliações são por jogador)
+    table = TranspositionTable()
+    controllers = [
+        AIController(player, ai_difficulties[player.id], table, search_iterations,
+                     state.random.ai(player.id))
+        for player in state.players
+    ]
+    
+    state.setup_game()
+    while (not state.is_game_over() and not state.is_stalemate()
+           and state.turn_number <= max_turns):
+        turn = state.turn_number
+        if not play_ai_turn(state, controllers):
+            break
+        state.events.clear()
+        if state.turn_number != turn:
+            table.new_generation()
+    
+    winners = state.winner if isinstance(state.winner, list) else [state.winner]
+    return {
+        'winners': [p.id for p in winners if p is not None],
+        'turns': state.turn_number,
+        'fish': [p.fish_collected for p in state.players],
+        'seed': state.random.seed,
+        'finished': state.is_game_over(),
+        'stalemate': state.is_stalemate(),
+        'table': table.get_stats()
+    }
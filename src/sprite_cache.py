@@ -0,0 +1,101 @@
+# src/sprite_cache.py - Variantes escaladas e rotacionadas dos sprites
+
+import math
+from collections import OrderedDict
+import pygame
+
+class SpriteCache:
+    """Sprites escalados e rotacionados, calculados uma única vez
+    
+    Peixes e barcos pedem aqui a versão do sprite no tamanho da célula (e,
+    no barco, no ângulo atual) em vez de chamar pygame.transform a cada
+    quadro. Os ângulos são arredondados para rotation_steps posições, então
+    um barco girando gera no máximo rotation_steps superfícies. O total de
+    bytes guardados é limitado (LRU); invalidate descarta tudo quando a
+    tela muda de tamanho.
+    
+    As chaves usam id() do sprite original; a entrada guarda uma referência
+    a ele, então o id não é reaproveitado enquanto a variante existir.
+    """
+    
+    def __init__(self, max_bytes=32 * 1024 * 1024, rotation_steps=72):
+        self.max_bytes = max_bytes
+        self.rotation_steps = rotation_steps
+        self.entries = OrderedDict()  # chave -> (original, variante, bytes)
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+    
+    def quantize_angle(self, angle):
+        """Ângulo arredondado para o passo de rotação mais próximo"""
+        step = 360 / self.rotation_steps
+        return (round(angle / step) % self.rotation_steps) * step
+    
+    def lookup(self, key):
+        """Variante guardada (e marcada como recente) ou None"""
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return entry[1]
+    
+    def store(self, key, original, variant):
+        """Guarda uma variante, descartando as mais antigas acima do limite"""
+        width, height = variant.get_size()
+        size = width * height * variant.get_bytesize()
+        self.entries[key] = (original, variant, size)
+        self.total_bytes += size
+        while self.total_bytes > self.max_bytes and len(self.entries) > 1:
+            _, (_, _, old_size) = self.entries.popitem(last=False)
+            self.total_bytes -= old_size
+        return variant
+    
+    def scaled(self, sprite, size):
+        """Sprite redimensionado para size (largura, altura)"""
+        size = tuple(size)
+        if sprite.get_size() == size:
+            return sprite
+        key = ('scale', id(sprite), size)
+        variant = self.lookup(key)
+        if variant is None:
+            variant = self.store(key, sprite, pygame.transform.scale(sprite, size))
+        return variant
+    
+    def rotated(self, sprite, angle, size=None):
+        """Sprite (opcionalmente escalado) girado para o passo mais próximo de angle"""
+        size = tuple(size) if size is not None else sprite.get_size()
+        angle = self.quantize_angle(angle)
+        if math.isclose(angle, 0):
+            return self.scaled(sprite, size)
+        key = ('rotate', id(sprite), size, angle)
+        variant = self.lookup(key)
+        if variant is None:
+            base = self.scaled(sprite, size)
+            variant = self.store(key, sprite, pygame.transform.rotate(base, angle))
+        return variant
+    
+    def invalidate(self):
+        """Descarta todas as variantes (ex.: a tela mudou de tamanho)"""
+        self.entries.clear()
+        self.total_bytes = 0
+    
+    def hit_rate(self):
+        """Fração de pedidos servidos pelo cache"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+    
+    def get_stats(self):
+        """Estatísticas de uso"""
+        return {
+            'variants': len(self.entries),
+            'bytes': self.total_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hit_rate()
+        }
+
+
+# Instância global (desenho só na thread principal)
+sprite_cache = SpriteCache()
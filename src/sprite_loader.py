@@ -2,21 +2,123 @@
 
 import pygame
 import os
+import xml.etree.ElementTree as ET
 from config import *
 
 # Inicializa pygame
 pygame.init()
 pygame.display.set_mode((1, 1), pygame.NOFRAME)
 
+def sprite_key(name):
+    """Nome sem a extensão .png (o XML às vezes a inclui)"""
+    return name[:-4] if name.endswith('.png') else name
+
+def sheet_scale(xml_name):
+    """Escala de uma folha pelo nome: @2 e -double são de alta resolução"""
+    stem = os.path.splitext(xml_name)[0]
+    return 2 if stem.endswith('@2') or stem.endswith('-double') else 1
+
+def is_high_dpi():
+    """Monitor grande o bastante para as folhas de alta resolução"""
+    try:
+        sizes = pygame.display.get_desktop_sizes()
+    except (AttributeError, pygame.error):
+        return False
+    return any(width >= HIGH_DPI_MIN_WIDTH for width, _ in sizes)
+
+
+class TextureAtlas:
+    """Folha de sprites descrita por um XML TextureAtlas
+    
+    O índice de SubTexture é lido na construção; a imagem só é decodificada
+    no primeiro get, uma única vez. Cada sprite é uma subsurface (uma vista
+    da folha, sem cópia de pixels). Se a escala da folha difere de scale,
+    a folha inteira é redimensionada uma vez e os retângulos acompanham.
+    """
+    
+    def __init__(self, xml_path, scale=1):
+        self.xml_path = xml_path
+        self.source_scale = sheet_scale(os.path.basename(xml_path))
+        self.scale = scale
+        
+        root = ET.parse(xml_path).getroot()
+        self.image_path = os.path.join(os.path.dirname(xml_path), root.get('imagePath'))
+        self.regions = {}
+        for sub in root.iter('SubTexture'):
+            rect = tuple(int(sub.get(k)) for k in ('x', 'y', 'width', 'height'))
+            self.regions[sprite_key(sub.get('name'))] = rect
+        
+        self.sheet = None
+        self.sprites = {}
+    
+    def __contains__(self, name):
+        return sprite_key(name) in self.regions
+    
+    def names(self):
+        """Nomes dos sprites da folha"""
+        return list(self.regions)
+    
+    def load_sheet(self):
+        """Decodifica (e, se preciso, reescala) a imagem da folha"""
+        sheet = pygame.image.load(self.image_path).convert_alpha()
+        if self.scale != self.source_scale:
+            factor = self.scale / self.source_scale
+            width, height = sheet.get_size()
+            sheet = pygame.transform.smoothscale(sheet, (round(width * factor), round(height * factor)))
+        self.sheet = sheet
+        print(f"Atlas carregado: {os.path.basename(self.image_path)} - {sheet.get_size()}")
+    
+    def get(self, name):
+        """Sprite da folha (subsurface) ou None"""
+        name = sprite_key(name)
+        sprite = self.sprites.get(name)
+        if sprite is None and name in self.regions:
+            if self.sheet is None:
+                self.load_sheet()
+            factor = self.scale / self.source_scale
+            x, y, width, height = (round(v * factor) for v in self.regions[name])
+            sprite = self.sheet.subsurface(pygame.Rect(x, y, width, height))
+            self.sprites[name] = sprite
+        return sprite
+
+
+def load_atlases(high_dpi=None):
+    """Atlas de SPRITE_ATLASES, escolhendo a variante @2 em monitores grandes"""
+    if high_dpi is None:
+        high_dpi = is_high_dpi()
+    scale = 2 if high_dpi else 1
+    
+    atlases = {}
+    for sheet_name, (normal, high) in SPRITE_ATLASES.items():
+        xml_path = os.path.join(IMAGES_PATH, high if high_dpi else normal)
+        if not os.path.exists(xml_path):
+            print(f"Atlas nao encontrado: {xml_path}")
+            continue
+        try:
+            atlases[sheet_name] = TextureAtlas(xml_path, scale)
+        except (ET.ParseError, TypeError, ValueError) as e:
+            print(f"Erro ao ler atlas {xml_path}: {e}")
+    return atlases
+
+
 class SpriteManager:
-    """Gerenciador de sprites PNG"""
+    """Gerenciador de sprites
     
-    def __init__(self):
+    Os sprites vêm dos atlas de SPRITE_ATLASES; os PNGs avulsos em
+    IMAGES_PATH só são abertos para nomes que nenhum atlas tem.
+    """
+    
+    # Nomes alternativos
+    ALIASES = {'fish_gray': 'fish_grey'}
+    
+    def __init__(self, high_dpi=None):
         self.sprites = {}
-        self.load_png_sprites()
+        self.atlases = load_atlases(high_dpi)
+        if not self.atlases:
+            self.load_png_sprites()
     
     def load_png_sprites(self):
-        """Carrega sprites PNG individuais"""
+        """Carrega sprites PNG individuais (sem atlas disponível)"""
         print("Carregando sprites PNG profissionais...")
         
         # Sprites necessários
@@ -49,7 +151,7 @@ class SpriteManager:
                     
                     print(f"Sprite carregado: {sprite_name} - {sprite.get_size()}")
                     sprites_carregados += 1
-                    
+                
                 except Exception as e:
                     print(f"Erro ao carregar {sprite_name}: {e}")
             else:
@@ -65,15 +167,37 @@ class SpriteManager:
             self.sprites['fish_gray'] = self.sprites['fish_grey']
     
     def get_sprite(self, sprite_name, sheet_name=None):
-        """Retorna sprite pelo nome"""
-        nome_limpo = sprite_name.replace('.png', '')
+        """Retorna sprite pelo nome (sheet_name restringe a um atlas)"""
+        nome_limpo = sprite_key(sprite_name)
+        nome_limpo = self.ALIASES.get(nome_limpo, nome_limpo)
         
-        if sprite_name in self.sprites:
-            return self.sprites[sprite_name]
-        elif nome_limpo in self.sprites:
+        if nome_limpo in self.sprites:
             return self.sprites[nome_limpo]
         
-        return None
+        if sheet_name is not None:
+            atlases = [self.atlases[sheet_name]] if sheet_name in self.atlases else []
+        else:
+            atlases = list(self.atlases.values())
+        for atlas in atlases:
+            sprite = atlas.get(nome_limpo)
+            if sprite is not None:
+                self.sprites[nome_limpo] = sprite
+                return sprite
+        
+        return self.load_loose_sprite(nome_limpo)
+    
+    def load_loose_sprite(self, nome_limpo):
+        """PNG avulso em IMAGES_PATH, aberto só se nenhum atlas tem o nome"""
+        sprite_path = os.path.join(IMAGES_PATH, nome_limpo + '.png')
+        if not os.path.exists(sprite_path):
+            return None
+        try:
+            sprite = pygame.image.load(sprite_path).convert_alpha()
+        except pygame.error as e:
+            print(f"Erro ao carregar {sprite_path}: {e}")
+            return None
+        self.sprites[nome_limpo] = sprite
+        return sprite
     
     def get_fish_sprite(self, fish_color):
         """Retorna peixe por cor"""
@@ -90,16 +214,19 @@ class SpriteManager:
                           key=lambda c: sum((a-b)**2 for a, b in zip(c, fish_color)))
         
         sprite_name = color_map[closest_color]
-        return self.get_sprite(sprite_name)
+        return self.get_sprite(sprite_name, 'fish')
     
     def get_ship_sprite(self, player_id):
         """Retorna navio por ID do jogador"""
         ship_names = ['ship (1)', 'ship (2)', 'ship (3)', 'ship (4)']
         ship_name = ship_names[player_id % len(ship_names)]
-        return self.get_sprite(ship_name)
+        return self.get_sprite(ship_name, 'ships')
     
     def debug_sprites(self):
         """Lista sprites carregados"""
+        for sheet_name, atlas in self.atlases.items():
+            print(f"Atlas {sheet_name}: {len(atlas.regions)} sprites, escala {atlas.scale}, "
+                  f"{'decodificado' if atlas.sheet is not None else 'não decodificado'}")
         print(f"Sprites carregados: {len(self.sprites)}")
         for nome in sorted(self.sprites.keys()):
             sprite = self.sprites[nome]
@@ -118,4 +245,3 @@ def init_sprites():
     global sprite_manager
     sprite_manager = SpriteManager()
     return sprite_manager
-
@@ -5,6 +5,7 @@ import json
 import os
 from config import *
 from src.game import Game
+from src.rules import DEFAULT_RULES
 from src.utils import draw_text, draw_button, create_gradient_surface, load_json, save_json
 
 class StoryChapter:
@@ -28,6 +29,16 @@ class StoryChapter:
         self.completed = False
         self.best_score = None
         self.attempts = 0
+    
+    def get_rules(self):
+        """Regras da partida do capítulo (RuleSet)"""
+        changes = {}
+        if 'fish_required' in self.win_conditions:
+            changes['winning_fish_count'] = self.win_conditions['fish_required']
+        if self.special_rules.get('stronger_currents'):
+            # Cartas têm efeito dobrado na deriva dos peixes
+            changes['current_multiplier'] = 2
+        return DEFAULT_RULES.replace(**changes)
 
 
 class StoryMode:
@@ -221,6 +232,9 @@ class StoryMode:
         """Inicia o jogo do capítulo atual"""
         chapter = self.current_chapter
         
+        # Uma partida anterior ainda aberta não pode deixar a IA rodando
+        self.close()
+        
         # Cria jogo com configurações do capítulo
         self.current_game = StoryGame(
             self.screen,
@@ -239,7 +253,9 @@ class StoryMode:
                 if self.state == 'menu':
                     return 'quit'
                 else:
+                    # Abandona o capítulo: encerra a partida e a thread da IA
                     self.state = 'menu'
+                    self.close()
                     return None
         
         if self.state == 'menu':
@@ -254,13 +270,14 @@ class StoryMode:
                 
                 if result == 'quit':
                     self.state = 'menu'
-                    self.current_game = None
+                    self.close()
                 
                 return None
         
         elif self.state in ['victory', 'defeat']:
             if event.type == pygame.KEYDOWN or event.type == pygame.MOUSEBUTTONDOWN:
                 self.state = 'menu'
+                self.close()
         
         return None
     
@@ -290,6 +307,12 @@ class StoryMode:
         
         return None
     
+    def close(self):
+        """Fecha a partida do capítulo (cancela a IA em andamento)"""
+        if self.current_game:
+            self.current_game.close()
+        self.current_game = None
+    
     def update(self, dt):
         """Atualiza o modo história"""
         if self.state == 'game' and self.current_game:
@@ -586,28 +609,6 @@ class StoryGame(Game):
     """Versão modificada do jogo para o modo história"""
     
     def __init__(self, screen, username, num_players, ai_difficulty, chapter):
-        super().__init__(screen, username, num_players, ai_difficulty)
+        # Regras especiais e condições de vitória valem só para esta partida
+        super().__init__(screen, username, num_players, ai_difficulty, chapter.get_rules())
         self.chapter = chapter
-        
-        # Aplica regras especiais
-        self.apply_special_rules()
-        
-        # Modifica condições de vitória
-        if 'fish_required' in chapter.win_conditions:
-            global WINNING_FISH_COUNT
-            self.original_winning_count = WINNING_FISH_COUNT
-            WINNING_FISH_COUNT = chapter.win_conditions['fish_required']
-    
-    def apply_special_rules(self):
-        """Aplica regras especiais do capítulo"""
-        if 'stronger_currents' in self.chapter.special_rules:
-            # Dobra o efeito das cartas
-            for player in self.players:
-                # Isso seria implementado modificando as cartas
-                pass
-    
-    def __del__(self):
-        """Restaura configurações originais"""
-        if hasattr(self, 'original_winning_count'):
-            global WINNING_FISH_COUNT
-            WINNING_FISH_COUNT = self.original_winning_count
\ No newline at end of file
@@ -2,43 +2,94 @@
 
 import pygame
 import os
+from collections import OrderedDict
 from config import *
 
 class TileManager:
-    """Gerenciador de tiles para o jogo"""
+    """Gerenciador de tiles para o jogo
     
-    def __init__(self):
-        self.tiles = {}
-        self.water_tile = None
-        self.load_tiles()
+    Na construção só lista os nomes dos arquivos em TILES_PATH; cada tile
+    é decodificado (e escalado para TILE_SIZE) no primeiro get_tile. Os
+    tiles decodificados ficam num LRU limitado em bytes. Uma única
+    instância (get_tile_manager) é compartilhada por todos os tabuleiros.
+    """
     
-    def load_tiles(self):
-        """Carrega todos os tiles disponíveis"""
-        print("Carregando tiles...")
-        
-        # Carrega o tile de água específico
-        water_path = os.path.join(TILES_PATH, WATER_TILE)
-        if os.path.exists(water_path):
-            try:
-                self.water_tile = pygame.image.load(water_path).convert_alpha()
-                # Redimensiona para o tamanho correto se necessário
-                if self.water_tile.get_size() != (TILE_SIZE, TILE_SIZE):
-                    self.water_tile = pygame.transform.scale(self.water_tile, (TILE_SIZE, TILE_SIZE))
-                print(f"✓ Tile de água carregado: {WATER_TILE}")
-            except Exception as e:
-                print(f"✗ Erro ao carregar tile de água: {e}")
-                self.create_fallback_water_tile()
+    def __init__(self, tiles_path=TILES_PATH, max_bytes=8 * 1024 * 1024):
+        self.tiles_path = tiles_path
+        self.max_bytes = max_bytes
+        self.tiles = OrderedDict()  # nome -> (tile, bytes)
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.fallback_water_tile = None
+        self.index_tiles()
+    
+    def index_tiles(self):
+        """Lista os tiles disponíveis sem decodificar nenhum"""
+        if os.path.isdir(self.tiles_path):
+            self.available = {name for name in os.listdir(self.tiles_path) if name.endswith('.png')}
         else:
-            print(f"✗ Tile de água não encontrado: {water_path}")
-            self.create_fallback_water_tile()
+            print(f"✗ Pasta de tiles não encontrada: {self.tiles_path}")
+            self.available = set()
+    
+    def load_tile(self, tile_name):
+        """Decodifica um tile do disco no tamanho TILE_SIZE"""
+        tile = pygame.image.load(os.path.join(self.tiles_path, tile_name)).convert_alpha()
+        if tile.get_size() != (TILE_SIZE, TILE_SIZE):
+            tile = pygame.transform.scale(tile, (TILE_SIZE, TILE_SIZE))
+        return tile
+    
+    def get_tile(self, tile_name):
+        """Retorna um tile específico pelo nome (None se não existe)"""
+        entry = self.tiles.get(tile_name)
+        if entry is not None:
+            self.hits += 1
+            self.tiles.move_to_end(tile_name)
+            return entry[0]
+        if tile_name not in self.available:
+            return None
         
-        # Carrega outros tiles se necessário
-        self.load_additional_tiles()
+        self.misses += 1
+        try:
+            tile = self.load_tile(tile_name)
+        except (pygame.error, OSError) as e:
+            print(f"Erro ao carregar tile {tile_name}: {e}")
+            self.available.discard(tile_name)
+            return None
+        
+        width, height = tile.get_size()
+        size = width * height * tile.get_bytesize()
+        self.tiles[tile_name] = (tile, size)
+        self.total_bytes += size
+        while self.total_bytes > self.max_bytes and len(self.tiles) > 1:
+            _, (_, old_size) = self.tiles.popitem(last=False)
+            self.total_bytes -= old_size
+        return tile
+    
+    def get_water_tile(self):
+        """Retorna o tile de água"""
+        water_tile = self.get_tile(WATER_TILE)
+        if water_tile is None:
+            if self.fallback_water_tile is None:
+                print(f"✗ Tile de água não encontrado: {WATER_TILE}")
+                self.create_fallback_water_tile()
+            water_tile = self.fallback_water_tile
+        return water_tile
+    
+    def get_stats(self):
+        """Estatísticas de uso"""
+        return {
+            'available': len(self.available),
+            'loaded': len(self.tiles),
+            'bytes': self.total_bytes,
+            'hits': self.hits,
+            'misses': self.misses
+        }
     
     def create_fallback_water_tile(self):
         """Cria um tile de água de emergência caso o arquivo não seja encontrado"""
         print("Criando tile de água alternativo...")
-        self.water_tile = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
+        self.fallback_water_tile = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
         
         # Cria um padrão de água simples com variações de azul
         for y in range(TILE_SIZE):
@@ -52,28 +103,14 @@ class TileManager:
                 green_value = max(100, min(200, int(base_color + 50)))
                 
                 color = (0, green_value, blue_value, 255)
-                self.water_tile.set_at((x, y), color)
-    
-    def load_additional_tiles(self):
-        """Carrega tiles adicionais se disponíveis"""
-        if not os.path.exists(TILES_PATH):
-            return
-        
-        for filename in os.listdir(TILES_PATH):
-            if filename.endswith('.png') and filename != WATER_TILE:
-                try:
-                    tile_path = os.path.join(TILES_PATH, filename)
-                    tile = pygame.image.load(tile_path).convert_alpha()
-                    if tile.get_size() != (TILE_SIZE, TILE_SIZE):
-                        tile = pygame.transform.scale(tile, (TILE_SIZE, TILE_SIZE))
-                    self.tiles[filename] = tile
-                except Exception as e:
-                    print(f"Erro ao carregar tile {filename}: {e}")
-    
-    def get_water_tile(self):
-        """Retorna o tile de água"""
-        return self.water_tile
-    
-    def get_tile(self, tile_name):
-        """Retorna um tile específico pelo nome"""
-        return self.tiles.get(tile_name)
+                self.fallback_water_tile.set_at((x, y), color)
+
+
+# Instância global (tiles compartilhados entre partidas)
+tile_manager = None
+
+def get_tile_manager():
+    global tile_manager
+    if tile_manager is None:
+        tile_manager = TileManager()
+    return tile_manager
@@ -0,0 +1,273 @@
+# src/tournament.py - Torneio suíço / todos contra todos entre configurações de IA
+
+import json
+import multiprocessing
+import os
+import numpy as np
+from config import *
+from src.arena import match_winners
+from src.rating import Rating, update_ratings
+from src.simulation import play_headless_game
+
+# Cada repetição de um confronto divide a informação esperada por (1 + penalidade)
+REPEAT_PENALTY = 1.0
+
+# Confrontos mínimos de uma rodada suíça (campos pequenos jogam vários
+# emparelhamentos por rodada em vez de deixar o pool ocioso)
+MIN_ROUND_PAIRS = 4
+
+def normalize_config(config):
+    """Nome de dificuldade ou dicionário -> dicionário com 'name' e 'base'
+    
+    O dicionário vai direto para AIController (ver resolve_difficulty):
+    'base' escolhe a dificuldade de partida e as outras chaves, como
+    'weights', sobrescrevem a dificuldade.
+    """
+    if isinstance(config, str):
+        return {'name': config, 'base': config}
+    config = dict(config)
+    config.setdefault('base', 'MEDIO')
+    config.setdefault('name', config['base'])
+    return config
+
+def load_configs(path):
+    """Lê uma lista de configurações de um arquivo JSON"""
+    with open(path) as f:
+        return [normalize_config(config) for config in json.load(f)]
+
+def game_seed(base_seed, round_index, pair_index, game_index):
+    """Semente de uma partida; as duas ordens de assento usam a mesma"""
+    entropy = [base_seed, round_index, pair_index, game_index // 2]
+    return int(np.random.SeedSequence(entropy).generate_state(1)[0])
+
+def play_pair_game(args):
+    """Executa uma partida de um confronto (roda nos processos do pool)"""
+    round_index, pair_index, game_index, seed, config_a, config_b, max_turns, search_iterations = args
+    
+    # Jogos ímpares trocam os assentos com a mesma semente (números aleatórios comuns)
+    seats = [config_a, config_b] if game_index % 2 == 0 else [config_b, config_a]
+    result = play_headless_game(2, seats, max_turns, search_iterations, seed)
+    
+    names = [config['name'] for config in seats]
+    winners = [names[seat] for seat in match_winners(result)]
+    a_won = config_a['name'] in winners
+    b_won = config_b['name'] in winners
+    score = 0.5 if a_won == b_won else float(a_won)
+    
+    return {
+        'round': round_index,
+        'pair': pair_index,
+        'game': game_index,
+        'seed': seed,
+        'a': config_a['name'],
+        'b': config_b['name'],
+        'seats': names,
+        'winners': winners,
+        'fish': result['fish'],
+        'turns': result['turns'],
+        'finished': result['finished'],
+        'score': score
+    }
+
+
+class Tournament:
+    """Escada de classificação Glicko entre configurações de IA
+    
+    Cada rodada é um período de avaliação: os confrontos são escolhidos
+    pela informação esperada (Rating.information, com penalidade para
+    repetições; ver pairings), cada confronto joga games_per_pair partidas alternando os
+    assentos e as classificações são atualizadas ao fim da rodada. O
+    estado completo vai para o checkpoint (JSON, escrita atômica) depois
+    de cada rodada; um torneio com o mesmo checkpoint continua de onde parou.
+    """
+    
+    def __init__(self, configs, mode='swiss', games_per_pair=2, base_seed=0,
+                 max_turns=200, search_iterations=32, checkpoint=None):
+        if mode not in ('swiss', 'round-robin'):
+            raise ValueError(f"Modo de torneio desconhecido: {mode}")
+        
+        self.configs = {}
+        for config in configs:
+            config = normalize_config(config)
+            self.configs[config['name']] = config
+        if len(self.configs) < 2:
+            raise ValueError("O torneio precisa de pelo menos duas configurações")
+        
+        self.mode = mode
+        self.games_per_pair = games_per_pair
+        self.base_seed = base_seed
+        self.max_turns = max_turns
+        self.search_iterations = search_iterations
+        self.checkpoint = checkpoint
+        
+        self.round = 0
+        self.ratings = {name: Rating() for name in self.configs}
+        self.meetings = {}
+        self.results = []
+        
+        if checkpoint and os.path.exists(checkpoint):
+            self.load()
+    
+    @staticmethod
+    def pair_key(a, b):
+        """Chave de um confronto, independente da ordem"""
+        return '|'.join(sorted((a, b)))
+    
+    def load(self):
+        """Retoma o estado do checkpoint; configurações novas entram com a classificação inicial
+        
+        O modo e a semente base precisam ser os mesmos com que o checkpoint
+        foi gravado; caso contrário as rodadas seguintes não continuariam o
+        mesmo torneio.
+        """
+        with open(self.checkpoint) as f:
+            data = json.load(f)
+        
+        for field in ('mode', 'base_seed'):
+            if field in data and data[field] != getattr(self, field):
+                raise ValueError(f"O checkpoint {self.checkpoint} foi gravado com {field}="
+                                 f"{data[field]!r}, não {getattr(self, field)!r}")
+        
+        self.round = data['round']
+        self.meetings = data['meetings']
+        self.results = data['results']
+        for name, rating in data['ratings'].items():
+            if name in self.configs:
+                self.ratings[name] = Rating.from_dict(rating)
+    
+    def save(self):
+        """Grava o checkpoint (arquivo temporário + os.replace)"""
+        if not self.checkpoint:
+            return
+        data = {
+            'round': self.round,
+            'mode': self.mode,
+            'base_seed': self.base_seed,
+            'configs': list(self.configs.values()),
+            'ratings': {name: rating.to_dict() for name, rating in self.ratings.items()},
+            'meetings': self.meetings,
+            'results': self.results
+        }
+        temp_path = self.checkpoint + '.tmp'
+        with open(temp_path, 'w') as f:
+            json.dump(data, f)
+        os.replace(temp_path, self.checkpoint)
+    
+    def pair_value(self, a, b):
+        """Informação esperada de um confronto, descontadas as repetições"""
+        repeats = self.meetings.get(self.pair_key(a, b), 0)
+        return self.ratings[a].information(self.ratings[b]) / (1 + REPEAT_PENALTY * repeats)
+    
+    def pairings(self):
+        """Confrontos da próxima rodada, do mais para o menos informativo
+        
+        Suíço: escolha gulosa dos pares de maior valor, cada configuração
+        no máximo uma vez por emparelhamento (com número ímpar, uma fica de
+        fora). Enquanto a rodada tiver menos de MIN_ROUND_PAIRS confrontos,
+        outro emparelhamento é feito com os pares restantes; com três
+        configurações isso dá os três pares, não um só. Todos contra
+        todos: todos os pares, só ordenados.
+        """
+        names = list(self.configs)
+        candidates = [(self.pair_value(a, b), a, b)
+                      for i, a in enumerate(names) for b in names[i + 1:]]
+        candidates.sort(key=lambda item: -item[0])
+        
+        if self.mode == 'round-robin':
+            return [(a, b) for _, a, b in candidates]
+        
+        pairs = []
+        while candidates and len(pairs) < MIN_ROUND_PAIRS:
+            paired = set()
+            remaining = []
+            for item in candidates:
+                _, a, b = item
+                if a not in paired and b not in paired:
+                    pairs.append((a, b))
+                    paired.update((a, b))
+                else:
+                    remaining.append(item)
+            candidates = remaining
+        return pairs
+    
+    def round_jobs(self, pairs):
+        """Partidas da rodada, na ordem de prioridade dos confrontos"""
+        jobs = []
+        for pair_index, (a, b) in enumerate(pairs):
+            for game_index in range(self.games_per_pair):
+                seed = game_seed(self.base_seed, self.round, pair_index, game_index)
+                jobs.append((self.round, pair_index, game_index, seed,
+                             self.configs[a], self.configs[b],
+                             self.max_turns, self.search_iterations))
+        return jobs
+    
+    def play_round(self, pool, progress=None):
+        """Joga uma rodada no pool, atualiza as classificações e grava o checkpoint"""
+        pairs = self.pairings()
+        records = []
+        for record in pool.imap_unordered(play_pair_game, self.round_jobs(pairs)):
+            records.append(record)
+            if progress is not None:
+                progress(record)
+        records.sort(key=lambda record: (record['pair'], record['game']))
+        
+        self.ratings = update_ratings(self.ratings,
+                                      [(r['a'], r['b'], r['score']) for r in records])
+        for a, b in pairs:
+            key = self.pair_key(a, b)
+            self.meetings[key] = self.meetings.get(key, 0) + 1
+        self.results.extend(records)
+        self.round += 1
+        self.save()
+        return records
+    
+    def run(self, rounds, processes=None, progress=None, on_round=None):
+        """Joga até completar rounds rodadas (contando as do checkpoint)
+        
+        on_round(torneio) é chamado depois de cada rodada.
+        """
+        if self.round >= rounds:
+            return self.standings()
+        
+        with multiprocessing.Pool(processes) as pool:
+            while self.round < rounds:
+                self.play_round(pool, progress)
+                if on_round is not None:
+                    on_round(self)
+        return self.standings()
+    
+    def standings(self):
+        """Tabela ordenada pela classificação"""
+        points = {name: 0.0 for name in self.configs}
+        for record in self.results:
+            if record['a'] in points:
+                points[record['a']] += record['score']
+            if record['b'] in points:
+                points[record['b']] += 1 - record['score']
+        
+        rows = []
+        for name, rating in self.ratings.items():
+            low, high = rating.interval()
+            rows.append({
+                'name': name,
+                'rating': rating.rating,
+                'rd': rating.rd,
+                'low': low,
+                'high': high,
+                'games': rating.games,
+                'points': points[name]
+            })
+        rows.sort(key=lambda row: -row['rating'])
+        return rows
+
+
+def format_standings(rows):
+    """Tabela de classificação em texto"""
+    width = max(len('Configuração'), max(len(row['name']) for row in rows))
+    lines = [f"{'#':>3}  {'Configuração':<{width}}  {'Rating':>7}  {'RD':>5}  "
+             f"{'IC 95%':>15}  {'Jogos':>6}  {'Pontos':>7}"]
+    for position, row in enumerate(rows, 1):
+        lines.append(f"{position:>3}  {row['name']:<{width}}  {row['rating']:>7.1f}  "
+                     f"{row['rd']:>5.1f}  {row['low']:>7.1f}-{row['high']:<7.1f}  "
+                     f"{row['games']:>6}  {row['points']:>7.1f}")
+    return '\n'.join(lines)
@@ -0,0 +1,149 @@
+# src/tuner.py - Ajuste dos pesos da IA por entropia cruzada e autojogo
+
+import multiprocessing
+import numpy as np
+from config import *
+from src.arena import wilson_interval
+from src.tournament import game_seed, play_pair_game
+
+# Parâmetros ajustados: os pesos de AI_WEIGHTS, entre 0 e SPAN vezes o padrão
+PARAMETERS = list(AI_WEIGHTS)
+SPAN = 3.0
+
+
+class WeightTuner:
+    """Método da entropia cruzada sobre o vetor de pesos
+    
+    Cada geração sorteia population candidatos de uma normal (média e
+    desvio por parâmetro) e os coloca contra a configuração de referência
+    (a dificuldade base com os pesos padrão). Todos os candidatos da
+    geração jogam as mesmas sementes, com os assentos trocados em cada par
+    de partidas (números aleatórios comuns): a diferença entre candidatos
+    vem dos pesos, não da sorte das cartas.
+    
+    As partidas são jogadas em estágios; depois de cada estágio sai quem
+    tem o limite superior de Wilson abaixo da pontuação do pior candidato
+    da elite atual. A elite final (fração elite_fraction) define a nova
+    média e o novo desvio.
+    """
+    
+    def __init__(self, base='MEDIO', population=16, elite_fraction=0.25, games=32,
+                 stages=4, base_seed=0, max_turns=200, search_iterations=16,
+                 initial_spread=0.3, smoothing=0.7):
+        self.base = base
+        self.population = population
+        self.elite_count = max(2, int(round(population * elite_fraction)))
+        self.games = games + games % 2  # pares de assentos trocados
+        self.stages = max(1, stages)
+        self.base_seed = base_seed
+        self.max_turns = max_turns
+        self.search_iterations = search_iterations
+        self.smoothing = smoothing
+        
+        self.defaults = np.array([AI_WEIGHTS[name] for name in PARAMETERS], dtype=float)
+        self.low = np.zeros_like(self.defaults)
+        self.high = self.defaults * SPAN
+        self.mean = self.defaults.copy()
+        self.std = self.defaults * initial_spread
+        self.generation = 0
+        self.rng = np.random.default_rng(base_seed)
+        
+        self.reference = {'name': 'referencia', 'base': base}
+        self.best = None  # (pontuação, pesos)
+        self.history = []
+    
+    def weights_dict(self, vector):
+        """Vetor de parâmetros -> dicionário de pesos"""
+        return {name: round(float(value), 3) for name, value in zip(PARAMETERS, vector)}
+    
+    def sample(self):
+        """Candidatos da geração; o primeiro é sempre a média atual"""
+        samples = self.rng.normal(self.mean, self.std, (self.population, len(PARAMETERS)))
+        samples[0] = self.mean
+        return np.clip(samples, self.low, self.high)
+    
+    def stage_bounds(self):
+        """Índices de partida que fecham cada estágio (sempre pares)"""
+        pairs = self.games // 2
+        return [2 * max(1, round(pairs * (stage + 1) / self.stages))
+                for stage in range(self.stages)]
+    
+    def evaluate(self, pool, candidates, progress=None):
+        """Pontuação média de cada candidato contra a referência (NaN = eliminado)"""
+        configs = [{'name': f"g{self.generation}c{i}", 'base': self.base,
+                    'weights': self.weights_dict(vector)}
+                   for i, vector in enumerate(candidates)]
+        points = np.zeros(len(configs))
+        played = np.zeros(len(configs), dtype=int)
+        alive = list(range(len(configs)))
+        
+        start = 0
+        for end in self.stage_bounds():
+            jobs = [(self.generation, i, game_index,
+                     game_seed(self.base_seed, self.generation, 0, game_index),
+                     configs[i], self.reference, self.max_turns, self.search_iterations)
+                    for i in alive for game_index in range(start, end)]
+            for record in pool.imap_unordered(play_pair_game, jobs):
+                points[record['pair']] += record['score']
+                played[record['pair']] += 1
+                if progress is not None:
+                    progress(record)
+            start = end
+            
+            # Corrida: descarta quem não alcança mais a elite
+            if len(alive) > self.elite_count and end < self.games:
+                means = points[alive] / played[alive]
+                threshold = np.sort(means)[::-1][self.elite_count - 1]
+                alive = [i for i in alive
+                         if wilson_interval(points[i], played[i])[1] >= threshold]
+        
+        scores = np.full(len(configs), np.nan)
+        scores[alive] = points[alive] / played[alive]
+        return scores
+    
+    def step(self, pool, progress=None):
+        """Uma geração: amostra, avalia e atualiza a distribuição"""
+        candidates = self.sample()
+        scores = self.evaluate(pool, candidates, progress)
+        
+        finished = np.flatnonzero(~np.isnan(scores))
+        order = finished[np.argsort(-scores[finished], kind='stable')]
+        elite = candidates[order[:self.elite_count]]
+        
+        self.mean = self.smoothing * elite.mean(axis=0) + (1 - self.smoothing) * self.mean
+        self.std = (self.smoothing * elite.std(axis=0) + (1 - self.smoothing) * self.std
+                    + self.defaults * 0.01)  # nunca colapsa por completo
+        
+        top = order[0]
+        if self.best is None or scores[top] > self.best[0]:
+            self.best = (float(scores[top]), self.weights_dict(candidates[top]))
+        
+        summary = {
+            'generation': self.generation,
+            'best_score': float(scores[top]),
+            'mean_score': float(np.nanmean(scores)),
+            'survivors': int(len(finished)),
+            'mean': self.weights_dict(self.mean)
+        }
+        self.history.append(summary)
+        self.generation += 1
+        return summary
+    
+    def run(self, generations, processes=None, progress=None, on_generation=None):
+        """Executa as gerações; on_generation(resumo) a cada uma"""
+        with multiprocessing.Pool(processes) as pool:
+            for _ in range(generations):
+                summary = self.step(pool, progress)
+                if on_generation is not None:
+                    on_generation(summary)
+        return self.preset()
+    
+    def preset(self, weights=None):
+        """Nova entrada de AI_DIFFICULTIES: a dificuldade base com os pesos ajustados
+        
+        Por padrão usa a média final da distribuição, que é mais estável
+        que o melhor candidato isolado (este pode ter sido sorte).
+        """
+        if weights is None:
+            weights = self.weights_dict(self.mean)
+        return {**AI_DIFFICULTIES[self.base], 'weights': weights}
@@ -4,6 +4,7 @@ import os
 import json
 import random
 import math
+from collections import OrderedDict
 import pygame
 from config import *
 
@@ -71,9 +72,9 @@ def euclidean_distance(pos1, pos2):
     """Calcula a distância euclidiana entre duas posições"""
     return math.sqrt((pos1[0] - pos2[0])**2 + (pos1[1] - pos2[1])**2)
 
-def is_valid_position(x, y):
+def is_valid_position(x, y, board_size=BOARD_SIZE):
     """Verifica se uma posição é válida no tabuleiro"""
-    return 0 <= x < BOARD_SIZE and 0 <= y < BOARD_SIZE
+    return 0 <= x < board_size and 0 <= y < board_size
 
 def get_neighbors(x, y):
     """Retorna as posições vizinhas válidas"""
@@ -122,17 +123,94 @@ def screen_to_board(screen_x, screen_y):
             return (board_x, board_y)
         return None
 
+class TextCache:
+    """Fontes por (arquivo, tamanho) e textos renderizados num LRU limitado
+    
+    As superfícies devolvidas por render são compartilhadas: quem precisa
+    alterá-las (set_alpha, fill) deve usar uma cópia.
+    """
+    
+    def __init__(self, max_surfaces=512):
+        self.max_surfaces = max_surfaces
+        self.fonts = {}        # (caminho ou None, tamanho) -> Font
+        self.font_paths = {}   # nome do arquivo -> caminho ou None (não existe)
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def font_path(self, font_name):
+        """Caminho do TTF em FONTS_PATH, ou None para a fonte padrão"""
+        if not font_name:
+            return None
+        if font_name not in self.font_paths:
+            path = os.path.join(FONTS_PATH, font_name)
+            self.font_paths[font_name] = path if os.path.exists(path) else None
+        return self.font_paths[font_name]
+    
+    def get_font(self, size, font_name=None):
+        """Fonte carregada uma única vez por (arquivo, tamanho)"""
+        key = (self.font_path(font_name), size)
+        font = self.fonts.get(key)
+        if font is None:
+            font = pygame.font.Font(key[0], size)
+            self.fonts[key] = font
+        return font
+    
+    def render(self, text, size, color, antialias=True, font_name=None):
+        """Superfície do texto, renderizada só na primeira vez"""
+        key = (text, self.font_path(font_name), size, tuple(color), antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+        
+        self.misses += 1
+        surface = self.get_font(size, font_name).render(text, antialias, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_surfaces:
+            self.surfaces.popitem(last=False)
+        return surface
+    
+    def clear(self):
+        """Descarta fontes e textos (ex.: depois de trocar FONTS_PATH)"""
+        self.fonts.clear()
+        self.font_paths.clear()
+        self.surfaces.clear()
+    
+    def hit_rate(self):
+        """Fração de textos servidos pelo cache"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+    
+    def get_stats(self):
+        """Estatísticas de uso"""
+        return {
+            'fonts': len(self.fonts),
+            'surfaces': len(self.surfaces),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hit_rate()
+        }
+
+
+# Instância global (a renderização acontece só na thread principal)
+text_cache = TextCache()
+
+def get_font(size, font_name=None):
+    """Fonte compartilhada de um tamanho (sem criar Font a cada quadro)"""
+    return text_cache.get_font(size, font_name)
+
+def render_text(text, size, color, antialias=True, font_name=None):
+    """Texto renderizado pelo cache (não altere a superfície devolvida)"""
+    return text_cache.render(str(text), size, color, antialias, font_name)
+
 def draw_text(surface, text, x, y, size=24, color=COLORS['WHITE'], center=False, font_name=None):
     """Desenha texto na tela (responsivo)"""
     # Usa tamanho responsivo
     responsive_size = get_responsive_font_size(size)
     
-    if font_name and os.path.exists(os.path.join(FONTS_PATH, font_name)):
-        font = pygame.font.Font(os.path.join(FONTS_PATH, font_name), responsive_size)
-    else:
-        font = pygame.font.Font(None, responsive_size)
-    
-    text_surface = font.render(str(text), True, color)
+    text_surface = render_text(text, responsive_size, color, True, font_name)
     text_rect = text_surface.get_rect()
     
     if center:
@@ -219,17 +297,27 @@ def create_gradient_surface(width, height, start_color, end_color, vertical=True
     
     return surface
 
-def generate_random_position(occupied_positions):
+def generate_random_position(occupied_positions, board_size=BOARD_SIZE, rng=random):
     """Gera uma posição aleatória não ocupada no tabuleiro"""
-    available_positions = []
+    occupied_positions = set(occupied_positions)
+    total_cells = board_size * board_size
     
-    for x in range(BOARD_SIZE):
-        for y in range(BOARD_SIZE):
-            if (x, y) not in occupied_positions:
-                available_positions.append((x, y))
+    # Com o tabuleiro pouco ocupado, sortear e rejeitar é O(1) esperado
+    if len(occupied_positions) < total_cells // 2:
+        while True:
+            pos = (rng.randrange(board_size), rng.randrange(board_size))
+            if pos not in occupied_positions:
+                return pos
+    
+    available_positions = [
+        (x, y)
+        for x in range(board_size)
+        for y in range(board_size)
+        if (x, y) not in occupied_positions
+    ]
     
     if available_positions:
-        return random.choice(available_positions)
+        return rng.choice(available_positions)
     return None
 
 def format_time(seconds):
@@ -241,8 +329,7 @@ def format_time(seconds):
 def show_notification(surface, message, duration=3.0):
     """Mostra notificação temporária na tela"""
     font_size = get_responsive_font_size(20)
-    font = pygame.font.Font(None, font_size)
-    text_surface = font.render(message, True, COLORS['WHITE'])
+    text_surface = render_text(message, font_size, COLORS['WHITE'])
     
     # Posição responsiva no canto superior direito
     scale = get_responsive_scale()
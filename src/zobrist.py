@@ -0,0 +1,171 @@
+# src/zobrist.py - Hash Zobrist de estados e tabela de transposição
+
+import random
+import numpy as np
+from config import *
+
+HASH_MASK = (1 << 64) - 1
+
+# Chaves compartilhadas por (tamanho do tabuleiro, jogadores, peixes para vencer)
+_keys_cache = {}
+
+def get_zobrist_keys(board_size, num_players, winning_fish_count=WINNING_FISH_COUNT):
+    """Chaves Zobrist reaproveitadas entre partidas do mesmo formato"""
+    cache_key = (board_size, num_players, winning_fish_count)
+    keys = _keys_cache.get(cache_key)
+    if keys is None:
+        keys = ZobristKeys(board_size, num_players, winning_fish_count)
+        _keys_cache[cache_key] = keys
+    return keys
+
+
+class ZobristKeys:
+    """Chaves aleatórias de 64 bits para cada componente do estado
+    
+    Os componentes são somados (mod 2^64) em vez de combinados com XOR:
+    peixes e cartas na mão são multiconjuntos, e dois peixes na mesma casa
+    se anulariam com XOR. A soma também é comutativa, então a ordem em que
+    as cartas do turno foram jogadas não muda o hash.
+    """
+    
+    def __init__(self, board_size, num_players, winning_fish_count=WINNING_FISH_COUNT,
+                 seed=0x5EED):
+        rng = random.Random(seed)
+        cells = board_size * board_size
+        vectors = len(MOVEMENT_CARDS)
+        
+        self.board_size = board_size
+        self.vector_index = {vector: i for i, vector in enumerate(MOVEMENT_CARDS)}
+        
+        self.boat = [[rng.getrandbits(64) for _ in range(cells)] for _ in range(num_players)]
+        self.fish = np.array([rng.getrandbits(64) for _ in range(cells)], dtype=np.uint64)
+        self.hand = [[rng.getrandbits(64) for _ in range(vectors)] for _ in range(num_players)]
+        self.played = [[rng.getrandbits(64) for _ in range(vectors)] for _ in range(num_players)]
+        self.score = [[rng.getrandbits(64) for _ in range(winning_fish_count + 8)]
+                      for _ in range(num_players)]
+        self.turn = [rng.getrandbits(64) for _ in range(256)]
+    
+    def cell(self, x, y):
+        """Índice da célula"""
+        return x * self.board_size + y
+    
+    def fish_hash(self, store):
+        """Componente dos peixes vivos"""
+        ids = store.alive_ids()
+        if not ids.size:
+            return 0
+        cells = store.x[ids] * self.board_size + store.y[ids]
+        return int(self.fish[cells].sum(dtype=np.uint64))
+    
+    def score_key(self, player_id, fish_collected):
+        """Chave da pontuação de um jogador"""
+        keys = self.score[player_id]
+        return keys[min(fish_collected, len(keys) - 1)]
+    
+    def position_hash(self, state):
+        """Barcos e peixes apenas (o que as avaliações da IA enxergam)"""
+        h = self.fish_hash(state.fish)
+        for player in state.players:
+            if player.boat:
+                h += self.boat[player.id][self.cell(player.boat.x, player.boat.y)]
+        return h & HASH_MASK
+    
+    def full_hash(self, state):
+        """Hash completo: barcos, peixes, mãos, cartas jogadas, placar e turno"""
+        h = self.position_hash(state)
+        for player in state.players:
+            for card in player.hand.cards:
+                h += self.hand[player.id][self.vector_index[card.vector]]
+            h += self.score_key(player.id, player.fish_collected)
+        for player_id, card in state.cards_played.items():
+            h += self.played[player_id][self.vector_index[card.vector]]
+        h += self.turn[state.turn_number % len(self.turn)]
+        return h & HASH_MASK
+
+
+class TranspositionTable:
+    """Tabela de transposição limitada, indexada pelos bits baixos do hash
+    
+    Substituição: uma entrada de um turno anterior (geração antiga) sempre
+    pode ser sobrescrita; dentro do mesmo turno, só por outra busca de
+    profundidade maior ou igual.
+    """
+    
+    def __init__(self, size_bits=16):
+        self.size = 1 << size_bits
+        self.mask = self.size - 1
+        self.keys = [None] * self.size
+        self.values = [None] * self.size
+        self.depths = [0] * self.size
+        self.generations = [0] * self.size
+        self.generation = 0
+        
+        # Estatísticas
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.overwrites = 0
+        self.rejected = 0
+    
+    def new_generation(self):
+        """Marca o início de um novo turno (entradas antigas viram substituíveis)"""
+        self.generation += 1
+    
+    def probe(self, key, min_depth=0):
+        """Retorna o valor guardado para key, ou None"""
+        slot = key & self.mask
+        if self.keys[slot] == key and self.depths[slot] >= min_depth:
+            self.hits += 1
+            return self.values[slot]
+        self.misses += 1
+        return None
+    
+    def store(self, key, value, depth=0):
+        """Guarda um valor respeitando a política de substituição"""
+        slot = key & self.mask
+        stored_key = self.keys[slot]
+        
+        if stored_key is not None and stored_key != key:
+            if self.generations[slot] == self.generation and self.depths[slot] > depth:
+                self.rejected += 1
+                return False
+            self.overwrites += 1
+        
+        self.keys[slot] = key
+        self.values[slot] = value
+        self.depths[slot] = depth
+        self.generations[slot] = self.generation
+        self.stores += 1
+        return True
+    
+    def clear(self):
+        """Esvazia a tabela"""
+        self.keys = [None] * self.size
+        self.values = [None] * self.size
+        self.depths = [0] * self.size
+        self.generations = [0] * self.size
+    
+    def hit_rate(self):
+        """Fração de consultas respondidas pela tabela"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+    
+    def get_stats(self):
+        """Estatísticas de uso"""
+        return {
+            'size': self.size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hit_rate(),
+            'stores': self.stores,
+            'overwrites': self.overwrites,
+            'rejected': self.rejected
+        }
+
+
+def derive_key(base, *parts):
+    """Combina um hash de estado com dados extras (ex.: carta avaliada)"""
+    h = base
+    for part in parts:
+        h = (h * 0x100000001B3 ^ hash(part)) & HASH_MASK
+    return h
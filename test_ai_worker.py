@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Testes da thread de decisões da IA (AIWorker)
+Execute com: python -m pytest test_ai_worker.py
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(__file__))
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+from src.game_context import GameContext
+from src.ai import AIController
+from src.ai_worker import AIWorker, AIRequest
+from src.route_planner import RoutePlanner
+from src.simulation import play_ai_turn
+
+def new_match(difficulty, seed):
+    """Partida sem janela com controladores de "interface" para cada assento"""
+    context = GameContext(2, ai_players=[True, True], headless=True, seed=seed)
+    state = context.state
+    state.enable_hashing()
+    controllers = [AIController(player, difficulty, None, 16, state.random.ai(player.id))
+                   for player in state.players]
+    state.setup_game()
+    return state, controllers
+
+def play_with_worker(state, controllers, worker, max_turns):
+    """Movimentos decididos pela thread (chamada direta), o resto como no simulador"""
+    moves = 0
+    while not state.is_game_over() and state.turn_number < max_turns:
+        if state.phase == 'movement':
+            player = state.current_player
+            request = AIRequest(controllers[player.id], state.snapshot(), player.id, 'move', seed=11)
+            move = worker.decide(request)
+            moves += 1
+            if not (move and state.move_boat(player.id, move[0], move[1])):
+                state.skip_movement(player.id)
+        elif not play_ai_turn(state, controllers):
+            break
+        state.events.clear()
+    return moves
+
+def test_worker_keeps_route_plans_between_requests(monkeypatch):
+    plans = []
+    original = RoutePlanner.plan
+    
+    def counting_plan(self, *args, **kwargs):
+        plans.append(1)
+        return original(self, *args, **kwargs)
+    
+    monkeypatch.setattr(RoutePlanner, 'plan', counting_plan)
+    state, controllers = new_match('DIFICIL', 3)
+    worker = AIWorker()
+    moves = play_with_worker(state, controllers, worker, 12)
+    
+    assert moves > 4
+    assert len(plans) < moves
+    
+    # Um controlador da thread por assento; os da interface não são tocados
+    seat_controllers = {player_id: entry[1] for player_id, entry in worker.controllers.items()}
+    assert all(seat_controllers[i] is not controllers[i] for i in seat_controllers)
+    assert all(c.movement_ai.route_plan is None for c in controllers)
+
+def test_worker_decisions_are_reproducible():
+    results = []
+    for _ in range(2):
+        state, controllers = new_match('MEDIO', 5)
+        play_with_worker(state, controllers, AIWorker(), 10)
+        results.append((state.turn_number, [p.fish_collected for p in state.players],
+                        [(p.boat.x, p.boat.y) for p in state.players]))
+    assert results[0] == results[1]
+
+def card_phase_state(seed, num_players=4):
+    """Estado no início da fase de cartas, com todos os assentos por decidir"""
+    context = GameContext(num_players, ai_players=[True] * num_players, headless=True, seed=seed)
+    state = context.state
+    state.enable_hashing()
+    controllers = {player.id: AIController(player, 'DIFICIL', None, 24,
+                                           state.random.ai(player.id))
+                   for player in state.players}
+    state.setup_game()
+    while state.phase != 'play_cards':
+        play_ai_turn(state, controllers)
+    return state, controllers
+
+def test_executor_and_sequential_batches_agree():
+    from concurrent.futures import ProcessPoolExecutor
+    import multiprocessing
+    
+    with ProcessPoolExecutor(2, mp_context=multiprocessing.get_context('spawn')) as pool:
+        for seed in (1, 2):
+            state, controllers = card_phase_state(seed)
+            sequential = AIController.choose_cards_batch(controllers, state, None, seed)
+            parallel = AIController.choose_cards_batch(controllers, state, pool, seed)
+            assert {i: c.vector for i, c in parallel.items()} == \
+                   {i: c.vector for i, c in sequential.items()}
+            assert all(parallel[i] in state.players[i].hand.cards for i in parallel)
+
+def test_batch_stops_when_asked(monkeypatch):
+    from src.search_ai import CardSearch
+    rollouts = []
+    original = CardSearch.rollout
+    
+    def counting_rollout(self, vector):
+        rollouts.append(vector)
+        return original(self, vector)
+    
+    monkeypatch.setattr(CardSearch, 'rollout', counting_rollout)
+    state, controllers = card_phase_state(1)
+    for controller in controllers.values():
+        controller.card_ai.search_iterations = None  # só o orçamento de tempo
+    
+    choices = AIController.choose_cards_batch(controllers, state, None, 1, lambda: True)
+    # Cada busca para depois da primeira iteração
+    assert len(rollouts) <= len(controllers)
+    assert set(choices) == set(controllers)
+
+def test_worker_pool_runs_card_batches_and_shuts_down():
+    state, controllers = card_phase_state(2)
+    worker = AIWorker()
+    expected = AIController.choose_cards_batch(controllers, state, None, 5)
+    
+    result = worker.decide(AIRequest(controllers, state.snapshot(), None, 'cards', seed=5))
+    assert worker.pool is not None
+    assert result == {i: card.vector for i, card in expected.items()}
+    
+    worker.shutdown()
+    assert worker.pool is None
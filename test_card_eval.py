@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Testes do kernel vetorizado de avaliação de cartas
+Execute com: python -m pytest test_card_eval.py
+"""
+
+import random
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+import numpy as np
+import pytest
+from config import *
+from src.card_eval import (ALL_VECTORS, OPPONENT_RADIUS, OPPONENT_FISH_RADIUS,
+                           score_card_vectors, rank_card_vectors)
+
+def manhattan(a, b):
+    return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+def scalar_score(vector, boat_pos, fish_positions, other_boat_positions,
+                 board_size=BOARD_SIZE, weights=AI_WEIGHTS,
+                 collection_distance=COLLECTION_DISTANCE):
+    """Heurística carta a carta, como era antes do kernel (referência)"""
+    score = 0
+    if not fish_positions:
+        return score
+    
+    # Peixe mais próximo (empate: o primeiro da lista)
+    closest_pos = min(fish_positions, key=lambda pos: manhattan(boat_pos, pos))
+    closest_dist = manhattan(boat_pos, closest_pos)
+    moved = (closest_pos[0] + vector[0], closest_pos[1] + vector[1])
+    new_dist = manhattan(boat_pos, moved)
+    if new_dist < closest_dist:
+        score += (closest_dist - new_dist) * weights['approach']
+    if new_dist <= collection_distance:
+        score += weights['collect_bonus']
+    if not (0 <= moved[0] < board_size and 0 <= moved[1] < board_size):
+        score -= weights['off_board']
+    
+    for other_pos in other_boat_positions:
+        if manhattan(boat_pos, other_pos) >= OPPONENT_RADIUS:
+            continue
+        for fish_pos in fish_positions:
+            before = manhattan(other_pos, fish_pos)
+            if before < OPPONENT_FISH_RADIUS:
+                shifted = (fish_pos[0] + vector[0], fish_pos[1] + vector[1])
+                if manhattan(other_pos, shifted) < before:
+                    score -= weights['opponent_penalty']
+    return score
+
+def random_case(rng):
+    """Barco, peixes e oponentes aleatórios, agrupados para exercitar os raios"""
+    size = rng.randint(6, BOARD_SIZE)
+    spread = rng.randint(2, size)
+    cx, cy = rng.randrange(size), rng.randrange(size)
+    
+    def near():
+        return (min(max(cx + rng.randint(-spread, spread), 0), size - 1),
+                min(max(cy + rng.randint(-spread, spread), 0), size - 1))
+    
+    boat = near()
+    fish = [near() for _ in range(rng.randint(0, 12))]
+    boats = [near() for _ in range(rng.randint(0, 3))]
+    vectors = [tuple(v) for v in ALL_VECTORS.tolist()]
+    hand = rng.sample(vectors, rng.randint(1, len(vectors)))
+    return size, boat, fish, boats, hand
+
+@pytest.mark.parametrize('seed', range(30))
+def test_kernel_matches_scalar_heuristic(seed):
+    rng = random.Random(seed)
+    for _ in range(100):
+        size, boat, fish, boats, hand = random_case(rng)
+        expected = [scalar_score(v, boat, fish, boats, size) for v in hand]
+        scores = score_card_vectors(hand, boat, fish, boats, size)
+        
+        np.testing.assert_array_equal(scores, expected)
+        assert int(np.argmax(scores)) == expected.index(max(expected))
+
+def test_no_fish_scores_zero():
+    scores = score_card_vectors(ALL_VECTORS, (3, 3), [], [(4, 4)])
+    assert scores.shape == (len(ALL_VECTORS),)
+    assert not scores.any()
+
+def test_rank_is_sorted_and_stable():
+    vectors, scores = rank_card_vectors((5, 5), [(7, 5), (2, 2)], [(6, 6)])
+    assert sorted(vectors) == sorted(tuple(v) for v in ALL_VECTORS.tolist())
+    assert list(scores) == sorted(scores, reverse=True)
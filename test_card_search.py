@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Testes da busca de cartas (CardSearch)
+Execute com: python -m pytest test_card_search.py
+"""
+
+import random
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+import pytest
+from src.engine import GameState
+from src.search_ai import CardSearch
+from src.zobrist import TranspositionTable
+
+class FixedRng:
+    """Gerador que devolve as cartas dos oponentes escolhidas pelo teste"""
+    
+    def __init__(self, sampled):
+        self.sampled = sampled
+    
+    def sample(self, pool, count):
+        return list(self.sampled[:count])
+    
+    def choice(self, options):
+        return options[0]
+
+def new_game(seed, num_players=2):
+    """Partida em movimento com barcos posicionados e hash ligado"""
+    rng = random.Random(seed)
+    state = GameState(num_players, seed=seed)
+    state.setup_game()
+    for _ in range(rng.randint(0, 12)):
+        state.add_fish(rng.randrange(state.board_size), rng.randrange(state.board_size))
+    for player_id in range(num_players):
+        state.place_boat(player_id, *state.random_free_position(rng=rng))
+    state.undo_stack.clear()
+    state.enable_hashing()
+    return state
+
+def test_same_vector_sum_shares_table_entry():
+    state = new_game(1)
+    table = TranspositionTable()
+    
+    # (1, 0) contra (0, 1) e (0, 1) contra (1, 0): mesma deriva, ordens diferentes
+    first = CardSearch(state, 0, 1.0, rng=FixedRng([(0, 1)]), table=table).rollout((1, 0))
+    assert table.hits == 0
+    second = CardSearch(state, 0, 1.0, rng=FixedRng([(1, 0)]), table=table).rollout((0, 1))
+    assert table.hits == 1
+    assert second == first
+    
+    # A entrada guarda o mesmo valor que um rollout sem tabela
+    assert CardSearch(state, 0, 1.0, rng=FixedRng([(1, 0)])).rollout((0, 1)) == first
+
+def test_rollout_leaves_state_untouched():
+    state = new_game(2, 3)
+    before = state.zobrist_hash
+    CardSearch(state, 1, 1.0, rng=random.Random(0), table=TranspositionTable()).rollout((1, 1))
+    assert state.zobrist_hash == before
+    assert state.undo_stack == []
+
+@pytest.mark.parametrize('seed', range(20))
+def test_table_does_not_change_the_search(seed):
+    state = new_game(seed, 2 + seed % 3)
+    plain = CardSearch(state, 0, 10.0, 48, random.Random(seed))
+    cached = CardSearch(state, 0, 10.0, 48, random.Random(seed), table=TranspositionTable())
+    
+    assert plain.run() is cached.run()
+    assert plain.stats == pytest.approx(cached.stats)
+
+class SlowClock:
+    """perf_counter que avança um segundo a cada leitura (máquina lenta)"""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        self.now += 1.0
+        return self.now
+
+def test_iteration_cap_ignores_the_clock(monkeypatch):
+    state = new_game(3)
+    fast = CardSearch(state, 0, 0.01, 40, random.Random(5))
+    fast_card = fast.run()
+    
+    monkeypatch.setattr('src.search_ai.time.perf_counter', SlowClock())
+    slow = CardSearch(state, 0, 0.01, 40, random.Random(5))
+    assert slow.run() is fast_card
+    assert slow.iterations == fast.iterations == 40
+    assert slow.stats == fast.stats
+
+def test_time_budget_still_applies_without_cap(monkeypatch):
+    state = new_game(3)
+    monkeypatch.setattr('src.search_ai.time.perf_counter', SlowClock())
+    search = CardSearch(state, 0, 0.5, rng=random.Random(5))
+    search.run()
+    # Cada carta distinta é tentada uma vez antes de o prazo valer
+    assert search.iterations == len(search.stats)
+
+def test_headless_game_is_reproducible_on_a_slow_machine(monkeypatch):
+    from src.simulation import play_headless_game
+    
+    def summary():
+        result = play_headless_game(2, ['FACIL'] * 2, 30, 32, seed=7)
+        return result['turns'], result['fish'], result['winners']
+    
+    expected = summary()
+    monkeypatch.setattr('src.search_ai.time.perf_counter', SlowClock())
+    assert summary() == expected
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Testes de make/unmake e do hash Zobrist incremental do GameState
+Execute com: python -m pytest test_engine_undo.py
+"""
+
+import random
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+import pytest
+from src.engine import GameState
+
+SEEDS = range(200)
+
+def state_fingerprint(state):
+    """Tudo o que make/unmake altera, em forma comparável"""
+    fish = state.fish
+    players = tuple(
+        (tuple(card.vector for card in p.hand.cards),
+         p.played_card.vector if p.played_card else None,
+         p.has_played_card, p.has_moved, p.fish_collected, p.total_distance_moved,
+         (p.boat.x, p.boat.y, p.boat.moves_remaining, p.boat.fish_collected))
+        for p in state.players
+    )
+    return (
+        players,
+        tuple(sorted((pid, card.vector) for pid, card in state.cards_played.items())),
+        tuple(sorted(state.boat_cells.items())),
+        state.occupancy.bits,
+        fish.x.tobytes(), fish.y.tobytes(), fish.alive.tobytes()
+    )
+
+def new_game(rng, num_players):
+    """Partida com barcos posicionados, peixes extras e hash ligado"""
+    state = GameState(num_players, seed=rng.getrandbits(32))
+    state.setup_game()
+    for _ in range(rng.randint(0, 20)):
+        state.add_fish(rng.randrange(state.board_size), rng.randrange(state.board_size))
+    for player_id in range(num_players):
+        state.place_boat(player_id, *state.random_free_position(rng=rng))
+    state.undo_stack.clear()
+    state.enable_hashing()
+    return state
+
+def play_random_turn(state, rng):
+    """Uma rodada completa com transições reversíveis, conferindo o hash a cada passo"""
+    order = list(range(state.num_players))
+    rng.shuffle(order)
+    for player_id in order:
+        state.make_play_card(player_id, rng.choice(state.players[player_id].hand.cards))
+        assert state.zobrist_hash == state.zobrist.full_hash(state)
+    
+    for player in state.players:
+        moves = state.get_valid_moves(player.id)
+        if moves:
+            state.make_move_boat(player.id, *rng.choice(moves))
+            assert state.zobrist_hash == state.zobrist.full_hash(state)
+    
+    state.make_drift(state.current_vector())
+    assert state.zobrist_hash == state.zobrist.full_hash(state)
+    state.make_collect()
+    assert state.zobrist_hash == state.zobrist.full_hash(state)
+
+@pytest.mark.parametrize('seed', SEEDS)
+def test_undo_to_zero_restores_state_and_hash(seed):
+    rng = random.Random(seed)
+    state = new_game(rng, rng.randint(2, 4))
+    initial_hash = state.zobrist_hash
+    initial = state_fingerprint(state)
+    
+    play_random_turn(state, rng)
+    
+    state.undo_to(0)
+    assert state.zobrist_hash == initial_hash
+    assert state.zobrist.full_hash(state) == initial_hash
+    assert state_fingerprint(state) == initial
+    assert state.undo_stack == []
+
+def test_partial_undo_returns_to_intermediate_state():
+    rng = random.Random(1)
+    state = new_game(rng, 3)
+    for player_id in range(3):
+        state.make_play_card(player_id, state.players[player_id].hand.cards[0])
+    depth = len(state.undo_stack)
+    middle_hash = state.zobrist_hash
+    middle = state_fingerprint(state)
+    
+    state.make_resolve()
+    state.undo_to(depth)
+    assert state.zobrist_hash == middle_hash
+    assert state_fingerprint(state) == middle
+
+def test_hash_does_not_depend_on_card_order():
+    state = GameState(2, seed=3)
+    state.setup_game()
+    state.place_boat(0, 1, 1)
+    state.place_boat(1, 5, 5)
+    state.enable_hashing()
+    first, second = state.players[0].hand.cards[0], state.players[1].hand.cards[0]
+    
+    state.make_play_card(0, first)
+    state.make_play_card(1, second)
+    forward = state.zobrist_hash
+    state.undo_to(0)
+    
+    state.make_play_card(1, second)
+    state.make_play_card(0, first)
+    assert state.zobrist_hash == forward
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Testes dos mapas de probabilidade dos peixes
+Execute com: python -m pytest test_heatmap.py
+"""
+
+import random
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+import numpy as np
+import pytest
+from src.heatmap import HeatmapEngine
+
+def brute_near(fish, distribution, size, collection_distance):
+    """P(algum peixe no alcance) célula a célula (referência)"""
+    near = np.zeros((size, size))
+    for (dx, dy), prob in distribution.items():
+        landed = [(x + dx, y + dy) for x, y in fish
+                  if 0 <= x + dx < size and 0 <= y + dy < size]
+        for cx in range(size):
+            for cy in range(size):
+                if any(abs(cx - x) + abs(cy - y) <= collection_distance for x, y in landed):
+                    near[cx, cy] += prob
+    return near
+
+@pytest.mark.parametrize('seed', range(25))
+def test_near_matches_brute_force(seed):
+    rng = random.Random(seed)
+    size = rng.randint(3, 12)
+    fish = [(rng.randrange(size), rng.randrange(size)) for _ in range(rng.randint(1, 8))]
+    distribution = {(rng.randint(-4, 4), rng.randint(-4, 4)): rng.random() for _ in range(6)}
+    collection_distance = rng.randint(0, 3)
+    
+    heatmap = HeatmapEngine(size, collection_distance).build(fish, distribution)
+    expected = brute_near(fish, distribution, size, collection_distance)
+    np.testing.assert_allclose(heatmap.near, expected)
+
+def test_no_fish_gives_empty_near():
+    heatmap = HeatmapEngine(8).build([], {(0, 0): 1.0})
+    assert not heatmap.near.any()
+
+def test_near_on_large_board_with_many_fish():
+    rng = random.Random(0)
+    size = 100
+    fish = [(rng.randrange(size), rng.randrange(size)) for _ in range(200)]
+    distribution = {(dx, dy): 1 / 49 for dx in range(-3, 4) for dy in range(-3, 4)}
+    
+    near = HeatmapEngine(size).build(fish, distribution).near
+    assert near.shape == (size, size)
+    assert near.max() <= 1 + 1e-9
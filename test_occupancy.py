@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Testes dos destinos de barco no bitboard de ocupação
+Execute com: python -m pytest test_occupancy.py
+"""
+
+import random
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+import pytest
+from src.occupancy import OccupancyGrid, diamond_cells
+
+def scan_moves(occupied, size, x, y, max_distance):
+    """Varredura antiga por dx e dy (referência)"""
+    moves = []
+    for dx in range(-max_distance, max_distance + 1):
+        for dy in range(-max_distance, max_distance + 1):
+            nx, ny = x + dx, y + dy
+            if (dx or dy) and abs(dx) + abs(dy) <= max_distance \
+                    and 0 <= nx < size and 0 <= ny < size and (nx, ny) not in occupied:
+                moves.append((nx, ny))
+    return moves
+
+@pytest.mark.parametrize('seed', range(40))
+def test_valid_moves_match_scan(seed):
+    rng = random.Random(seed)
+    size = rng.randint(2, 24)
+    grid = OccupancyGrid(size)
+    for _ in range(rng.randint(0, size * size // 2)):
+        grid.occupy(rng.randrange(size), rng.randrange(size))
+    
+    for _ in range(50):
+        x, y = rng.randrange(size), rng.randrange(size)
+        # Raios pequenos (losango deslocado) e grandes (segmentos por linha)
+        radius = rng.randint(0, 2 * size)
+        expected = scan_moves(grid.occupied, size, x, y, radius)
+        assert grid.valid_moves(x, y, radius) == expected
+        assert grid.count_moves(x, y, radius) == len(expected)
+
+def test_empty_board_matches_diamond_cells():
+    grid = OccupancyGrid(10)
+    for x, y, radius in [(0, 0, 3), (9, 9, 4), (0, 9, 2), (5, 4, 4), (5, 5, 9)]:
+        assert grid.valid_moves(x, y, radius) == diamond_cells(10, x, y, radius)
+
+def test_outside_start_has_no_moves():
+    grid = OccupancyGrid(8)
+    assert grid.valid_moves(-1, 3, 2) == []
+    assert grid.moves_mask(3, 3, 0) == 0
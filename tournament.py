@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# tournament.py - Escada de classificação entre configurações de IA
+#
+# Exemplos:
+#   python tournament.py --rounds 20 --checkpoint escada.json
+#   python tournament.py --configs pesos.json --mode round-robin --rounds 5
+#
+# O arquivo de configurações é uma lista JSON; cada item é um nome de
+# dificuldade ou um dicionário como
+#   {"name": "agressiva", "base": "DIFICIL", "weights": {"approach": 15}}
+
+import argparse
+import os
+import sys
+import time
+
+# Sem janela: o pygame é importado por alguns módulos de IA
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+from config import AI_DIFFICULTIES
+from src.tournament import Tournament, load_configs, format_standings
+
+def main():
+    parser = argparse.ArgumentParser(description="Torneio de IAs do Caçador dos Mares")
+    parser.add_argument('--configs', default=None,
+                        help="Arquivo JSON de configurações (padrão: as dificuldades)")
+    parser.add_argument('--mode', choices=['swiss', 'round-robin'], default='swiss',
+                        help="Emparelhamento das rodadas")
+    parser.add_argument('-r', '--rounds', type=int, default=10,
+                        help="Total de rodadas (inclui as já gravadas no checkpoint)")
+    parser.add_argument('-g', '--games', type=int, default=2,
+                        help="Partidas por confronto (pares trocam os assentos)")
+    parser.add_argument('--seed', type=int, default=0, help="Semente base")
+    parser.add_argument('--iterations', type=int, default=32,
+                        help="Iterações da busca de cartas (0 = orçamento de tempo da dificuldade)")
+    parser.add_argument('--max-turns', type=int, default=200, help="Limite de turnos")
+    parser.add_argument('-j', '--processes', type=int, default=None,
+                        help="Processos (padrão: todos os núcleos)")
+    parser.add_argument('-c', '--checkpoint', default=None,
+                        help="Arquivo de checkpoint (retoma se existir)")
+    args = parser.parse_args()
+    
+    configs = load_configs(args.configs) if args.configs else sorted(AI_DIFFICULTIES)
+    try:
+        tournament = Tournament(configs, args.mode, args.games, args.seed, args.max_turns,
+                                args.iterations or None, args.checkpoint)
+    except ValueError as e:
+        parser.error(str(e))
+    if tournament.round:
+        print(f"Retomando da rodada {tournament.round + 1}", file=sys.stderr)
+    
+    def on_round(tournament):
+        print(f"\nRodada {tournament.round}/{args.rounds}", file=sys.stderr)
+        print(format_standings(tournament.standings()), file=sys.stderr)
+    
+    start = time.time()
+    standings = tournament.run(args.rounds, args.processes, on_round=on_round)
+    elapsed = time.time() - start
+    
+    print()
+    print(format_standings(standings))
+    print(f"\n{len(tournament.results)} partidas no total; esta execução levou {elapsed:.1f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# tune.py - Ajuste dos pesos da IA por autojogo
+#
+# Exemplo:
+#   python tune.py MEDIO --generations 10 --population 16 --games 32 -o medio_ajustada.json
+#
+# O arquivo de saída serve de entrada para tournament.py --configs; o
+# trecho impresso no final pode ser colado em AI_DIFFICULTIES.
+
+import argparse
+import json
+import os
+import pprint
+import sys
+import time
+
+# Sem janela: o pygame é importado por alguns módulos de IA
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+from config import AI_DIFFICULTIES
+from src.tuner import WeightTuner
+
+def main():
+    parser = argparse.ArgumentParser(description="Ajuste de pesos da IA do Caçador dos Mares")
+    parser.add_argument('base', nargs='?', default='MEDIO', choices=sorted(AI_DIFFICULTIES),
+                        help="Dificuldade de partida (também é a referência)")
+    parser.add_argument('--generations', type=int, default=10, help="Gerações")
+    parser.add_argument('--population', type=int, default=16, help="Candidatos por geração")
+    parser.add_argument('--elite', type=float, default=0.25, help="Fração da elite")
+    parser.add_argument('--games', type=int, default=32,
+                        help="Partidas por candidato contra a referência")
+    parser.add_argument('--stages', type=int, default=4,
+                        help="Estágios de corrida (eliminação antecipada)")
+    parser.add_argument('--seed', type=int, default=0, help="Semente base")
+    parser.add_argument('--iterations', type=int, default=16,
+                        help="Iterações da busca de cartas (0 = orçamento de tempo da dificuldade)")
+    parser.add_argument('--max-turns', type=int, default=200, help="Limite de turnos")
+    parser.add_argument('-j', '--processes', type=int, default=None,
+                        help="Processos (padrão: todos os núcleos)")
+    parser.add_argument('-o', '--output', default=None,
+                        help="Arquivo JSON com a configuração ajustada")
+    args = parser.parse_args()
+    
+    tuner = WeightTuner(args.base, args.population, args.elite, args.games, args.stages,
+                        args.seed, args.max_turns, args.iterations or None)
+    
+    def on_generation(summary):
+        print(f"Geração {summary['generation'] + 1}/{args.generations}: "
+              f"melhor {summary['best_score']:.3f}, média {summary['mean_score']:.3f}, "
+              f"{summary['survivors']}/{args.population} até o fim", file=sys.stderr)
+        print(f"  pesos médios: {summary['mean']}", file=sys.stderr)
+    
+    start = time.time()
+    preset = tuner.run(args.generations, args.processes, on_generation=on_generation)
+    elapsed = time.time() - start
+    
+    name = f"{args.base}_AJUSTADA"
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump([args.base, {'name': name, 'base': args.base, 'weights': preset['weights']}],
+                      f, indent=2)
+    
+    print(f"\nMelhor candidato isolado: {tuner.best[1]} ({tuner.best[0]:.3f})")
+    print(f"\nPreset para AI_DIFFICULTIES ({elapsed:.1f}s):")
+    print(f"'{name}': {pprint.pformat(preset, sort_dicts=False)}")
+
+if __name__ == "__main__":
+    main()